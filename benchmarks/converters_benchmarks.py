@@ -0,0 +1,40 @@
+import pytest
+
+from mutwo import clock_converters
+
+from benchmarks import workloads
+
+
+@pytest.mark.parametrize("event_count", (10, 50, 200))
+def test_modal_0_sequential_event_to_modal_1_sequential_event(benchmark, event_count):
+    modal_0_sequential_event = workloads.make_modal_0_sequential_event(event_count)
+    converter = clock_converters.Modal0SequentialEventToModal1SequentialEvent()
+    assert benchmark(converter.convert, modal_0_sequential_event)
+
+
+@pytest.mark.parametrize("tile_repetition", (False, True))
+@pytest.mark.parametrize("repetition_count", (1, 10, 30))
+def test_clock_to_simultaneous_event(benchmark, repetition_count, tile_repetition):
+    clock = workloads.make_clock(50)
+    converter = clock_converters.ClockToSimultaneousEvent(
+        tile_repetition=tile_repetition
+    )
+    assert benchmark.pedantic(
+        converter.convert, args=(clock, repetition_count), rounds=3, iterations=1
+    )
+
+
+@pytest.mark.parametrize("event_count", (10, 40))
+def test_clock_to_abjad_score(benchmark, event_count):
+    tag_tuple = ("violin", "cello")
+    clock = workloads.make_clock(event_count, tag_tuple)
+    converter = clock_converters.ClockToAbjadScore(
+        {
+            tag: clock_converters.EventPlacementToAbjadStaffGroup()
+            for tag in tag_tuple
+        }
+    )
+    abjad_score = benchmark.pedantic(
+        converter.convert, args=(clock, tag_tuple), rounds=3, iterations=1
+    )
+    assert abjad_score
@@ -0,0 +1,29 @@
+import pytest
+
+from benchmarks import workloads
+
+
+@pytest.mark.parametrize("limit", (2, 3, 4, 5))
+def test_context_free_grammar_resolve(benchmark, limit):
+    context_free_grammar, symt_tuple = workloads.make_context_free_grammar()
+    tree = benchmark(context_free_grammar.resolve, symt_tuple[-1], limit)
+    assert tree.nodes
+
+
+@pytest.mark.parametrize("limit", (3, 5))
+def test_tree_symt_to_n(benchmark, limit):
+    context_free_grammar, symt_tuple = workloads.make_context_free_grammar()
+    tree = context_free_grammar.resolve(symt_tuple[-1], limit)
+    # Warm up cached properties: we only want to measure the lookup.
+    tree.symt_to_n(symt_tuple[-1])
+    assert benchmark(tree.symt_to_n, symt_tuple[-1])
+
+
+@pytest.mark.parametrize(
+    "depth,width", ((8, 1), (4, 3), (2, 12)), ids=("deep", "balanced", "wide")
+)
+def test_clock_layer_pop_event(benchmark, depth, width):
+    clock_tree = workloads.make_clock_tree(depth, width)
+    clock_layer = clock_tree[clock_tree.root].data
+    clock_event, _ = benchmark(clock_layer.pop_event)
+    assert clock_event
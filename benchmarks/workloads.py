@@ -0,0 +1,208 @@
+"""Synthetic workloads for the benchmark suite.
+
+All generators are deterministic, so that benchmark runs can be compared
+against the stored baselines.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import functools
+import random
+
+import ranges
+
+from mutwo import clock_converters
+from mutwo import clock_events
+from mutwo import clock_generators
+from mutwo import clock_interfaces
+from mutwo import core_events
+from mutwo import core_parameters
+from mutwo import music_events
+from mutwo import music_parameters
+from mutwo import timeline_interfaces
+
+
+@dataclasses.dataclass(frozen=True)
+class Entry(object):
+    """Terminal entry for the benchmark grammar."""
+
+    duration: float
+
+    @functools.cached_property
+    def duration_range(self) -> ranges.Range:
+        d = core_parameters.DirectDuration(self.duration)
+        return ranges.Range(d, d)
+
+    def __call__(self) -> clock_events.ClockEvent:
+        return clock_events.ClockEvent(
+            [
+                core_events.TaggedSequentialEvent(
+                    [music_events.NoteLike("c", self.duration)], tag="0"
+                )
+            ]
+        )
+
+
+def make_context_free_grammar(
+    entry_count: int = 4,
+) -> tuple[clock_generators.ContextFreeGrammar, tuple[clock_generators.SymT, ...]]:
+    """Make grammar in which each non-terminal can be expanded by two rules."""
+
+    r = random.Random(10)
+    nt_tuple = tuple(clock_generators.NT(Entry(i + 1)) for i in range(entry_count))
+    symt_tuple = tuple(
+        clock_generators.SymT(
+            str(i),
+            ranges.Range(
+                core_parameters.DirectDuration(i * 4),
+                core_parameters.DirectDuration(i * 4 + 6),
+            ),
+        )
+        for i in range(entry_count)
+    )
+    rule_list = [
+        clock_generators.R(symt, (nt,), weight=1)
+        for symt, nt in zip(symt_tuple, nt_tuple)
+    ]
+    for nt in nt_tuple:
+        for _ in range(2):
+            rule_list.append(
+                clock_generators.R(
+                    nt, (nt, r.choice(nt_tuple)), weight=r.uniform(0.5, 1)
+                )
+            )
+    return clock_generators.ContextFreeGrammar(rule_list), symt_tuple
+
+
+def make_clock_tree(depth: int, width: int) -> clock_generators.ClockTree:
+    """Make a clock tree where each layer has `width` children."""
+
+    clock_tree = clock_generators.ClockTree()
+    node_count = 0
+
+    def create_layer(parent_identifier, level):
+        nonlocal node_count
+        identifier = f"layer-{node_count}"
+        node_count += 1
+        clock_tree.create_layer(
+            identifier,
+            parent_identifier,
+            clock_generators.PickSampleByChoice(
+                tuple(
+                    music_events.NoteLike("c", duration)
+                    for duration in (0.25, 0.5, 1)
+                ),
+                random_seed=node_count,
+            ),
+            clock_generators.PickSampleByChoice(random_seed=node_count),
+            event_count_range=ranges.Range(2, 4),
+        )
+        if level < depth:
+            for _ in range(width):
+                create_layer(identifier, level + 1)
+
+    create_layer(None, 1)
+    return clock_tree
+
+
+def make_scale() -> music_parameters.Scale:
+    return music_parameters.Scale(
+        music_parameters.WesternPitch("c"),
+        music_parameters.RepeatingScaleFamily(
+            [
+                music_parameters.WesternPitchInterval(interval)
+                for interval in "p1 m3 p4 p5 M7".split(" ")
+            ],
+            repetition_interval=music_parameters.WesternPitchInterval("p8"),
+        ),
+    )
+
+
+class ModalEvent0ToClockTree(clock_converters.ModalEvent0ToClockTree):
+    def convert(self, _: clock_events.ModalEvent0) -> clock_generators.ClockTree:
+        return make_clock_tree(2, 2)
+
+
+def make_modal_0_sequential_event(
+    event_count: int, rest_frequency: int = 5
+) -> core_events.SequentialEvent:
+    """Make modal sequence where clock trees have already been applied."""
+
+    scale = make_scale()
+    r = random.Random(100)
+    scale_position_list = [(r.randint(0, 4), r.randint(-1, 1))]
+    sequential_event = core_events.SequentialEvent([])
+    for index in range(event_count):
+        if rest_frequency and index % rest_frequency == rest_frequency - 1:
+            sequential_event.append(core_events.SimpleEvent(r.choice((2, 3))))
+            continue
+        scale_position_list.append((r.randint(0, 4), r.randint(-1, 1)))
+        sequential_event.append(
+            clock_events.ModalEvent0(
+                scale.scale_position_to_pitch(scale_position_list[-2]),
+                scale.scale_position_to_pitch(scale_position_list[-1]),
+                scale,
+            )
+        )
+    return clock_converters.ApplyClockTreeOnModalEvent0(
+        ModalEvent0ToClockTree()
+    ).convert(sequential_event)
+
+
+def make_clock_line(
+    event_count: int, tag_tuple: tuple[str, ...] = ("violin", "cello")
+) -> clock_interfaces.ClockLine:
+    """Make clock line with one event placement per tag every four beats."""
+
+    r = random.Random(1)
+    clock_event = clock_events.ClockEvent(
+        [
+            core_events.SequentialEvent(
+                [
+                    music_events.NoteLike(r.choice("cde"), r.choice((0.5, 1, 1.5)))
+                    for _ in range(event_count)
+                ]
+            )
+        ]
+    )
+    duration = clock_event.duration
+    event_placement_list = []
+    for tag_index, tag in enumerate(tag_tuple):
+        start = tag_index
+        while start + 2 < duration:
+            event_placement_list.append(
+                timeline_interfaces.EventPlacement(
+                    core_events.SimultaneousEvent(
+                        [
+                            core_events.TaggedSimultaneousEvent(
+                                [
+                                    core_events.SequentialEvent(
+                                        [
+                                            music_events.NoteLike(
+                                                r.choice("fga"), r.choice((0.5, 1))
+                                            )
+                                            for _ in range(3)
+                                        ]
+                                    )
+                                ],
+                                tag=tag,
+                            )
+                        ]
+                    ),
+                    start,
+                    start + 2,
+                )
+            )
+            start += 4
+    return clock_interfaces.ClockLine(clock_event, event_placement_list)
+
+
+def make_clock(
+    event_count: int, tag_tuple: tuple[str, ...] = ("violin", "cello")
+) -> clock_interfaces.Clock:
+    return clock_interfaces.Clock(
+        make_clock_line(event_count, tag_tuple),
+        make_clock_line(event_count // 4, tag_tuple),
+        make_clock_line(event_count // 4, tag_tuple),
+    )
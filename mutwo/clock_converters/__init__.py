@@ -1,12 +1,10 @@
 from . import configurations
 
-from .abjad import *
 from .clocks import *
 from .clock_chomsky import *
 from .clock_trees import *
 from .modal import *
 
-from . import abjad
 from . import clocks
 from . import clock_chomsky
 from . import clock_trees
@@ -14,7 +12,39 @@ from . import modal
 
 from mutwo import core_utilities
 
-__all__ = core_utilities.get_all(abjad, clocks, clock_trees, modal, clock_chomsky)
+
+# Notation converters depend on 'abjad' and 'jinja2' which are slow to
+# import. They are only loaded when they are accessed for the first time.
+# Names need to be equal to 'abjad.__all__'.
+_ABJAD_NAME_TUPLE = (
+    "EventPlacementToAbjadStaffGroup",
+    "ClockEventToAbjadStaffGroup",
+    "ClockToAbjadScore",
+    "AbjadScoreToAbjadScoreBlock",
+    "AbjadScoreBlockTupleToLilyPondFile",
+    "show_barline",
+    "override_barline",
+)
+
+__all__ = _ABJAD_NAME_TUPLE + core_utilities.get_all(
+    clocks, clock_trees, modal, clock_chomsky
+)
+
+
+def __getattr__(name: str):
+    if name in _ABJAD_NAME_TUPLE:
+        import importlib
+
+        from mutwo import clock_utilities
+
+        abjad = importlib.import_module(".abjad", __name__)
+        globals().update({name_: getattr(abjad, name_) for name_ in abjad.__all__})
+        # Force flat structure
+        globals().pop("abjad", None)
+        clock_utilities.Profiler.add_module(abjad)
+        return globals()[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 # Force flat structure
-del abjad, core_utilities, clocks, clock_trees, modal, clock_chomsky
+del core_utilities, clocks, clock_trees, modal, clock_chomsky
@@ -3,13 +3,25 @@
 See abjad_notes.txt for more information regarding internal structure.
 """
 
+import concurrent.futures
+import copy
+import functools
+import hashlib
+import importlib.metadata
+import logging
+import multiprocessing
+import numbers
 import os
+import pickle
+import types
 import typing
 import warnings
+import weakref
 
 import abjad
 import quicktions as fractions
 import jinja2
+import ranges
 
 from mutwo import abjad_converters
 from mutwo import clock_converters
@@ -49,6 +61,25 @@ class EventPlacementToAbjadStaffGroup(core_converters.abc.Converter):
     """Converts each tagged event into one :class:`abjad.StaffGroup`
 
     So each instrument has its own `abjad.StaffGroup`.
+
+    :param use_cache: If set to ``True``, the converter remembers the
+        :class:`abjad.StaffGroup` of each converted event placement. Any
+        later event placement with equal event content, equal real
+        duration and equal tag independent settings gets a deep copy of
+        the cached staff group with renamed staves instead of running
+        the quantizer again. The settings of
+        ``complex_event_to_abjad_container`` and the installed versions
+        of ``abjad`` and of the mutwo packages are part of the
+        fingerprint, so converters with different settings or versions
+        never share a cached staff group. Default to ``False``.
+    :type use_cache: bool
+    :param cache_directory_path: If set and if ``use_cache`` is ``True``,
+        cached staff groups are also pickled to this directory, so that
+        they can be reused across runs. Cached staff groups are loaded
+        with :func:`pickle.load`, which can execute arbitrary code, so
+        only use directories which can't be written by untrusted users.
+        Default to ``None``.
+    :type cache_directory_path: typing.Optional[str]
     """
 
     def __init__(
@@ -60,6 +91,8 @@ class EventPlacementToAbjadStaffGroup(core_converters.abc.Converter):
         staff_lilypond_type: str = "Staff",
         placement_mode: typing.Literal["fixed", "floating"] = "fixed",
         max_denominator: int = 100000,
+        use_cache: bool = False,
+        cache_directory_path: typing.Optional[str] = None,
     ):
 
         if complex_event_to_abjad_container is None:
@@ -71,6 +104,58 @@ class EventPlacementToAbjadStaffGroup(core_converters.abc.Converter):
         self._staff_lilypond_type = staff_lilypond_type
         self._placement_mode = placement_mode
         self._max_denominator = max_denominator
+        self._use_cache = use_cache
+        self._cache_directory_path = cache_directory_path
+        self._fingerprint_to_abjad_staff_group: dict[str, abjad.StaffGroup] = {}
+        self._tag_to_rest_abjad_staff_name_tuple: dict[str, tuple[str, ...]] = {}
+        self._scale_durations_to_rest_lilypond_literal: dict[
+            str, abjad.LilyPondLiteral
+        ] = {}
+        self._complex_event_to_abjad_container_fingerprint = (
+            _get_converter_fingerprint(complex_event_to_abjad_container)
+            if use_cache
+            else None
+        )
+        self._version_tuple = _get_version_tuple() if use_cache else None
+        if use_cache and cache_directory_path is not None:
+            os.makedirs(cache_directory_path, exist_ok=True)
+
+    def _get_rest_abjad_staff_name_tuple(self, tag: str) -> tuple[str, ...]:
+        try:
+            return self._tag_to_rest_abjad_staff_name_tuple[tag]
+        except KeyError:
+            abjad_staff_name_tuple = tuple(
+                self._get_abjad_staff_name(tag, abjad_staff_index)
+                for abjad_staff_index in range(self._staff_count)
+            )
+            self._tag_to_rest_abjad_staff_name_tuple[tag] = abjad_staff_name_tuple
+            return abjad_staff_name_tuple
+
+    def _get_rest_lilypond_literal(self, scale_durations: str) -> abjad.LilyPondLiteral:
+        try:
+            return self._scale_durations_to_rest_lilypond_literal[scale_durations]
+        except KeyError:
+            pass
+        match self._placement_mode:
+            case "fixed":
+                content = (
+                    r"\stopStaff "
+                    r"\override Staff.StaffSymbol.line-count = #0 "
+                    r"\startStaff "
+                    r"\omit Staff.Clef \omit Staff.NoteHead "
+                    r"\omit Staff.BarLine "
+                )
+            case "floating":
+                content = r"\omit Staff.Clef " "\n" r"\stopStaff "
+            case _:
+                raise NotImplementedError(self._placement_mode)
+        lilypond_literal = abjad.LilyPondLiteral(
+            f"{content}\n{scale_durations}", site="before"
+        )
+        self._scale_durations_to_rest_lilypond_literal[scale_durations] = (
+            lilypond_literal
+        )
+        return lilypond_literal
 
     def _convert_rest(
         self,
@@ -78,38 +163,117 @@ class EventPlacementToAbjadStaffGroup(core_converters.abc.Converter):
         written_duration: fractions.Fraction,
         scale_durations: str,
     ) -> abjad.StaffGroup:
-        staff_group = abjad.StaffGroup([], name=tag)
-        for abjad_staff_index in range(self._staff_count):
+        # Gapless event placements lead to many rests, so we only create
+        # their staff names and their (immutable) literals once. Passing
+        # all staves at once to the staff group is cheaper than appending
+        # them one by one.
+        lilypond_literal = self._get_rest_lilypond_literal(scale_durations)
+        abjad_staff_list = []
+        for abjad_staff_name in self._get_rest_abjad_staff_name_tuple(tag):
             skip = abjad.Skip(written_duration)
-            match self._placement_mode:
-                case "fixed":
-                    content = (
-                        r"\stopStaff "
-                        r"\override Staff.StaffSymbol.line-count = #0 "
-                        r"\startStaff "
-                        r"\omit Staff.Clef \omit Staff.NoteHead "
-                        r"\omit Staff.BarLine "
-                    )
-                case "floating":
-                    content = r"\omit Staff.Clef " "\n" r"\stopStaff "
-                case _:
-                    raise NotImplementedError(self.mode)
-            content = f"{content}\n{scale_durations}"
-            abjad.attach(
-                abjad.LilyPondLiteral(content, site="before"),
-                skip,
-            )
-            staff = abjad.Staff(
-                [skip],
-                name=self._get_abjad_staff_name(tag, abjad_staff_index),
-                lilypond_type=self._staff_lilypond_type,
+            abjad.attach(lilypond_literal, skip)
+            abjad_staff_list.append(
+                abjad.Staff(
+                    [skip],
+                    name=abjad_staff_name,
+                    lilypond_type=self._staff_lilypond_type,
+                )
             )
-            staff_group.append(staff)
-        return staff_group
+        return abjad.StaffGroup(abjad_staff_list, name=tag)
 
     def _get_abjad_staff_name(self, tag: str, index: int) -> str:
         return f"staff-{tag}-{index}"
 
+    def _check_staff_count(self, abjad_staff_group: abjad.StaffGroup, tag: str):
+        if (real_staff_count := len(abjad_staff_group)) != self._staff_count:
+            warnings.warn(
+                clock_utilities.BadStaffCountWarning(
+                    real_staff_count, self._staff_count, tag
+                )
+            )
+
+    def _rename_abjad_staff_group(self, abjad_staff_group: abjad.StaffGroup, tag: str):
+        abjad_staff_group.name = tag
+        for abjad_staff_index, abjad_staff in enumerate(abjad_staff_group):
+            abjad_staff.name = self._get_abjad_staff_name(tag, abjad_staff_index)
+            for abjad_voice_index, abjad_voice in enumerate(abjad_staff):
+                if isinstance(abjad_voice, abjad.Voice):
+                    abjad_voice.name = f"{abjad_staff.name}-{abjad_voice_index}"
+
+    def _get_fingerprint(
+        self, event_placement_to_convert: timeline_interfaces.EventPlacement
+    ) -> str:
+        simultaneous_event = event_placement_to_convert.event
+        written_duration = simultaneous_event.duration.duration
+        # The tag is excluded, because staves are renamed after
+        # copying. Therefore equal events of different tags share
+        # the same cached staff group.
+        if written_duration == 0:
+            content = None
+        else:
+            content = tuple(map(_object_to_fingerprint, simultaneous_event[0]))
+        fingerprint = (
+            content,
+            written_duration,
+            event_placement_to_convert.duration.duration,
+            self._placement_mode,
+            self._staff_count,
+            self._staff_lilypond_type,
+            self._max_denominator,
+            self._complex_event_to_abjad_container_fingerprint,
+            self._version_tuple,
+        )
+        return hashlib.sha256(repr(fingerprint).encode()).hexdigest()
+
+    def _get_cache_file_path(self, fingerprint: str) -> str:
+        return os.path.join(self._cache_directory_path, f"{fingerprint}.pickle")
+
+    def _load_abjad_staff_group(
+        self, fingerprint: str
+    ) -> typing.Optional[abjad.StaffGroup]:
+        if self._cache_directory_path is None:
+            return None
+        try:
+            with open(self._get_cache_file_path(fingerprint), "rb") as cache_file:
+                return pickle.load(cache_file)
+        except (OSError, EOFError, pickle.UnpicklingError):
+            return None
+
+    def _dump_abjad_staff_group(
+        self, fingerprint: str, abjad_staff_group: abjad.StaffGroup
+    ):
+        if self._cache_directory_path is None:
+            return
+        cache_file_path = self._get_cache_file_path(fingerprint)
+        # Write to a temporary file first, so that concurrent
+        # processes never read a half written file.
+        temporary_cache_file_path = f"{cache_file_path}.{os.getpid()}"
+        with open(temporary_cache_file_path, "wb") as cache_file:
+            pickle.dump(abjad_staff_group, cache_file)
+        os.replace(temporary_cache_file_path, cache_file_path)
+
+    def _get_cached_abjad_staff_group(
+        self, fingerprint: str
+    ) -> typing.Optional[abjad.StaffGroup]:
+        try:
+            return self._fingerprint_to_abjad_staff_group[fingerprint]
+        except KeyError:
+            if (
+                abjad_staff_group := self._load_abjad_staff_group(fingerprint)
+            ) is not None:
+                self._fingerprint_to_abjad_staff_group[fingerprint] = abjad_staff_group
+            return abjad_staff_group
+
+    def _cache_abjad_staff_group(
+        self, fingerprint: str, abjad_staff_group: abjad.StaffGroup
+    ):
+        # The returned staff group will be added to a score,
+        # so the cache needs to keep its own copy.
+        self._fingerprint_to_abjad_staff_group[fingerprint] = copy.deepcopy(
+            abjad_staff_group
+        )
+        self._dump_abjad_staff_group(fingerprint, abjad_staff_group)
+
     def _convert_event(
         self,
         scale_durations: str,
@@ -125,18 +289,17 @@ class EventPlacementToAbjadStaffGroup(core_converters.abc.Converter):
         time_signature = abjad.TimeSignature(
             (int(durationf.numerator), int(durationf.denominator))
         )
-        for sequential_event in event_to_convert:
+        # Time signatures are attached to copies, so that the converted
+        # event placement (and therefore its fingerprint) isn't changed.
+        event_to_convert = copy.copy(event_to_convert)
+        for index, sequential_event in enumerate(event_to_convert):
+            sequential_event = event_to_convert[index] = copy.copy(sequential_event)
             sequential_event.time_signature_tuple = (time_signature,)
         abjad_staff_group = self._complex_event_to_abjad_container.convert(
             event_to_convert
         )
         tag = event_to_convert.tag
-        if (real_staff_count := len(abjad_staff_group)) != self._staff_count:
-            warnings.warn(
-                clock_utilities.BadStaffCountWarning(
-                    real_staff_count, self._staff_count, tag
-                )
-            )
+        self._check_staff_count(abjad_staff_group, tag)
         for abjad_staff_index, abjad_staff in enumerate(abjad_staff_group):
             abjad_staff.name = self._get_abjad_staff_name(tag, abjad_staff_index)
             abjad_staff.lilypond_type = self._staff_lilypond_type
@@ -193,7 +356,7 @@ class EventPlacementToAbjadStaffGroup(core_converters.abc.Converter):
                 )
         return abjad_staff_group
 
-    def convert(
+    def _convert(
         self,
         event_placement_to_convert: timeline_interfaces.EventPlacement,
     ) -> abjad.StaffGroup:
@@ -217,6 +380,26 @@ class EventPlacementToAbjadStaffGroup(core_converters.abc.Converter):
             return self._convert_rest(tag, written_duration, scale_durations)
         return self._convert_event(scale_durations, simultaneous_event[0])
 
+    def convert(
+        self,
+        event_placement_to_convert: timeline_interfaces.EventPlacement,
+    ) -> abjad.StaffGroup:
+        if not self._use_cache:
+            return self._convert(event_placement_to_convert)
+
+        tag, *_ = event_placement_to_convert.tag_tuple
+        fingerprint = self._get_fingerprint(event_placement_to_convert)
+        if (
+            abjad_staff_group := self._get_cached_abjad_staff_group(fingerprint)
+        ) is None:
+            abjad_staff_group = self._convert(event_placement_to_convert)
+            self._cache_abjad_staff_group(fingerprint, abjad_staff_group)
+            return abjad_staff_group
+        abjad_staff_group = copy.deepcopy(abjad_staff_group)
+        self._check_staff_count(abjad_staff_group, tag)
+        self._rename_abjad_staff_group(abjad_staff_group, tag)
+        return abjad_staff_group
+
 
 class ClockEventToAbjadStaffGroup(core_converters.abc.Converter):
     def __init__(
@@ -295,7 +478,30 @@ class ClockEventToAbjadStaffGroup(core_converters.abc.Converter):
 
 
 class ClockToAbjadScore(core_converters.abc.Converter):
-    """Convert :class:`mutwo.clock_interfaces.Clock` to :class:`abjad.Block`."""
+    """Convert :class:`mutwo.clock_interfaces.Clock` to :class:`abjad.Block`.
+
+    :param process_count: If set to an integer bigger than 1, the event
+        placements are converted to :class:`abjad.StaffGroup` in parallel
+        by the given number of worker processes. All converters and event
+        placements are passed to the workers once by the initializer of
+        the process pool, the tasks are only their indices. If the
+        platform supports the 'fork' start method, the workers are forked
+        and inherit converters and event placements, so that they don't
+        need to be picklable. Otherwise they are pickled and
+        :class:`mutwo.clock_utilities.UnpicklableTaskError` is raised if
+        this isn't possible (most mutwo music objects can't be pickled).
+        Warnings raised by the converters in the workers are emitted
+        again in the main process and staff groups cached by the workers
+        are added to the caches of the converters of the main process.
+        If ``None`` (or 1), all placements are converted serially in the
+        main process. Default to ``None``.
+    :type process_count: typing.Optional[int]
+    :param merge_rests: If set to ``True``, adjacent rest event placements
+        of the same tag are merged into one rest event placement before
+        they are converted. This reduces the number of abjad objects in
+        sparse parts. Default to ``False``.
+    :type merge_rests: bool
+    """
 
     def __init__(
         self,
@@ -316,7 +522,11 @@ class ClockToAbjadScore(core_converters.abc.Converter):
         timeline_to_event_placement_tuple: timeline_converters.TimeLineToEventPlacementTuple = timeline_converters.TimeLineToEventPlacementTuple(),
         event_placement_tuple_to_split_event_placement_dict: timeline_converters.EventPlacementTupleToSplitEventPlacementDict = timeline_converters.EventPlacementTupleToSplitEventPlacementDict(),
         event_placement_tuple_to_gapless_event_placement_tuple: timeline_converters.EventPlacementTupleToGaplessEventPlacementTuple = timeline_converters.EventPlacementTupleToGaplessEventPlacementTuple(),
+        process_count: typing.Optional[int] = None,
+        merge_rests: bool = False,
     ):
+        self._process_count = process_count
+        self._merge_rests = merge_rests
         self._clock_event_to_abjad_staff_group = clock_event_to_abjad_staff_group
         self._tag_to_abjad_staff_group_converter = tag_to_abjad_staff_group_converter
         self._timeline_to_event_placement_tuple = timeline_to_event_placement_tuple
@@ -331,26 +541,47 @@ class ClockToAbjadScore(core_converters.abc.Converter):
         self,
         clock_to_convert: clock_interfaces.Clock,
         abjad_score: abjad.Score,
+        time_range: typing.Optional[ranges.Range] = None,
     ):
-        abjad_container = abjad.Container([])
-        for is_repeating, clock_line in zip(
-            (False, True, False), clock_to_convert.clock_line_tuple
-        ):
-            if clock_line:
-                clock_event = clock_line.clock_event
-                abjad_staff_group = self._clock_event_to_abjad_staff_group.convert(
-                    clock_event, is_repeating
+        if time_range is None:
+            clock_event_and_is_repeating_iterator = (
+                (clock_line.clock_event, is_repeating)
+                for is_repeating, clock_line in zip(
+                    (False, True, False), clock_to_convert.clock_line_tuple
                 )
-                abjad_container.append(abjad_staff_group)
+                if clock_line
+            )
+        else:
+            clock_event_and_is_repeating_iterator = (
+                (
+                    clock_utilities.cut_out_simultaneous_event(
+                        clock_line.clock_event, start, end
+                    ),
+                    # Repetition bar lines only make sense if the
+                    # complete main clock line is notated.
+                    clock_line is clock_to_convert.main_clock_line
+                    and start == 0
+                    and end == clock_line.duration.duration,
+                )
+                for clock_line, _, start, end in (
+                    clock_to_convert.get_clock_line_window_tuple(
+                        time_range.start, time_range.end
+                    )
+                )
+            )
+        abjad_container = abjad.Container([])
+        for clock_event, is_repeating in clock_event_and_is_repeating_iterator:
+            abjad_staff_group = self._clock_event_to_abjad_staff_group.convert(
+                clock_event, is_repeating
+            )
+            abjad_container.append(abjad_staff_group)
         abjad_score.append(abjad_container)
 
-    def _add_event_placements_to_abjad_score(
+    def _get_event_placement_list(
         self,
         clock_to_convert: clock_interfaces.Clock,
         tag_tuple: tuple[Tag, ...],
-        ordered_tag_tuple: tuple[Tag, ...],
-        abjad_score: abjad.Score,
-    ):
+    ) -> list[timeline_interfaces.EventPlacement]:
         event_placement_list: list[timeline_interfaces.EventPlacement] = []
         delay = core_parameters.DirectDuration(0)
         for clock_line in clock_to_convert.clock_line_tuple:
@@ -365,6 +596,63 @@ class ClockToAbjadScore(core_converters.abc.Converter):
                         event_placement.move_by(delay)
                 event_placement_list.extend(clock_line_event_placement_tuple)
                 delay += clock_line.duration
+        return event_placement_list
+
+    def _get_event_placement_list_in_time_range(
+        self,
+        clock_to_convert: clock_interfaces.Clock,
+        tag_tuple: tuple[Tag, ...],
+        time_range: ranges.Range,
+    ) -> list[timeline_interfaces.EventPlacement]:
+        event_placement_list: list[timeline_interfaces.EventPlacement] = []
+        window_start = core_events.configurations.UNKNOWN_OBJECT_TO_DURATION(
+            time_range.start
+        ).duration
+        clock_line_window_tuple = clock_to_convert.get_clock_line_window_tuple(
+            time_range.start, time_range.end
+        )
+        for clock_line, clock_line_start, start, end in clock_line_window_tuple:
+            # Only copy event placements which overlap with the time range.
+            clock_line_event_placement_tuple = (
+                self._timeline_to_event_placement_tuple.convert(
+                    clock_interfaces.ClockLine(
+                        clock_line.clock_event,
+                        clock_line.get_event_placement_tuple_in_range(start, end),
+                    ),
+                    tag_tuple,
+                )
+            )
+            for event_placement in clock_line_event_placement_tuple:
+                _cut_out_event_placement(event_placement, start, end)
+                event_placement.move_by(clock_line_start + start - window_start)
+            event_placement_list.extend(clock_line_event_placement_tuple)
+        return event_placement_list
+
+    def _add_event_placements_to_abjad_score(
+        self,
+        clock_to_convert: clock_interfaces.Clock,
+        tag_tuple: tuple[Tag, ...],
+        ordered_tag_tuple: tuple[Tag, ...],
+        abjad_score: abjad.Score,
+        time_range: typing.Optional[ranges.Range] = None,
+    ):
+        if time_range is None:
+            event_placement_list = self._get_event_placement_list(
+                clock_to_convert, tag_tuple
+            )
+            clock_duration = clock_to_convert.duration
+        else:
+            event_placement_list = self._get_event_placement_list_in_time_range(
+                clock_to_convert, tag_tuple, time_range
+            )
+            clock_duration = core_parameters.DirectDuration(
+                sum(
+                    end - start
+                    for *_, start, end in clock_to_convert.get_clock_line_window_tuple(
+                        time_range.start, time_range.end
+                    )
+                )
+            )
 
         tag_to_event_placement_tuple = (
             self._event_placement_tuple_to_split_event_placement_dict.convert(
@@ -377,7 +665,8 @@ class ClockToAbjadScore(core_converters.abc.Converter):
             if tag not in ordered_tag_list:
                 ordered_tag_list.append(tag)
 
-        clock_duration = clock_to_convert.duration
+        converter_and_event_placement_list = []
+        tag_and_event_placement_count_list = []
         for tag in ordered_tag_list:
             try:
                 event_placement_tuple = tag_to_event_placement_tuple[tag]
@@ -390,6 +679,10 @@ class ClockToAbjadScore(core_converters.abc.Converter):
                     event_placement_tuple, clock_duration
                 )
             )
+            if self._merge_rests:
+                gapless_event_placement_tuple = _merge_rest_event_placements(
+                    gapless_event_placement_tuple
+                )
             try:
                 event_placement_to_abjad_staff_group = (
                     self._tag_to_abjad_staff_group_converter[tag]
@@ -397,30 +690,349 @@ class ClockToAbjadScore(core_converters.abc.Converter):
             except KeyError:
                 warnings.warn(clock_utilities.UndefinedConverterForTagWarning(tag))
             else:
-                abjad_container = abjad.Container([])
-                for event_placement in gapless_event_placement_tuple:
-                    abjad_staff_group = event_placement_to_abjad_staff_group.convert(
-                        event_placement
-                    )
-                    abjad_container.append(abjad_staff_group)
-                abjad_score.append(abjad_container)
+                converter_and_event_placement_list.extend(
+                    (event_placement_to_abjad_staff_group, event_placement)
+                    for event_placement in gapless_event_placement_tuple
+                )
+                tag_and_event_placement_count_list.append(
+                    (tag, len(gapless_event_placement_tuple))
+                )
+
+        abjad_staff_group_iterator = self._convert_event_placements(
+            converter_and_event_placement_list
+        )
+        # Results are returned in submission order, therefore the score
+        # keeps the order of 'ordered_tag_list' in both modes.
+        for _, event_placement_count in tag_and_event_placement_count_list:
+            abjad_container = abjad.Container([])
+            for _ in range(event_placement_count):
+                abjad_container.append(next(abjad_staff_group_iterator))
+            abjad_score.append(abjad_container)
+
+    def _convert_event_placements(
+        self,
+        converter_and_event_placement_list: list[
+            tuple[EventPlacementToAbjadStaffGroup, timeline_interfaces.EventPlacement]
+        ],
+    ) -> typing.Iterator[abjad.StaffGroup]:
+        event_placement_count = len(converter_and_event_placement_list)
+        if (
+            self._process_count is None
+            or self._process_count <= 1
+            or event_placement_count <= 1
+        ):
+            return iter(
+                [
+                    converter.convert(event_placement)
+                    for converter, event_placement in converter_and_event_placement_list
+                ]
+            )
+        if "fork" in multiprocessing.get_all_start_methods():
+            mp_context = multiprocessing.get_context("fork")
+        else:
+            mp_context = multiprocessing.get_context()
+            try:
+                pickle.dumps(converter_and_event_placement_list)
+            except (pickle.PicklingError, AttributeError, TypeError) as error:
+                raise clock_utilities.UnpicklableTaskError(
+                    concurrent.futures.ProcessPoolExecutor.__name__, error
+                ) from error
+        with concurrent.futures.ProcessPoolExecutor(
+            max_workers=min(self._process_count, event_placement_count),
+            mp_context=mp_context,
+            initializer=_initialize_worker,
+            initargs=(converter_and_event_placement_list,),
+        ) as executor:
+            worker_result_list = list(
+                executor.map(_convert_event_placement_at, range(event_placement_count))
+            )
+        abjad_staff_group_list = []
+        for (converter, _), (
+            abjad_staff_group,
+            warning_tuple,
+            fingerprint_to_abjad_staff_group,
+        ) in zip(converter_and_event_placement_list, worker_result_list):
+            for category, argument_tuple, filename, lineno in warning_tuple:
+                # Warnings with custom '__init__' can't be unpickled,
+                # so we rebuild them from their arguments.
+                warnings.warn_explicit(
+                    category.__new__(category, *argument_tuple),
+                    category,
+                    filename,
+                    lineno,
+                )
+            converter._fingerprint_to_abjad_staff_group.update(
+                fingerprint_to_abjad_staff_group
+            )
+            abjad_staff_group_list.append(abjad_staff_group)
+        return iter(abjad_staff_group_list)
 
     def convert(
         self,
         clock_to_convert: clock_interfaces.Clock,
         tag_tuple: tuple[Tag, ...],
         ordered_tag_tuple: tuple[Tag, ...] = tuple([]),
+        time_range: typing.Optional[ranges.Range] = None,
     ) -> abjad.Score:
+        """Convert a clock to an abjad score.
+
+        :param clock_to_convert: The clock which shall be converted.
+        :type clock_to_convert: clock_interfaces.Clock
+        :param tag_tuple: The tags of the event placements which shall
+            be notated.
+        :type tag_tuple: tuple[Tag, ...]
+        :param ordered_tag_tuple: The order of the staff groups in the
+            score. Tags which aren't part of this tuple are appended.
+            Default to an empty tuple.
+        :type ordered_tag_tuple: tuple[Tag, ...]
+        :param time_range: If not ``None`` only the slice of the clock
+            within this range is notated (e.g. to render an excerpt for
+            a rehearsal). Only clock events and event placements which
+            overlap with the range are converted. Event placements at
+            the borders of the range are cut, their start and end
+            ranges are resolved to their minimal start and maximal end.
+            Default to ``None``.
+        :type time_range: typing.Optional[ranges.Range]
+        """
         abjad_score = abjad.Score([])
         abjad_score.remove_commands.append("System_start_delimiter_engraver")
         if self._clock_event_to_abjad_staff_group is not None:
-            self._add_clock_events_to_abjad_score(clock_to_convert, abjad_score)
+            self._add_clock_events_to_abjad_score(
+                clock_to_convert, abjad_score, time_range
+            )
         self._add_event_placements_to_abjad_score(
-            clock_to_convert, tag_tuple, ordered_tag_tuple, abjad_score
+            clock_to_convert, tag_tuple, ordered_tag_tuple, abjad_score, time_range
         )
         return abjad_score
 
 
+def _object_to_fingerprint(
+    object_: typing.Any, _id_set: typing.Optional[set[int]] = None
+) -> typing.Hashable:
+    # Mutwo events and parameters are neither hashable nor have a
+    # stable representation, so we walk through their attributes. Objects
+    # without attributes fall back to 'repr'. If this 'repr' isn't stable
+    # across runs (e.g. because it contains an address), this only leads
+    # to cache misses.
+    if object_ is None or isinstance(object_, (bool, numbers.Number, str)):
+        return object_
+    if isinstance(object_, types.ModuleType):
+        return object_.__name__
+    if isinstance(object_, (type, types.FunctionType, types.BuiltinFunctionType)):
+        name = f"{object_.__module__}.{object_.__qualname__}"
+        # Functions and classes which are defined inside other
+        # functions depend on the variables of their closures.
+        if "<locals>" not in object_.__qualname__:
+            return name
+    # Loggers are attached to many mutwo objects, but don't change
+    # the notation.
+    if isinstance(object_, logging.Logger):
+        return object_.name
+    if _id_set is None:
+        _id_set = set()
+    if (object_id := id(object_)) in _id_set:
+        return "..."
+    _id_set.add(object_id)
+    try:
+        if isinstance(object_, types.FunctionType):
+            return (
+                name,
+                tuple(
+                    _object_to_fingerprint(cell.cell_contents, _id_set)
+                    for cell in object_.__closure__ or ()
+                ),
+                _object_to_fingerprint(object_.__defaults__, _id_set),
+            )
+        if isinstance(object_, type):
+            return (
+                name,
+                tuple(
+                    (attribute_name, _object_to_fingerprint(attribute, _id_set))
+                    for attribute_name, attribute in vars(object_).items()
+                    if isinstance(attribute, types.FunctionType)
+                ),
+            )
+        if isinstance(object_, dict):
+            return tuple(
+                sorted(
+                    (repr(key), _object_to_fingerprint(value, _id_set))
+                    for key, value in object_.items()
+                )
+            )
+        if isinstance(object_, (set, frozenset)):
+            return tuple(
+                sorted(repr(_object_to_fingerprint(item, _id_set)) for item in object_)
+            )
+        item_tuple = ()
+        if isinstance(object_, (list, tuple)):
+            item_tuple = tuple(
+                _object_to_fingerprint(item, _id_set) for item in object_
+            )
+        attribute_dict = dict(getattr(object_, "__dict__", {}))
+        for cls in type(object_).__mro__:
+            for slot in getattr(cls, "__slots__", ()):
+                if slot not in ("__dict__", "__weakref__") and hasattr(object_, slot):
+                    attribute_dict[slot] = getattr(object_, slot)
+        if not (item_tuple or attribute_dict or isinstance(object_, (list, tuple))):
+            # The default 'repr' contains the address of the object, but
+            # objects without attributes only differ by their type.
+            if type(object_).__repr__ is object.__repr__:
+                return f"{type(object_).__module__}.{type(object_).__qualname__}"
+            return repr(object_)
+        return (
+            _object_to_fingerprint(type(object_), _id_set),
+            item_tuple,
+            _object_to_fingerprint(attribute_dict, _id_set),
+        )
+    finally:
+        _id_set.remove(object_id)
+
+
+# Converters keep transient state of their last conversion (e.g. time
+# signatures), so we fingerprint their settings only when we see them
+# for the first time.
+_converter_to_fingerprint: weakref.WeakKeyDictionary[
+    core_converters.abc.Converter, str
+] = weakref.WeakKeyDictionary()
+
+
+def _get_converter_fingerprint(converter: core_converters.abc.Converter) -> str:
+    try:
+        return _converter_to_fingerprint[converter]
+    except KeyError:
+        fingerprint = _converter_to_fingerprint[converter] = hashlib.sha256(
+            repr(_object_to_fingerprint(converter)).encode()
+        ).hexdigest()
+        return fingerprint
+
+
+# Staff groups of other versions may be notated differently, so the
+# versions are part of the fingerprint of cached staff groups.
+_VERSION_DISTRIBUTION_NAME_TUPLE = (
+    "mutwo.abjad",
+    "mutwo.clock",
+    "mutwo.common",
+    "mutwo.core",
+    "mutwo.music",
+    "mutwo.timeline",
+)
+
+
+@functools.cache
+def _get_version_tuple() -> tuple[typing.Optional[str], ...]:
+    version_list = [abjad.__version__]
+    for distribution_name in _VERSION_DISTRIBUTION_NAME_TUPLE:
+        try:
+            version = importlib.metadata.version(distribution_name)
+        except importlib.metadata.PackageNotFoundError:
+            version = None
+        version_list.append(version)
+    return tuple(version_list)
+
+
+def _is_rest_event_placement(event_placement: timeline_interfaces.EventPlacement):
+    return event_placement.event.duration.duration == 0
+
+
+def _merge_rest_event_placements(
+    event_placement_tuple: tuple[timeline_interfaces.EventPlacement, ...],
+) -> tuple[timeline_interfaces.EventPlacement, ...]:
+    event_placement_list = []
+    for event_placement in event_placement_tuple:
+        if (
+            event_placement_list
+            and _is_rest_event_placement(event_placement)
+            and _is_rest_event_placement(previous := event_placement_list[-1])
+            and previous.max_end == event_placement.min_start
+        ):
+            event_placement_list[-1] = timeline_interfaces.EventPlacement(
+                previous.event,
+                previous.start_or_start_range,
+                event_placement.end_or_end_range,
+            )
+        else:
+            event_placement_list.append(event_placement)
+    return tuple(event_placement_list)
+
+
+# Only set inside worker processes of 'ClockToAbjadScore' (by the
+# initializer of the process pool), never in the main process.
+_worker_converter_and_event_placement_list: typing.Optional[
+    list[tuple[EventPlacementToAbjadStaffGroup, timeline_interfaces.EventPlacement]]
+] = None
+
+
+def _initialize_worker(
+    converter_and_event_placement_list: list[
+        tuple[EventPlacementToAbjadStaffGroup, timeline_interfaces.EventPlacement]
+    ],
+):
+    global _worker_converter_and_event_placement_list
+    _worker_converter_and_event_placement_list = converter_and_event_placement_list
+
+
+def _convert_event_placement_at(
+    index: int,
+) -> tuple[
+    abjad.StaffGroup,
+    tuple[tuple[type[Warning], tuple, str, int], ...],
+    dict[str, abjad.StaffGroup],
+]:
+    converter, event_placement = _worker_converter_and_event_placement_list[index]
+    fingerprint_set = set(converter._fingerprint_to_abjad_staff_group)
+    with warnings.catch_warnings(record=True) as warning_message_list:
+        warnings.simplefilter("always")
+        abjad_staff_group = converter.convert(event_placement)
+    warning_tuple = tuple(
+        (
+            warning_message.category,
+            warning_message.message.args,
+            warning_message.filename,
+            warning_message.lineno,
+        )
+        for warning_message in warning_message_list
+    )
+    # Return new cache entries, so that the converter of the
+    # main process can reuse them.
+    fingerprint_to_abjad_staff_group = {
+        fingerprint: cached_abjad_staff_group
+        for fingerprint, cached_abjad_staff_group in (
+            converter._fingerprint_to_abjad_staff_group.items()
+        )
+        if fingerprint not in fingerprint_set
+    }
+    return abjad_staff_group, warning_tuple, fingerprint_to_abjad_staff_group
+
+
+def _cut_out_event_placement(
+    event_placement: timeline_interfaces.EventPlacement,
+    start: fractions.Fraction,
+    end: fractions.Fraction,
+):
+    # Cut event placement in place, so that it starts
+    # not before 'start' and ends not after 'end'.
+    event_placement_start, event_placement_end = (
+        event_placement.min_start.duration,
+        event_placement.max_end.duration,
+    )
+    if event_placement_start >= start and event_placement_end <= end:
+        return
+    new_start = max(event_placement_start, start)
+    new_end = min(event_placement_end, end)
+    written_duration = event_placement.event.duration.duration
+    if written_duration > 0 and (
+        real_duration := event_placement_end - event_placement_start
+    ):
+        # Events are stretched to the duration of their placement.
+        ratio = written_duration / real_duration
+        event_placement.event.cut_out(
+            (new_start - event_placement_start) * ratio,
+            (new_end - event_placement_start) * ratio,
+        )
+    event_placement.start_or_start_range = new_start
+    event_placement.end_or_end_range = new_end
+
+
 class AbjadScoreToAbjadScoreBlock(core_converters.abc.Converter):
     def get_abjad_layout_block(
         self,
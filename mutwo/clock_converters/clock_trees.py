@@ -1,36 +1,147 @@
+import concurrent.futures
+import functools
+import itertools
 import typing
 
+import numpy as np
+
 from mutwo import clock_generators
+from mutwo import clock_utilities
 from mutwo import core_converters
 from mutwo import core_events
 from mutwo import core_parameters
 
-__all__ = ("ClockTreeToEvent", "EventToSilencedEvent", "SplitEventBy", "SplitEventByTag")
+__all__ = (
+    "ClockTreeToEvent",
+    "ClockTreeSequenceToEventTuple",
+    "EventToSilencedEvent",
+    "SplitEventBy",
+    "SplitEventByTag",
+)
 
 
 class ClockTreeToEvent(core_converters.abc.Converter):
     def convert(
         self, clock_tree_to_convert: clock_generators.ClockTree, cycle_count: int = 1
     ) -> core_events.SequentialEvent:
-        root_layer = clock_tree_to_convert.root.data
+        root_layer = clock_tree_to_convert[clock_tree_to_convert.root].data
         sequential_event = core_events.SequentialEvent([])
         for _ in range(cycle_count):
-            sequential_event.extend(root_layer.pop_event())
+            clock_event, _ = root_layer.pop_event()
+            sequential_event.extend(clock_event)
         return sequential_event
 
 
+class ClockTreeSequenceToEventTuple(core_converters.abc.Converter):
+    """Pop events from multiple independent clock trees.
+
+    :param clock_tree_to_event: The converter which is applied on
+        each clock tree.
+    :type clock_tree_to_event: ClockTreeToEvent
+    :param executor: The executor in which the clock trees are popped.
+        If ``None`` the clock trees are popped one after another in the
+        current thread. Default to ``None``.
+    :type executor: typing.Optional[concurrent.futures.Executor]
+
+    Without an executor or with a :class:`concurrent.futures.ThreadPoolExecutor`
+    the passed clock trees are popped themselves, so their state
+    changes like after calling :class:`ClockTreeToEvent` on each of them.
+    A :class:`concurrent.futures.ProcessPoolExecutor` pops copies of the
+    clock trees inside the worker processes and leaves the passed trees
+    unchanged. But then the clock trees (including the callables of their
+    layers) and the popped events need to be picklable. This isn't the
+    case for most music events (e.g. :class:`mutwo.music_events.NoteLike`
+    holds lambdas in its envelopes), so process pools only work with
+    plain events like :class:`mutwo.core_events.SimpleEvent` and raise
+    :class:`mutwo.clock_utilities.UnpicklableTaskError` otherwise.
+    Popping is pure Python code, so thread pools don't make it faster.
+    """
+
+    def __init__(
+        self,
+        clock_tree_to_event: ClockTreeToEvent = ClockTreeToEvent(),
+        executor: typing.Optional[concurrent.futures.Executor] = None,
+    ):
+        self._clock_tree_to_event = clock_tree_to_event
+        self._executor = executor
+
+    def convert(
+        self,
+        clock_tree_sequence_to_convert: typing.Sequence[clock_generators.ClockTree],
+        cycle_count: int = 1,
+        random_seed: typing.Optional[int] = None,
+    ) -> tuple[core_events.SequentialEvent, ...]:
+        """Pop events from all clock trees.
+
+        :param clock_tree_sequence_to_convert: The clock trees to pop from.
+        :type clock_tree_sequence_to_convert: typing.Sequence[clock_generators.ClockTree]
+        :param cycle_count: How often the root layer of each tree is popped.
+        :type cycle_count: int
+        :param random_seed: If not ``None`` each clock tree is seeded with
+            its own seed which is derived from `random_seed` and the
+            position of the tree in the sequence. Default to ``None``.
+        :type random_seed: typing.Optional[int]
+        :return: One event per clock tree, in the same order as the trees.
+        """
+        clock_tree_tuple = tuple(clock_tree_sequence_to_convert)
+        if random_seed is None:
+            random_seed_tuple = (None,) * len(clock_tree_tuple)
+        else:
+            random_seed_tuple = tuple(
+                int(seed_sequence.generate_state(1)[0])
+                for seed_sequence in np.random.SeedSequence(random_seed).spawn(
+                    len(clock_tree_tuple)
+                )
+            )
+        argument_iterable = (
+            itertools.repeat(self._clock_tree_to_event),
+            clock_tree_tuple,
+            itertools.repeat(cycle_count),
+            random_seed_tuple,
+        )
+        return tuple(
+            clock_utilities.map_in_executor(
+                self._executor, _clock_tree_to_event, *argument_iterable
+            )
+        )
+
+
+def _clock_tree_to_event(
+    clock_tree_to_event: ClockTreeToEvent,
+    clock_tree: clock_generators.ClockTree,
+    cycle_count: int,
+    random_seed: typing.Optional[int],
+) -> core_events.SequentialEvent:
+    # Module level function, so that it can be send to worker processes.
+    if random_seed is not None:
+        clock_tree.seed(random_seed)
+    return clock_tree_to_event.convert(clock_tree, cycle_count)
+
+
 class EventToSilencedEvent(core_converters.abc.SymmetricalEventConverter):
     """Convert all events to rests where function returns ``True``.
 
     Helpful to extract only relevant events.
     This is particularly useful for clock trees, which often have plenty of different
     layers depending on their tags.
+
+    :param force_event_to_rest: Function which returns ``True`` if a
+        simple event shall become a rest.
+    :type force_event_to_rest: typing.Callable[[core_events.SimpleEvent], bool]
+    :param share_event: If ``True`` simple events which don't become
+        rests aren't copied, but shared with the converted event. Use
+        :func:`mutwo.clock_utilities.materialize_event` before changing
+        them. Default to ``False``.
+    :type share_event: bool
     """
 
     def __init__(
-        self, force_event_to_rest: typing.Callable[[core_events.SimpleEvent], bool]
+        self,
+        force_event_to_rest: typing.Callable[[core_events.SimpleEvent], bool],
+        share_event: bool = False,
     ):
         self._force_event_to_rest = force_event_to_rest
+        self._share_event = share_event
 
     def _convert_simple_event(
         self,
@@ -40,6 +151,8 @@ class EventToSilencedEvent(core_converters.abc.SymmetricalEventConverter):
     ) -> core_events.SimpleEvent:
         if self._force_event_to_rest(event_to_convert):
             return core_events.SimpleEvent(event_to_convert.duration)
+        if self._share_event:
+            return event_to_convert
         return event_to_convert.copy()
 
     def convert(self, event_to_convert):
@@ -59,19 +172,61 @@ class SplitEventBy(core_converters.abc.Converter):
 
 
 class SplitEventByTag(SplitEventBy):
-    def __init__(self, tag_tuple: tuple[str, ...]):
-        event_to_silenced_event_list = []
-        for tag in tag_tuple:
-            event_to_silenced_event = EventToSilencedEvent(
-                lambda event: getattr(event, "tag", None) not in (tag,)
+    """Split event into one layer per tag.
+
+    :param tag_tuple: The tags of the layers.
+    :type tag_tuple: tuple[str, ...]
+    :param share_event: If ``True`` simple events aren't copied, but
+        shared with the converted event (see :class:`EventToSilencedEvent`).
+        Default to ``False``.
+    :type share_event: bool
+
+    Each layer only keeps the simple events with the layers tag, all
+    other simple events are replaced by rests. The layer gets the tag
+    as its ``tag`` attribute. In contrast to :class:`SplitEventBy`,
+    the event is only traversed once for all tags.
+    """
+
+    def __init__(self, tag_tuple: tuple[str, ...], share_event: bool = False):
+        self._tag_tuple = tuple(tag_tuple)
+        self._share_event = share_event
+        tag_to_index_list = {}
+        for index, tag in enumerate(self._tag_tuple):
+            tag_to_index_list.setdefault(tag, []).append(index)
+        self._tag_to_index_tuple = {
+            tag: tuple(index_list) for tag, index_list in tag_to_index_list.items()
+        }
+        super().__init__(
+            tuple(
+                EventToSilencedEvent(
+                    functools.partial(_is_not_tagged_with, tag=tag), share_event
+                )
+                for tag in self._tag_tuple
             )
-            event_to_silenced_event_convert = event_to_silenced_event.convert
+        )
+
+    def _split_event(self, event: core_events.abc.Event) -> list[core_events.abc.Event]:
+        layer_count = len(self._tag_tuple)
+        if isinstance(event, core_events.abc.ComplexEvent):
+            layer_list = [event.empty_copy() for _ in range(layer_count)]
+            for child_event in event:
+                for layer, child_layer in zip(
+                    layer_list, self._split_event(child_event)
+                ):
+                    layer.append(child_layer)
+            return layer_list
+        duration = event.duration
+        layer_list = [core_events.SimpleEvent(duration) for _ in range(layer_count)]
+        for index in self._tag_to_index_tuple.get(getattr(event, "tag", None), ()):
+            layer_list[index] = event if self._share_event else event.copy()
+        return layer_list
+
+    def convert(self, event_to_convert) -> core_events.SimultaneousEvent:
+        layer_list = self._split_event(event_to_convert)
+        for layer, tag in zip(layer_list, self._tag_tuple):
+            layer.tag = tag
+        return core_events.SimultaneousEvent(layer_list)
 
-            def _event_to_silenced_event_convert(self, event):
-                converted_event = event_to_silenced_event_convert(event)
-                converted_event.tag = tag
-                return converted_event
 
-            event_to_silenced_event.convert = _event_to_silenced_event_convert
-            event_to_silenced_event_list.append(event_to_silenced_event)
-        super().__init__(tuple(event_to_silenced_event_list))
+def _is_not_tagged_with(event: core_events.SimpleEvent, tag: str) -> bool:
+    return getattr(event, "tag", None) != tag
@@ -1,48 +1,358 @@
+import copy
+import functools
+import math
+import typing
+
+import quicktions as fractions
+import ranges
+
+from mutwo import clock_events
 from mutwo import core_converters
 from mutwo import core_events
-from mutwo import core_utilities
 from mutwo import clock_interfaces
+from mutwo import clock_utilities
 from mutwo import timeline_converters
 
 
 __all__ = (
     "ClockLineToSimultaneousEvent",
     "ClockToSimultaneousEvent",
+    "ClockToRepeatedSimultaneousEvent",
+    "ClockEventToArrayClockEvent",
+    "ArrayClockEventToClockEvent",
 )
 
 
 class ClockLineToSimultaneousEvent(timeline_converters.TimeLineToSimultaneousEvent):
+    """Convert a :class:`mutwo.clock_interfaces.ClockLine` to a :class:`mutwo.core_events.SimultaneousEvent`.
+
+    :param random_seed: Seed for random operation in case start or
+        end of an event placement is a range. Default to 100.
+    :type random_seed: int
+    :param share_clock_event: If ``True`` the clock event of the clock
+        line isn't copied, but only its containers (see
+        :func:`mutwo.clock_utilities.shallow_copy_event`). This is much
+        faster for big clock events, but the simple events are shared
+        with the clock line. Use
+        :func:`mutwo.clock_utilities.materialize_event` before changing
+        them, or before cutting or splitting the result. Default to
+        ``False``.
+    :type share_clock_event: bool
+    """
+
+    def __init__(self, random_seed: int = 100, share_clock_event: bool = False):
+        super().__init__(random_seed)
+        self._share_clock_event = share_clock_event
+
+    def _convert_time_range(
+        self, clock_line_to_convert: clock_interfaces.ClockLine, start, end
+    ) -> core_events.SimultaneousEvent:
+        clock_event = clock_line_to_convert.clock_event
+        # Only event placements which overlap with the time range are
+        # converted. The duration of the time line is still defined by
+        # the complete clock event.
+        simultaneous_event = super().convert(
+            clock_interfaces.ClockLine(
+                clock_event,
+                clock_line_to_convert.get_event_placement_tuple_in_range(start, end),
+            )
+        )
+        simultaneous_event.cut_out(start, end)
+        # Tags without any event in the time range are filled with rests,
+        # so that the result has the same tags as a complete conversion.
+        tag_to_tagged_simultaneous_event = {
+            tagged_simultaneous_event.tag: tagged_simultaneous_event
+            for tagged_simultaneous_event in simultaneous_event
+        }
+        simultaneous_event = core_events.SimultaneousEvent(
+            [
+                tag_to_tagged_simultaneous_event.get(tag, None)
+                or core_events.TaggedSimultaneousEvent(
+                    [
+                        core_events.SequentialEvent(
+                            [core_events.SimpleEvent(end - start)]
+                        )
+                    ],
+                    tag=tag,
+                )
+                for tag in sorted(clock_line_to_convert.tag_set)
+            ]
+        )
+        simultaneous_event.insert(
+            0, clock_utilities.cut_out_simultaneous_event(clock_event, start, end)
+        )
+        return simultaneous_event
+
     def convert(
-        self, clock_line_to_convert: clock_interfaces.ClockLine
+        self,
+        clock_line_to_convert: clock_interfaces.ClockLine,
+        time_range: typing.Optional[ranges.Range] = None,
     ) -> core_events.SimultaneousEvent:
+        """Convert a clock line.
+
+        :param clock_line_to_convert: The clock line which shall be converted.
+        :type clock_line_to_convert: clock_interfaces.ClockLine
+        :param time_range: If not ``None`` only the slice of the clock
+            line within this range is converted. The result equals the
+            slice of the complete conversion, but only the clock events
+            and event placements which overlap with the range are copied.
+            Start or end ranges of event placements may be resolved
+            differently. Default to ``None``.
+        :type time_range: typing.Optional[ranges.Range]
+        """
+        if time_range is not None:
+            return self._convert_time_range(
+                clock_line_to_convert, time_range.start, time_range.end
+            )
         simultaneous_event = super().convert(clock_line_to_convert)
-        simultaneous_event.insert(0, clock_line_to_convert.clock_event.copy())
+        clock_event = clock_line_to_convert.clock_event
+        simultaneous_event.insert(
+            0,
+            clock_utilities.shallow_copy_event(clock_event)
+            if self._share_clock_event
+            else clock_event.copy(),
+        )
         return simultaneous_event
 
 
 class ClockToSimultaneousEvent(core_converters.abc.Converter):
+    """Convert a :class:`mutwo.clock_interfaces.Clock` to a :class:`mutwo.core_events.SimultaneousEvent`.
+
+    :param clock_line_to_simultaneous_event: Converter which is used to
+        convert the clock lines of the clock.
+    :type clock_line_to_simultaneous_event: ClockLineToSimultaneousEvent
+    :param tile_repetition: If ``True`` the main clock line is only
+        converted once and the result is copied for each further
+        repetition. This is faster for many repetitions, but start or end
+        ranges of event placements are only resolved once (so all
+        repetitions are equal). Default to ``False``.
+    :type tile_repetition: bool
+
+    All parts of the clock are concatenated in one pass with
+    :func:`mutwo.clock_utilities.concatenate_simultaneous_event_sequence`.
+    """
+
     def __init__(
         self,
         clock_line_to_simultaneous_event: ClockLineToSimultaneousEvent = ClockLineToSimultaneousEvent(),
+        tile_repetition: bool = False,
     ):
         self._clock_line_to_simultaneous_event = clock_line_to_simultaneous_event
+        self._tile_repetition = tile_repetition
+
+    def _clock_line_to_simultaneous_event_iterator(
+        self, clock_line: clock_interfaces.ClockLine, repetition_count: int
+    ) -> typing.Iterator[core_events.SimultaneousEvent]:
+        if self._tile_repetition and repetition_count > 1:
+            simultaneous_event = self._clock_line_to_simultaneous_event.convert(
+                clock_line
+            )
+            yield simultaneous_event
+            for _ in range(repetition_count - 1):
+                yield simultaneous_event.copy()
+        else:
+            for _ in range(repetition_count):
+                yield self._clock_line_to_simultaneous_event.convert(clock_line)
 
     def convert(
-        self, clock_to_convert: clock_interfaces.Clock, repetition_count: int = 1
+        self,
+        clock_to_convert: clock_interfaces.Clock,
+        repetition_count: int = 1,
+        time_range: typing.Optional[ranges.Range] = None,
     ) -> core_events.SimultaneousEvent:
-        simultaneous_event = core_events.SimultaneousEvent()
+        """Convert a clock.
+
+        :param clock_to_convert: The clock which shall be converted.
+        :type clock_to_convert: clock_interfaces.Clock
+        :param repetition_count: How often the main clock line is repeated.
+            Default to 1.
+        :type repetition_count: int
+        :param time_range: If not ``None`` only the slice of the clock
+            within this range is converted, so that the runtime depends
+            on the duration of the slice and not on the duration of the
+            clock (see :meth:`mutwo.clock_interfaces.Clock.get_clock_line_window_tuple`
+            and :meth:`ClockLineToSimultaneousEvent.convert`). In this case
+            `tile_repetition` is ignored. Default to ``None``.
+        :type time_range: typing.Optional[ranges.Range]
+        """
+        if time_range is not None:
+            return clock_utilities.concatenate_simultaneous_event_sequence(
+                [
+                    self._clock_line_to_simultaneous_event.convert(
+                        clock_line, ranges.Range(start, end)
+                    )
+                    for clock_line, _, start, end in (
+                        clock_to_convert.get_clock_line_window_tuple(
+                            time_range.start, time_range.end, repetition_count
+                        )
+                    )
+                ]
+            )
+        simultaneous_event_list = []
         for repetition_count, clock_line in (
             (1, clock_to_convert.start_clock_line),
             (repetition_count, clock_to_convert.main_clock_line),
             (1, clock_to_convert.end_clock_line),
         ):
             if clock_line is not None:
-                for _ in range(repetition_count):
-                    new_simultaneous_event = (
-                        self._clock_line_to_simultaneous_event.convert(clock_line)
+                simultaneous_event_list.extend(
+                    self._clock_line_to_simultaneous_event_iterator(
+                        clock_line, repetition_count
                     )
-                    try:
-                        simultaneous_event.concatenate_by_tag(new_simultaneous_event)
-                    except core_utilities.NoTagError:
-                        simultaneous_event.concatenate_by_index(new_simultaneous_event)
-        return simultaneous_event
+                )
+        return clock_utilities.concatenate_simultaneous_event_sequence(
+            simultaneous_event_list
+        )
+
+
+class ClockToRepeatedSimultaneousEvent(core_converters.abc.Converter):
+    """Convert a :class:`mutwo.clock_interfaces.Clock` to a :class:`mutwo.clock_events.RepeatedSimultaneousEvent`.
+
+    :param clock_line_to_simultaneous_event: Converter which is used to
+        convert the clock lines of the clock.
+    :type clock_line_to_simultaneous_event: ClockLineToSimultaneousEvent
+
+    Each clock line is only converted once, therefore the memory of the
+    returned object doesn't grow with ``repetition_count``. Similar to
+    the ``tile_repetition`` mode of :class:`ClockToSimultaneousEvent`,
+    start or end ranges of event placements are only resolved once.
+    """
+
+    def __init__(
+        self,
+        clock_line_to_simultaneous_event: ClockLineToSimultaneousEvent = ClockLineToSimultaneousEvent(),
+    ):
+        self._clock_line_to_simultaneous_event = clock_line_to_simultaneous_event
+
+    def convert(
+        self, clock_to_convert: clock_interfaces.Clock, repetition_count: int = 1
+    ) -> clock_events.RepeatedSimultaneousEvent:
+        return clock_events.RepeatedSimultaneousEvent(
+            [
+                (
+                    self._clock_line_to_simultaneous_event.convert(clock_line),
+                    repetition_count,
+                )
+                for repetition_count, clock_line in (
+                    (1, clock_to_convert.start_clock_line),
+                    (repetition_count, clock_to_convert.main_clock_line),
+                    (1, clock_to_convert.end_clock_line),
+                )
+                if clock_line is not None
+            ]
+        )
+
+
+class ClockEventToArrayClockEvent(core_converters.abc.Converter):
+    """Convert a :class:`mutwo.clock_events.ClockEvent` to a :class:`mutwo.clock_events.ArrayClockEvent`.
+
+    Each track of the clock event needs to be a
+    :class:`mutwo.core_events.SequentialEvent` of simple events.
+    Simple events with equal parameters (except their duration) share
+    one prototype (see
+    :meth:`mutwo.clock_events.ArrayClockEvent.get_prototype_key`).
+    """
+
+    def convert(
+        self, clock_event_to_convert: clock_events.ClockEvent
+    ) -> clock_events.ArrayClockEvent:
+        key_to_prototype_index, prototype_list = {}, []
+        fraction_list_list, prototype_index_list_list = [], []
+        for sequential_event in clock_event_to_convert:
+            if not isinstance(sequential_event, core_events.SequentialEvent):
+                raise TypeError(
+                    f"Can't convert '{sequential_event}': "
+                    "all tracks need to be sequential events."
+                )
+            fraction_list, prototype_index_list = [], []
+            for simple_event in sequential_event:
+                if not isinstance(simple_event, core_events.SimpleEvent):
+                    raise TypeError(
+                        f"Can't convert '{simple_event}': "
+                        "all events of a track need to be simple events."
+                    )
+                fraction_list.append(simple_event.duration.duration)
+                key = clock_events.ArrayClockEvent.get_prototype_key(simple_event)
+                try:
+                    prototype_index = key_to_prototype_index[key]
+                except KeyError:
+                    prototype_index = key_to_prototype_index[key] = len(prototype_list)
+                    prototype_list.append(simple_event)
+                prototype_index_list.append(prototype_index)
+            fraction_list_list.append(fraction_list)
+            prototype_index_list_list.append(prototype_index_list)
+
+        denominator = math.lcm(
+            *(
+                fraction.denominator
+                for fraction_list in fraction_list_list
+                for fraction in fraction_list
+            ),
+            1,
+        )
+        return clock_events.ArrayClockEvent(
+            clock_event_to_convert.empty_copy(),
+            tuple(
+                sequential_event.empty_copy()
+                for sequential_event in clock_event_to_convert
+            ),
+            tuple(
+                [int(fraction * denominator) for fraction in fraction_list]
+                for fraction_list in fraction_list_list
+            ),
+            tuple(prototype_index_list_list),
+            tuple(prototype_list),
+            denominator,
+        )
+
+
+class ArrayClockEventToClockEvent(core_converters.abc.Converter):
+    """Convert a :class:`mutwo.clock_events.ArrayClockEvent` to a :class:`mutwo.clock_events.ClockEvent`.
+
+    Each simple event is a copy of its prototype with the
+    duration of the array clock event. Prototypes with only hashable
+    parameters are copied shallow, all others are copied deep.
+    """
+
+    def convert(
+        self, array_clock_event_to_convert: clock_events.ArrayClockEvent
+    ) -> clock_events.ClockEvent:
+        denominator = array_clock_event_to_convert.denominator
+        copy_prototype_tuple = tuple(
+            functools.partial(
+                copy.copy if _is_hashable(prototype) else copy.deepcopy,
+                prototype,
+            )
+            for prototype in array_clock_event_to_convert.prototype_tuple
+        )
+        clock_event = array_clock_event_to_convert.empty_clock_event.copy()
+        for empty_track, tick_array, prototype_index_array in zip(
+            array_clock_event_to_convert.empty_track_tuple,
+            array_clock_event_to_convert.tick_array_tuple,
+            array_clock_event_to_convert.prototype_index_array_tuple,
+        ):
+            sequential_event = empty_track.copy()
+            for tick, prototype_index in zip(
+                tick_array.tolist(), prototype_index_array.tolist()
+            ):
+                simple_event = copy_prototype_tuple[prototype_index]()
+                simple_event.duration = fractions.Fraction(tick, denominator)
+                sequential_event.append(simple_event)
+            clock_event.append(sequential_event)
+        return clock_event
+
+
+def _is_hashable(simple_event: core_events.SimpleEvent) -> bool:
+    # Simple events with only hashable parameters (except their
+    # duration) can be copied shallow.
+    try:
+        hash(
+            tuple(
+                value
+                for attribute_name, value in vars(simple_event).items()
+                if attribute_name != "_duration"
+            )
+        )
+    except TypeError:
+        return False
+    return True
@@ -1,8 +1,15 @@
-from mutwo import clock_generators
+"""Configure :mod:`mutwo.clock_converters`.
 
+Defaults which depend on :mod:`abjad` are only created when they
+are accessed for the first time, so that headless code doesn't
+need to import :mod:`abjad`.
+"""
 
-DEFAULT_COMPLEX_EVENT_TO_ABJAD_CONTAINER = (
-    clock_generators.make_complex_event_to_abjad_container()
-)
 
-del clock_generators
+def __getattr__(name: str):
+    if name == "DEFAULT_COMPLEX_EVENT_TO_ABJAD_CONTAINER":
+        from mutwo import clock_generators
+
+        value = globals()[name] = clock_generators.make_complex_event_to_abjad_container()
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,17 +1,22 @@
 """Make event placements from ModalSequentialEvent."""
 
 import abc
+import concurrent.futures
+import itertools
 import typing
 
+import numpy as np
+
 from mutwo import clock_converters
 from mutwo import clock_events
 from mutwo import clock_interfaces
 from mutwo import clock_generators
 from mutwo import clock_parameters  # monkeypatch
+from mutwo import clock_utilities
 from mutwo import core_converters
 from mutwo import core_events
 from mutwo import core_parameters
-from mutwo import core_utilities
+from mutwo import music_parameters
 from mutwo import timeline_interfaces
 
 __all__ = (
@@ -22,6 +27,7 @@ __all__ = (
     "Modal0SequentialEventToClockLine",
     "Modal0SequentialEventToClockEvent",
     "Modal0SequentialEventToModal1SequentialEvent",
+    "Modal0EventIterableToModal1EventIterator",
 )
 
 Modal0SequentialEvent: typing.TypeAlias = core_events.SequentialEvent[
@@ -42,11 +48,157 @@ class ModalEvent0ToClockTree(core_converters.abc.Converter):
 
 
 class ApplyClockTreeOnModalEvent0(core_converters.abc.SymmetricalEventConverter):
+    """Assign clock and control event to each modal event.
+
+    :param modal_event_0_to_clock_tree: Creates the clock tree from
+        which the clock and control event of a modal event are popped.
+    :type modal_event_0_to_clock_tree: ModalEvent0ToClockTree
+    :param use_cache: If ``True`` the popped events are saved for each
+        modal event signature. Modal events with the same signature get
+        a copy of the saved events instead of creating and popping a
+        new clock tree. This is only correct if
+        `modal_event_0_to_clock_tree` returns equal clock trees for
+        modal events with the same signature and if each returned tree
+        creates the same events (e.g. it isn't shared between modal
+        events and its random generators are seeded). Default to ``False``.
+    :type use_cache: bool
+    :param modal_event_0_to_signature: Returns the signature of a modal
+        event. By default the signature contains the class and the
+        values of all attributes except the clock and control event.
+        Pitches are represented by their frequency and scales by their
+        pitches, weights and scale positions, so equal pitches and
+        scales share a signature even if they are different objects.
+        Other unhashable attributes are represented by their ``repr``.
+        Default to ``None``.
+    :type modal_event_0_to_signature: typing.Optional[typing.Callable[[clock_events.ModalEvent0], typing.Hashable]]
+    :param executor: If not ``None`` the clock trees of all modal events
+        are created and popped concurrently in this executor. Modal
+        events with :class:`mutwo.music_parameters.Scale` or pitch
+        attributes and the popped music events (e.g.
+        :class:`mutwo.music_events.NoteLike`) can't be pickled, so in
+        practice only a :class:`concurrent.futures.ThreadPoolExecutor`
+        works. Because popping clock trees is pure Python code, threads
+        don't run it faster on multiple cores. A
+        :class:`concurrent.futures.ProcessPoolExecutor` only works if
+        `modal_event_0_to_clock_tree`, all modal events and all popped
+        events are picklable, otherwise
+        :class:`mutwo.clock_utilities.UnpicklableTaskError` is raised.
+        Default to ``None``.
+    :type executor: typing.Optional[concurrent.futures.Executor]
+    :param random_seed: If not ``None`` the clock tree of each modal event
+        is seeded (see :meth:`mutwo.clock_generators.ClockTree.seed`) with
+        its own seed which is derived from `random_seed` and the position
+        of the modal event. So the result doesn't depend on the order in
+        which the trees are popped. Default to ``None``.
+    :type random_seed: typing.Optional[int]
+    """
+
     def __init__(
         self,
         modal_event_0_to_clock_tree: ModalEvent0ToClockTree,
+        use_cache: bool = False,
+        modal_event_0_to_signature: typing.Optional[
+            typing.Callable[[clock_events.ModalEvent0], typing.Hashable]
+        ] = None,
+        executor: typing.Optional[concurrent.futures.Executor] = None,
+        random_seed: typing.Optional[int] = None,
     ):
         self._modal_event_0_to_clock_tree = modal_event_0_to_clock_tree
+        self._use_cache = use_cache
+        self._modal_event_0_to_signature = (
+            modal_event_0_to_signature or _modal_event_0_to_signature
+        )
+        self._executor = executor
+        self._random_seed = random_seed
+        self._signature_to_modal_event_0_and_event_pair: dict[
+            typing.Hashable,
+            tuple[
+                clock_events.ModalEvent0,
+                tuple[clock_events.ClockEvent, core_events.SimultaneousEvent],
+            ],
+        ] = {}
+        # Events which have been popped before '_convert_event' is called.
+        self._event_pair_iterator: typing.Optional[
+            typing.Iterator[
+                tuple[clock_events.ClockEvent, core_events.SimultaneousEvent]
+            ]
+        ] = None
+
+    def _get_cached_event_pair(
+        self, signature: typing.Hashable
+    ) -> tuple[clock_events.ClockEvent, core_events.SimultaneousEvent]:
+        _, event_pair = self._signature_to_modal_event_0_and_event_pair[signature]
+        # Copy, so that modal events don't share any events.
+        return tuple(event.copy() for event in event_pair)
+
+    def _cache_event_pair(
+        self,
+        signature: typing.Hashable,
+        modal_event_0: clock_events.ModalEvent0,
+        event_pair: tuple[clock_events.ClockEvent, core_events.SimultaneousEvent],
+    ):
+        # We keep a reference to the modal event: the default
+        # signature may contain ids of its attributes, which
+        # must not be reused by other objects.
+        self._signature_to_modal_event_0_and_event_pair[signature] = (
+            modal_event_0,
+            event_pair,
+        )
+
+    def _pop_all_event_pairs(
+        self, event_to_convert: core_events.abc.Event
+    ) -> list[tuple[clock_events.ClockEvent, core_events.SimultaneousEvent]]:
+        modal_event_0_list = _get_modal_event_list(event_to_convert)
+        if self._random_seed is None:
+            random_seed_list = [None] * len(modal_event_0_list)
+        else:
+            random_seed_list = [
+                int(seed_sequence.generate_state(1)[0])
+                for seed_sequence in np.random.SeedSequence(self._random_seed).spawn(
+                    len(modal_event_0_list)
+                )
+            ]
+        if self._use_cache:
+            signature_list = [
+                self._modal_event_0_to_signature(modal_event_0)
+                for modal_event_0 in modal_event_0_list
+            ]
+        else:
+            signature_list = [None] * len(modal_event_0_list)
+
+        # Only pop trees of modal events which aren't cached yet.
+        index_to_pop_list, signature_to_pop_set = [], set([])
+        for index, signature in enumerate(signature_list):
+            if self._use_cache and (
+                signature in self._signature_to_modal_event_0_and_event_pair
+                or signature in signature_to_pop_set
+            ):
+                continue
+            signature_to_pop_set.add(signature)
+            index_to_pop_list.append(index)
+
+        argument_iterable = (
+            itertools.repeat(self._modal_event_0_to_clock_tree),
+            [modal_event_0_list[index] for index in index_to_pop_list],
+            [random_seed_list[index] for index in index_to_pop_list],
+        )
+        event_pair_iterator = clock_utilities.map_in_executor(
+            self._executor, _pop_event_pair, *argument_iterable
+        )
+
+        event_pair_list = [None] * len(modal_event_0_list)
+        for index, event_pair in zip(index_to_pop_list, event_pair_iterator):
+            if self._use_cache:
+                self._cache_event_pair(
+                    signature_list[index], modal_event_0_list[index], event_pair
+                )
+            else:
+                event_pair_list[index] = event_pair
+        if self._use_cache:
+            event_pair_list = [
+                self._get_cached_event_pair(signature) for signature in signature_list
+            ]
+        return event_pair_list
 
     def _convert_simple_event(
         self,
@@ -56,18 +208,33 @@ class ApplyClockTreeOnModalEvent0(core_converters.abc.SymmetricalEventConverter)
     ) -> core_events.SimpleEvent:
         e = event_to_convert.copy()
         if isinstance(e, clock_events.ModalEvent):
-            clock_tree = self._modal_event_0_to_clock_tree.convert(event_to_convert)
-            (e.clock_event, e.control_event) = clock_tree.get_node(
-                clock_tree.root
-            ).data.pop_event()
-            # FIXME(Because currently a clock tree doesn't return a ClockEvent
-            # [which is a SimultaneousEvent] but a SequentialEvent we have
-            # to add this hack).
-            e.clock_event = clock_events.ClockEvent([e.clock_event])
+            if self._event_pair_iterator is not None:
+                e.clock_event, e.control_event = next(self._event_pair_iterator)
+            elif not self._use_cache:
+                e.clock_event, e.control_event = _pop_event_pair(
+                    self._modal_event_0_to_clock_tree, event_to_convert
+                )
+            else:
+                signature = self._modal_event_0_to_signature(event_to_convert)
+                if signature not in self._signature_to_modal_event_0_and_event_pair:
+                    self._cache_event_pair(
+                        signature,
+                        event_to_convert,
+                        _pop_event_pair(
+                            self._modal_event_0_to_clock_tree, event_to_convert
+                        ),
+                    )
+                e.clock_event, e.control_event = self._get_cached_event_pair(signature)
         return e
 
     def convert(self, event_to_convert: core_events.abc.Event) -> core_events.abc.Event:
-        return self._convert_event(event_to_convert, 0)
+        if self._executor is None and self._random_seed is None:
+            return self._convert_event(event_to_convert, 0)
+        self._event_pair_iterator = iter(self._pop_all_event_pairs(event_to_convert))
+        try:
+            return self._convert_event(event_to_convert, 0)
+        finally:
+            self._event_pair_iterator = None
 
 
 class Modal0SequentialEventToEventPlacementTuple(core_converters.abc.Converter):
@@ -110,19 +277,43 @@ class Modal0SequentialEventToClockEvent(core_converters.abc.Converter):
             clock_event_list.append(clock_event)
 
         if clock_event_list:
-            clock_event = clock_event_list[0].copy()
-            for successor in clock_event_list[1:]:
-                try:
-                    clock_event.concatenate_by_tag(successor)
-                except core_utilities.NoTagError:
-                    clock_event.concatenate_by_index(successor)
-
-            return clock_event
+            # We copy the first clock event to not share its leaves with
+            # the modal event.
+            clock_event_list[0] = clock_event_list[0].copy()
+            return clock_utilities.concatenate_simultaneous_event_sequence(
+                clock_event_list
+            )
 
-        return core_events.ClockEvent()
+        return clock_events.ClockEvent()
 
 
 class Modal0SequentialEventToClockLine(core_converters.abc.Converter):
+    """Create ClockLine from Modal0SequentialEvent.
+
+    :param modal_0_sequential_event_to_event_placement_tuple_sequence: Makers
+        which create event placements from the modal sequence.
+    :type modal_0_sequential_event_to_event_placement_tuple_sequence: typing.Sequence[Modal0SequentialEventToEventPlacementTuple]
+    :param modal_1_sequential_event_to_event_placement_tuple_sequence: Makers
+        which create event placements from the :class:`mutwo.clock_events.ModalEvent1`
+        sequence between the modal events. Default to an empty list.
+    :type modal_1_sequential_event_to_event_placement_tuple_sequence: typing.Sequence[Modal1SequentialEventToEventPlacementTuple]
+    :param modal_0_sequential_event_to_clock_event: Creates the clock event
+        of the clock line.
+    :type modal_0_sequential_event_to_clock_event: Modal0SequentialEventToClockEvent
+    :param executor: If not ``None`` all makers run concurrently in
+        this executor. The event placements are always in the same order
+        as the makers. Modal events, their clock events and the returned
+        event placements usually contain pitches, scales and music events,
+        which can't be pickled. So in practice only a
+        :class:`concurrent.futures.ThreadPoolExecutor` works, which helps
+        if makers wait for I/O or run code that releases the GIL. A
+        :class:`concurrent.futures.ProcessPoolExecutor` only works if
+        all makers, the modal sequence and all event placements are
+        picklable, otherwise :class:`mutwo.clock_utilities.UnpicklableTaskError`
+        is raised. Default to ``None`` (makers run one after another).
+    :type executor: typing.Optional[concurrent.futures.Executor]
+    """
+
     def __init__(
         self,
         modal_0_sequential_event_to_event_placement_tuple_sequence: typing.Sequence[
@@ -132,6 +323,7 @@ class Modal0SequentialEventToClockLine(core_converters.abc.Converter):
             Modal1SequentialEventToEventPlacementTuple
         ] = [],
         modal_0_sequential_event_to_clock_event: Modal0SequentialEventToClockEvent = Modal0SequentialEventToClockEvent(),
+        executor: typing.Optional[concurrent.futures.Executor] = None,
     ):
         self._maker_tuple_0 = tuple(
             modal_0_sequential_event_to_event_placement_tuple_sequence
@@ -143,6 +335,8 @@ class Modal0SequentialEventToClockLine(core_converters.abc.Converter):
             modal_0_sequential_event_to_clock_event
         )
 
+        self._executor = executor
+
         self._m0seq_to_m1seq = Modal0SequentialEventToModal1SequentialEvent()
 
     def convert(
@@ -157,143 +351,291 @@ class Modal0SequentialEventToClockLine(core_converters.abc.Converter):
         else:
             m1seq = []
 
-        event_placement_list = []
+        event_placement_maker_list, modal_sequential_event_list = [], []
         for modal_sequential_event, event_placement_maker_tuple in (
             (m0seq, self._maker_tuple_0),
             (m1seq, self._maker_tuple_1),
         ):
             for event_placement_maker in event_placement_maker_tuple:
-                event_placement_list.extend(
-                    event_placement_maker.convert(modal_sequential_event)
-                )
+                event_placement_maker_list.append(event_placement_maker)
+                modal_sequential_event_list.append(modal_sequential_event)
+
+        if self._executor is None:
+            event_placement_tuple_iterator = tuple(
+                map(_convert, event_placement_maker_list, modal_sequential_event_list)
+            )
+        else:
+            # All makers are submitted immediately, so we can
+            # create the clock event while the makers are running.
+            event_placement_tuple_iterator = clock_utilities.map_in_executor(
+                self._executor,
+                _convert,
+                event_placement_maker_list,
+                modal_sequential_event_list,
+            )
 
         clock_event = self._modal_0_sequential_event_to_clock_event(m0seq)
+
+        # 'map' keeps the order of the makers, so the
+        # order of the event placements is deterministic.
+        event_placement_list = []
+        for event_placement_tuple in event_placement_tuple_iterator:
+            event_placement_list.extend(event_placement_tuple)
+
         return clock_interfaces.ClockLine(clock_event, event_placement_list)
 
 
-# TODO(Improve logic, make code less verbose)
-class Modal0SequentialEventToModal1SequentialEvent(core_converters.abc.Converter):
-    def convert(
-        self, modal_0_sequential_event_to_convert: Modal0SequentialEvent
-    ) -> Modal1SequentialEvent:
-        m0seq = modal_0_sequential_event_to_convert
-        m1seq = core_events.SequentialEvent([])
-
-        clock_event_list, control_event_list = self._m0seq_to_event_lists(m0seq)
-
-        if m0seq:
-            if isinstance(m0seq[0], clock_events.ModalEvent0):
-                m1seq.append(
-                    clock_events.ModalEvent1(
-                        scale=m0seq[0].scale,
-                        pitch=m0seq[0].start_pitch,
-                        control_event=control_event_list[0],
-                        clock_event=clock_event_list[0],
-                    )
-                )
-            else:
-                m1seq.append(core_events.SimpleEvent(m0seq[0].duration / 2))
+class Modal0EventIterableToModal1EventIterator(core_converters.abc.Converter):
+    """Lazily split modal events in halves and join neighbouring halves.
+
+    :param share_event: If ``True`` the clock and control events of the
+        returned modal events share all simple events, which don't need
+        to be split, with the clock and control events of the converted
+        modal events. This avoids expensive deep copies, but changing a
+        simple event of the returned events also changes the converted
+        events. Default to ``False``.
+    :type share_event: bool
+
+    Each :class:`mutwo.clock_events.ModalEvent1` only depends on two
+    neighbouring modal events, so the converter only keeps the previous
+    modal event in memory. It can therefore process very long or even
+    endless iterables of modal events.
+    """
+
+    def __init__(self, share_event: bool = False):
+        self._share_event = share_event
+
+    def _split(
+        self, m0_ev: clock_events.ModalEvent0 | core_events.SimpleEvent
+    ) -> tuple[tuple, tuple]:
+        """Return halves of clock event and halves of control event"""
+        if not hasattr(m0_ev, "clock_event"):
+            # Rests have two halves, same like modal events.
+            return (None, None), (None, None)
+        return tuple(
+            # Pad, because 'split_at' omits empty halves.
+            (tuple(half_tuple) + (None, None))[:2]
+            for half_tuple in clock_utilities.split_simultaneous_event_sequence_in_half(
+                (m0_ev.clock_event, m0_ev.control_event), self._share_event
+            )
+        )
 
-        for m0_ev_A, m0_ev_B, clock_event, control_event in zip(
-            m0seq, m0seq[1:], clock_event_list[1:], control_event_list[1:]
-        ):
-            if type(clock_event) is tuple:  # One of modal events is a rest
-                clock_p0, clock_p1 = clock_event
-                control_p0, control_p1 = control_event
-                if clock_p0 is None and clock_p1 is None:
-                    m1seq.append(
-                        core_events.SimpleEvent(
-                            (m0_ev_A.duration / 2) + (m0_ev_B.duration / 2)
-                        )
-                    )
-                elif clock_p0 is None:
-                    m1seq.extend(
-                        (
-                            core_events.SimpleEvent(m0_ev_A.duration / 2),
-                            clock_events.ModalEvent1(
-                                pitch=m0_ev_B.start_pitch,
-                                clock_event=clock_p1,
-                                control_event=control_p1,
-                                scale=m0_ev_B.scale,
-                                energy=getattr(m0_ev_B, "energy", 0),
-                            ),
-                        )
-                    )
+    @staticmethod
+    def _join(p0, p1):
+        if p0 is None or p1 is None:
+            return (p0, p1)
+        return p0.concatenate_by_index(p1)
 
-                elif clock_p1 is None:
-                    m1seq.extend(
-                        (
-                            clock_events.ModalEvent1(
-                                pitch=m0_ev_A.end_pitch,
-                                clock_event=clock_p0,
-                                control_event=control_p0,
-                                scale=m0_ev_A.scale,
-                                energy=getattr(m0_ev_A, "energy", 0),
-                            ),
-                            core_events.SimpleEvent(m0_ev_B.duration / 2),
-                        )
-                    )
-                else:
-                    raise NotImplementedError()
-            else:
-                modal_event_1 = clock_events.ModalEvent1(
+    @staticmethod
+    def _start(
+        m0_ev: clock_events.ModalEvent0 | core_events.SimpleEvent, clock_p, control_p
+    ) -> clock_events.ModalEvent1 | core_events.SimpleEvent:
+        if isinstance(m0_ev, clock_events.ModalEvent0):
+            return clock_events.ModalEvent1(
+                scale=m0_ev.scale,
+                pitch=m0_ev.start_pitch,
+                control_event=control_p,
+                clock_event=clock_p,
+            )
+        return core_events.SimpleEvent(m0_ev.duration / 2)
+
+    @staticmethod
+    def _end(
+        m0_ev: clock_events.ModalEvent0 | core_events.SimpleEvent, clock_p, control_p
+    ) -> clock_events.ModalEvent1 | core_events.SimpleEvent:
+        if isinstance(m0_ev, clock_events.ModalEvent0):
+            return clock_events.ModalEvent1(
+                scale=m0_ev.scale,
+                pitch=m0_ev.end_pitch,
+                control_event=control_p,
+                clock_event=clock_p,
+            )
+        return core_events.SimpleEvent(m0_ev.duration / 2)
+
+    @staticmethod
+    def _transition(
+        m0_ev_A, m0_ev_B, clock_event, control_event
+    ) -> typing.Iterator[clock_events.ModalEvent1 | core_events.SimpleEvent]:
+        if type(clock_event) is tuple:  # One of modal events is a rest
+            clock_p0, clock_p1 = clock_event
+            control_p0, control_p1 = control_event
+            if clock_p0 is None and clock_p1 is None:
+                yield core_events.SimpleEvent(
+                    (m0_ev_A.duration / 2) + (m0_ev_B.duration / 2)
+                )
+            elif clock_p0 is None:
+                yield core_events.SimpleEvent(m0_ev_A.duration / 2)
+                yield clock_events.ModalEvent1(
+                    pitch=m0_ev_B.start_pitch,
+                    clock_event=clock_p1,
+                    control_event=control_p1,
+                    scale=m0_ev_B.scale,
+                    energy=getattr(m0_ev_B, "energy", 0),
+                )
+            elif clock_p1 is None:
+                yield clock_events.ModalEvent1(
                     pitch=m0_ev_A.end_pitch,
-                    clock_event=clock_event,
-                    control_event=control_event,
-                    scale=m0_ev_A.scale.intersection(m0_ev_B.scale)
-                    if hasattr(m0_ev_B, "scale")
-                    else m0_ev_A.scale,
-                    energy=(
-                        getattr(m0_ev_A, "energy", 0) + getattr(m0_ev_B, "energy", 0)
-                    )
-                    // 2,
+                    clock_event=clock_p0,
+                    control_event=control_p0,
+                    scale=m0_ev_A.scale,
+                    energy=getattr(m0_ev_A, "energy", 0),
                 )
-                m1seq.append(modal_event_1)
-
-        if m0seq:
-            if isinstance(m0seq[-1], clock_events.ModalEvent0):
-                m1seq.append(
-                    clock_events.ModalEvent1(
-                        scale=m0seq[-1].scale,
-                        pitch=m0seq[-1].end_pitch,
-                        control_event=control_event_list[-1],
-                        clock_event=clock_event_list[-1],
-                    )
+                yield core_events.SimpleEvent(m0_ev_B.duration / 2)
+            else:
+                raise NotImplementedError()
+        else:
+            yield clock_events.ModalEvent1(
+                pitch=m0_ev_A.end_pitch,
+                clock_event=clock_event,
+                control_event=control_event,
+                scale=m0_ev_A.scale.intersection(m0_ev_B.scale)
+                if hasattr(m0_ev_B, "scale")
+                else m0_ev_A.scale,
+                energy=(getattr(m0_ev_A, "energy", 0) + getattr(m0_ev_B, "energy", 0))
+                // 2,
+            )
+
+    def convert(
+        self,
+        modal_0_event_iterable_to_convert: typing.Iterable[
+            clock_events.ModalEvent0 | core_events.SimpleEvent
+        ],
+    ) -> typing.Iterator[clock_events.ModalEvent1 | core_events.SimpleEvent]:
+        """Yield modal events 1 from an iterable of modal events 0.
+
+        :param modal_0_event_iterable_to_convert: Modal events 0 and rests.
+            This can be any iterable, for instance a generator.
+        :type modal_0_event_iterable_to_convert: typing.Iterable[clock_events.ModalEvent0 | core_events.SimpleEvent]
+        """
+        m0_ev_A = clock_half_tuple_A = control_half_tuple_A = None
+        for m0_ev_B in modal_0_event_iterable_to_convert:
+            clock_half_tuple_B, control_half_tuple_B = self._split(m0_ev_B)
+            if m0_ev_A is None:  # Special case: only start_pitch
+                yield self._start(
+                    m0_ev_B, clock_half_tuple_B[0], control_half_tuple_B[0]
                 )
             else:
-                m1seq.append(core_events.SimpleEvent(m0seq[-1].duration / 2))
+                yield from self._transition(
+                    m0_ev_A,
+                    m0_ev_B,
+                    self._join(clock_half_tuple_A[1], clock_half_tuple_B[0]),
+                    self._join(control_half_tuple_A[1], control_half_tuple_B[0]),
+                )
+            m0_ev_A, clock_half_tuple_A, control_half_tuple_A = (
+                m0_ev_B,
+                clock_half_tuple_B,
+                control_half_tuple_B,
+            )
+        if m0_ev_A is not None:  # Special case: only end_pitch
+            yield self._end(m0_ev_A, clock_half_tuple_A[1], control_half_tuple_A[1])
 
-        return m1seq
 
-    @staticmethod
-    def _m0seq_to_event_lists(m0seq):
-        clock_event_part_list, control_event_part_list = [], []
-        for m0_ev in m0seq:
-            if not hasattr(m0_ev, "clock_event"):
-                clock_event_part_list.append(None)
-                control_event_part_list.append(None)
-                continue
-            for ev, l in (
-                (m0_ev.clock_event, clock_event_part_list),
-                (m0_ev.control_event, control_event_part_list),
-            ):
-                l.extend(ev.split_at(ev.duration / 2))
+class Modal0SequentialEventToModal1SequentialEvent(core_converters.abc.Converter):
+    """Split modal events in halves and join neighbouring halves.
+
+    :param share_event: If ``True`` the clock and control events of the
+        returned modal events share all simple events, which don't need
+        to be split, with the clock and control events of the converted
+        modal events. This avoids expensive deep copies, but changing a
+        simple event of the returned events also changes the converted
+        events. Default to ``False``.
+    :type share_event: bool
+
+    Use :class:`Modal0EventIterableToModal1EventIterator` to convert
+    long modal sequences lazily.
+    """
+
+    def __init__(self, share_event: bool = False):
+        self._modal_0_event_iterable_to_modal_1_event_iterator = (
+            Modal0EventIterableToModal1EventIterator(share_event)
+        )
 
-        clock_event_list, control_event_list = [], []
-        for part_list, list_ in (
-            (clock_event_part_list, clock_event_list),
-            (control_event_part_list, control_event_list),
-        ):
-            list_.append(part_list[0])  # Special case: only start_pitch
-            for p0, p1 in zip(part_list[1::2], part_list[2:-1:2]):
-                if p0 is None and p1 is None:
-                    list_.append((None, None))
-                elif p0 is None:
-                    list_.append((None, p1))
-                elif p1 is None:
-                    list_.append((p0, None))
-                else:
-                    list_.append(p0.concatenate_by_index(p1))
-            list_.append(part_list[-1])  # Special case: only end_pitch
-
-        return clock_event_list, control_event_list
+    def convert(
+        self, modal_0_sequential_event_to_convert: Modal0SequentialEvent
+    ) -> Modal1SequentialEvent:
+        return core_events.SequentialEvent(
+            self._modal_0_event_iterable_to_modal_1_event_iterator.convert(
+                modal_0_sequential_event_to_convert
+            )
+        )
+
+
+def _convert(
+    converter: core_converters.abc.Converter, event: core_events.abc.Event
+) -> typing.Any:
+    # Module level function, so that it can be send to worker processes.
+    return converter.convert(event)
+
+
+def _value_to_signature(value: typing.Any) -> typing.Hashable:
+    # Pitches and scales aren't hashable and their representation may
+    # contain ids, so equal objects which have been created separately
+    # would never share a signature. Therefore we use their values.
+    match value:
+        case music_parameters.Scale():
+            return (
+                type(value),
+                tuple(map(_value_to_signature, value.pitch_tuple)),
+                value.weight_tuple,
+                value.scale_degree_tuple,
+                value.period_repetition_count_tuple,
+            )
+        case music_parameters.abc.Pitch():
+            return (type(value), value.frequency)
+    try:
+        hash(value)
+    except TypeError:
+        return repr(value)
+    return value
+
+
+def _get_attribute_dict(object_: typing.Any) -> dict[str, typing.Any]:
+    # Compact modal events keep their attributes in slots, which
+    # aren't returned by 'vars'.
+    attribute_dict = dict(getattr(object_, "__dict__", {}))
+    for cls in type(object_).__mro__:
+        for slot in getattr(cls, "__slots__", ()):
+            if slot not in ("__dict__", "__weakref__") and hasattr(object_, slot):
+                attribute_dict[slot] = getattr(object_, slot)
+    return attribute_dict
+
+
+def _modal_event_0_to_signature(
+    modal_event_0: clock_events.ModalEvent0,
+) -> typing.Hashable:
+    return (type(modal_event_0),) + tuple(
+        (attribute_name, _value_to_signature(value))
+        for attribute_name, value in sorted(_get_attribute_dict(modal_event_0).items())
+        if attribute_name not in ("clock_event", "control_event")
+    )
+
+
+def _pop_event_pair(
+    modal_event_0_to_clock_tree: ModalEvent0ToClockTree,
+    modal_event_0: clock_events.ModalEvent0,
+    random_seed: typing.Optional[int] = None,
+) -> tuple[clock_events.ClockEvent, core_events.SimultaneousEvent]:
+    # Module level function, so that it can be send to worker processes.
+    clock_tree = modal_event_0_to_clock_tree.convert(modal_event_0)
+    if random_seed is not None:
+        clock_tree.seed(random_seed)
+    clock_event, control_event = clock_tree.get_node(clock_tree.root).data.pop_event()
+    # FIXME(Because currently a clock tree doesn't return a ClockEvent
+    # [which is a SimultaneousEvent] but a SequentialEvent we have
+    # to add this hack).
+    return clock_events.ClockEvent([clock_event]), control_event
+
+
+def _get_modal_event_list(
+    event: core_events.abc.Event,
+) -> list[clock_events.ModalEvent]:
+    # Same order as 'SymmetricalEventConverter._convert_event'.
+    if isinstance(event, core_events.abc.ComplexEvent):
+        return [
+            modal_event
+            for child in event
+            for modal_event in _get_modal_event_list(child)
+        ]
+    if isinstance(event, clock_events.ModalEvent):
+        return [event]
+    return []
@@ -2,13 +2,15 @@ from . import configurations
 
 from .clocks import *
 from .modal import *
+from .arrays import *
 
 from . import clocks
 from . import modal
+from . import arrays
 
 from mutwo import core_utilities
 
-__all__ = core_utilities.get_all(clocks, modal)
+__all__ = core_utilities.get_all(clocks, modal, arrays)
 
 # Force flat structure
-del (core_utilities, clocks, modal)
+del (core_utilities, clocks, modal, arrays)
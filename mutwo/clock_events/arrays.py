@@ -0,0 +1,394 @@
+"""Compact representation of clock events."""
+
+from __future__ import annotations
+
+import dataclasses
+import math
+import typing
+
+import numpy as np
+import quicktions as fractions
+
+from mutwo import clock_events
+from mutwo import core_events
+from mutwo import core_parameters
+
+__all__ = ("ArrayClockEvent",)
+
+# Beyond this limit tick sums may overflow int64, so
+# we fall back to arrays of python integers.
+_MAX_INT64_TICK = 2**62
+
+
+def _make_tick_array(tick_list: list[int]) -> np.ndarray:
+    dtype = np.int64 if sum(tick_list) < _MAX_INT64_TICK else object
+    return np.array(tick_list, dtype=dtype)
+
+
+def _assert_tick_dtype(tick_array: np.ndarray) -> np.ndarray:
+    if tick_array.dtype != object and int(tick_array.sum()) >= _MAX_INT64_TICK:
+        return tick_array.astype(object)
+    return tick_array
+
+
+def _value_to_key(value: typing.Any) -> typing.Hashable:
+    # Equal values which have been created separately shall get equal
+    # keys, so we can't rely on hashes or representations which use ids.
+    # Objects are compared by their complete state: for instance
+    # enharmonic pitches have the same frequency, but different names.
+    try:
+        hash(value)
+    except TypeError:
+        pass
+    else:
+        return value
+    match value:
+        case list() | tuple():
+            return (
+                type(value),
+                tuple(map(_value_to_key, value)),
+                _value_to_key(getattr(value, "__dict__", None)),
+            )
+        case dict():
+            return (
+                type(value),
+                tuple((key, _value_to_key(item)) for key, item in value.items()),
+            )
+        case _ if hasattr(value, "__dict__"):
+            return (type(value), _value_to_key(vars(value)))
+    return repr(value)
+
+
+@dataclasses.dataclass(frozen=True, eq=False)
+class ArrayClockEvent(object):
+    """Columnar representation of a :class:`ClockEvent`.
+
+    :param empty_clock_event: Clock event without children. It
+        keeps tag and tempo envelope of the clock event.
+    :type empty_clock_event: clock_events.ClockEvent
+    :param empty_track_tuple: One sequential event without children
+        per track. It keeps type, tag and tempo envelope of the track.
+    :type empty_track_tuple: tuple[core_events.SequentialEvent, ...]
+    :param tick_array_tuple: The durations of the events of each track
+        as integer multiples of ``1 / denominator``.
+    :type tick_array_tuple: tuple[np.ndarray, ...]
+    :param prototype_index_array_tuple: For each event of each track
+        the index of its prototype within ``prototype_tuple``.
+    :type prototype_index_array_tuple: tuple[np.ndarray, ...]
+    :param prototype_tuple: Simple events which define all parameters
+        except the duration. Events with equal parameters share the
+        same prototype.
+    :type prototype_tuple: tuple[core_events.SimpleEvent, ...]
+    :param denominator: Durations of events are represented as
+        integer ticks of ``1 / denominator``.
+    :type denominator: int
+
+    Clocks with tens of thousands of ticks need one python object per
+    tick in their :class:`ClockEvent` form. An :class:`ArrayClockEvent`
+    only saves two numpy arrays per track, so operations as
+    :attr:`duration`, :meth:`split_at`, :meth:`concatenate` or
+    :meth:`get_event_index_tuple_at` are vectorized. Use
+    :class:`mutwo.clock_converters.ClockEventToArrayClockEvent` and
+    :class:`mutwo.clock_converters.ArrayClockEventToClockEvent`
+    to convert between both forms.
+    """
+
+    empty_clock_event: clock_events.ClockEvent
+    empty_track_tuple: tuple[core_events.SequentialEvent, ...]
+    tick_array_tuple: tuple[np.ndarray, ...]
+    prototype_index_array_tuple: tuple[np.ndarray, ...]
+    prototype_tuple: tuple[core_events.SimpleEvent, ...]
+    denominator: int = 1
+
+    def __post_init__(self):
+        # Accept any sequence of integers for ticks and prototype indices.
+        object.__setattr__(
+            self,
+            "tick_array_tuple",
+            tuple(
+                (
+                    tick_array
+                    if isinstance(tick_array, np.ndarray)
+                    else _make_tick_array(list(tick_array))
+                )
+                for tick_array in self.tick_array_tuple
+            ),
+        )
+        object.__setattr__(
+            self,
+            "prototype_index_array_tuple",
+            tuple(
+                np.asarray(prototype_index_array, dtype=np.int64)
+                for prototype_index_array in self.prototype_index_array_tuple
+            ),
+        )
+
+    def __len__(self) -> int:
+        return len(self.empty_track_tuple)
+
+    # ###################################################################### #
+    #                          private methods                               #
+    # ###################################################################### #
+
+    def _with_denominator(self, denominator: int) -> ArrayClockEvent:
+        if denominator == self.denominator:
+            return self
+        factor = denominator // self.denominator
+        return dataclasses.replace(
+            self,
+            tick_array_tuple=tuple(
+                _make_tick_array([int(tick) * factor for tick in tick_array])
+                for tick_array in self.tick_array_tuple
+            ),
+            denominator=denominator,
+        )
+
+    def _get_track_index(
+        self, other: ArrayClockEvent, index: int
+    ) -> typing.Optional[int]:
+        # Find track of this event which belongs to the track of other
+        # event: by tag if all tracks of other event are tagged,
+        # otherwise by index.
+        other_track = other.empty_track_tuple[index]
+        if all(hasattr(track, "tag") for track in other.empty_track_tuple):
+            for track_index, track in enumerate(self.empty_track_tuple):
+                if getattr(track, "tag", None) == other_track.tag:
+                    return track_index
+            return None
+        return index if index < len(self) else None
+
+    # ###################################################################### #
+    #                          static methods                                #
+    # ###################################################################### #
+
+    @staticmethod
+    def get_prototype_key(simple_event: core_events.SimpleEvent) -> typing.Hashable:
+        """Get the key which decides if simple events share a prototype.
+
+        :param simple_event: The simple event which shall be identified.
+        :type simple_event: core_events.SimpleEvent
+
+        Simple events with equal parameters (except their duration) get
+        the same key. Parameters which aren't hashable (for instance
+        pitches or indicator collections) are compared by the values of
+        all their attributes, so converting a clock event to an
+        :class:`ArrayClockEvent` and back is lossless.
+
+        **Example:**
+
+        >>> from mutwo import clock_events
+        >>> from mutwo import music_events
+        >>> clock_events.ArrayClockEvent.get_prototype_key(
+        ...     music_events.NoteLike("c", 1)
+        ... ) == clock_events.ArrayClockEvent.get_prototype_key(
+        ...     music_events.NoteLike("c", 2)
+        ... )
+        True
+        """
+        return (
+            type(simple_event),
+            tuple(
+                sorted(
+                    (attribute_name, _value_to_key(value))
+                    for attribute_name, value in vars(simple_event).items()
+                    if attribute_name != "_duration"
+                )
+            ),
+        )
+
+    # ###################################################################### #
+    #                          public properties                             #
+    # ###################################################################### #
+
+    @property
+    def tick_duration(self) -> int:
+        """Duration of the longest track in ticks."""
+        return max(
+            (int(tick_array.sum()) for tick_array in self.tick_array_tuple), default=0
+        )
+
+    @property
+    def duration(self) -> core_parameters.DirectDuration:
+        return core_parameters.DirectDuration(
+            fractions.Fraction(self.tick_duration, self.denominator)
+        )
+
+    # ###################################################################### #
+    #                          public methods                                #
+    # ###################################################################### #
+
+    def get_event_index_tuple_at(
+        self, absolute_time: core_parameters.abc.Duration | typing.Any
+    ) -> tuple[typing.Optional[int], ...]:
+        """Find for each track the index of the event at the given time.
+
+        :param absolute_time: The time where the events shall be found.
+        :type absolute_time: core_parameters.abc.Duration | typing.Any
+        :return: Tuple with one index (or ``None`` if the track is shorter
+            than `absolute_time`) per track.
+        """
+        # All event ends are integer ticks, so an event ends before
+        # 'absolute_time' if it ends before the rounded down tick.
+        tick = math.floor(
+            core_events.configurations.UNKNOWN_OBJECT_TO_DURATION(
+                absolute_time
+            ).duration
+            * self.denominator
+        )
+        index_list = []
+        for tick_array in self.tick_array_tuple:
+            end_array = np.cumsum(tick_array)
+            index = int(np.searchsorted(end_array, tick, side="right"))
+            index_list.append(index if index < len(end_array) else None)
+        return tuple(index_list)
+
+    def split_at(
+        self, absolute_time: core_parameters.abc.Duration | typing.Any
+    ) -> tuple[ArrayClockEvent, ArrayClockEvent]:
+        """Split all tracks at the given time.
+
+        :param absolute_time: Where to split.
+        :type absolute_time: core_parameters.abc.Duration | typing.Any
+
+        An event which starts before and ends after `absolute_time` is
+        split in two events with the same prototype. If `absolute_time`
+        isn't a multiple of ``1 / denominator``, the denominator of the
+        returned events is adjusted. In contrast to
+        :meth:`mutwo.core_events.SimultaneousEvent.split_at` both returned
+        events always have the same tracks, even if some are empty.
+        """
+        absolute_time = core_events.configurations.UNKNOWN_OBJECT_TO_DURATION(
+            absolute_time
+        ).duration
+        event = self._with_denominator(
+            math.lcm(self.denominator, absolute_time.denominator)
+        )
+        tick = int(absolute_time * event.denominator)
+        part_list = ([], [], [], [])
+        for tick_array, prototype_index_array in zip(
+            event.tick_array_tuple, event.prototype_index_array_tuple
+        ):
+            end_array = np.cumsum(tick_array)
+            index = int(np.searchsorted(end_array, tick, side="right"))
+            head_tick_array, tail_tick_array = (
+                tick_array[:index].copy(),
+                tick_array[index:].copy(),
+            )
+            head_prototype_index_array, tail_prototype_index_array = (
+                prototype_index_array[:index],
+                prototype_index_array[index:],
+            )
+            if index < len(end_array) and (
+                (start := end_array[index] - tick_array[index]) < tick
+            ):
+                head_tick_array = np.append(head_tick_array, tick - start)
+                head_prototype_index_array = np.append(
+                    head_prototype_index_array, prototype_index_array[index]
+                )
+                tail_tick_array[0] = end_array[index] - tick
+            for part, array in zip(
+                part_list,
+                (
+                    head_tick_array,
+                    head_prototype_index_array,
+                    tail_tick_array,
+                    tail_prototype_index_array,
+                ),
+            ):
+                part.append(array)
+        return tuple(
+            dataclasses.replace(
+                event,
+                tick_array_tuple=tuple(tick_array_list),
+                prototype_index_array_tuple=tuple(prototype_index_array_list),
+            )
+            for tick_array_list, prototype_index_array_list in (
+                part_list[:2],
+                part_list[2:],
+            )
+        )
+
+    def concatenate(self, other: ArrayClockEvent) -> ArrayClockEvent:
+        """Append other array clock event.
+
+        :param other: The event which shall be appended.
+        :type other: ArrayClockEvent
+        :return: New concatenated event.
+
+        Tracks are matched by tag (or by index if not all tracks of
+        `other` have a tag) similar to
+        :meth:`mutwo.core_events.SimultaneousEvent.concatenate_by_tag`.
+        Shorter tracks are filled with rests. Prototypes of both events
+        with equal keys (see :meth:`get_prototype_key`) are merged, so
+        that repeated concatenations don't add new prototypes. In
+        contrast to the concatenation of :class:`ClockEvent`, tempo
+        envelopes of `other` are ignored.
+        """
+        denominator = math.lcm(self.denominator, other.denominator)
+        event, other = (e._with_denominator(denominator) for e in (self, other))
+
+        key_to_prototype_index, prototype_list = {}, []
+
+        def get_prototype_index(prototype: core_events.SimpleEvent) -> int:
+            key = ArrayClockEvent.get_prototype_key(prototype)
+            try:
+                return key_to_prototype_index[key]
+            except KeyError:
+                prototype_index = key_to_prototype_index[key] = len(prototype_list)
+                prototype_list.append(prototype)
+                return prototype_index
+
+        event_prototype_index_array, other_prototype_index_array = (
+            np.array(
+                [get_prototype_index(prototype) for prototype in e.prototype_tuple],
+                dtype=np.int64,
+            )
+            for e in (event, other)
+        )
+        rest_prototype_index = get_prototype_index(core_events.SimpleEvent(0))
+
+        start = event.tick_duration
+        empty_track_list = list(event.empty_track_tuple)
+        tick_array_list, prototype_index_array_list = [], []
+        for tick_array, prototype_index_array in zip(
+            event.tick_array_tuple, event.prototype_index_array_tuple
+        ):
+            prototype_index_array = event_prototype_index_array[prototype_index_array]
+            if (difference := start - int(tick_array.sum())) > 0:
+                tick_array = np.append(tick_array, difference)
+                prototype_index_array = np.append(
+                    prototype_index_array, rest_prototype_index
+                )
+            tick_array_list.append(tick_array)
+            prototype_index_array_list.append(prototype_index_array)
+
+        for index, (tick_array, prototype_index_array) in enumerate(
+            zip(other.tick_array_tuple, other.prototype_index_array_tuple)
+        ):
+            prototype_index_array = other_prototype_index_array[prototype_index_array]
+            if (track_index := event._get_track_index(other, index)) is None:
+                if start > 0:
+                    tick_array = np.concatenate(((start,), tick_array))
+                    prototype_index_array = np.concatenate(
+                        ((rest_prototype_index,), prototype_index_array)
+                    )
+                empty_track_list.append(other.empty_track_tuple[index])
+                tick_array_list.append(tick_array)
+                prototype_index_array_list.append(prototype_index_array)
+            else:
+                tick_array_list[track_index] = np.concatenate(
+                    (tick_array_list[track_index], tick_array)
+                )
+                prototype_index_array_list[track_index] = np.concatenate(
+                    (prototype_index_array_list[track_index], prototype_index_array)
+                )
+
+        return dataclasses.replace(
+            event,
+            empty_track_tuple=tuple(empty_track_list),
+            tick_array_tuple=tuple(
+                _assert_tick_dtype(tick_array) for tick_array in tick_array_list
+            ),
+            prototype_index_array_tuple=tuple(prototype_index_array_list),
+            prototype_tuple=tuple(prototype_list),
+        )
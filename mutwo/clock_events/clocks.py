@@ -1,13 +1,261 @@
+import math
 import typing
 
+from mutwo import clock_utilities
 from mutwo import core_events
+from mutwo import core_parameters
 from mutwo import clock_events
 
-__all__ = ("ClockEvent",)
+__all__ = (
+    "TagIndexMixin",
+    "ClockEvent",
+    "ControlEvent",
+    "RepeatedSimultaneousEvent",
+)
 
 
-class ClockEvent(core_events.TaggedSimultaneousEvent):
+class TagIndexMixin(object):
+    """Find child events by their tag in constant time.
+
+    The default implementation of :class:`mutwo.core_events.abc.ComplexEvent`
+    scans all child events when accessing an event by its tag. This mixin
+    maintains a dict from tags to indices. The dict is updated when
+    events are appended and rebuilt after any other change of the
+    event list. Like the lookup of
+    :class:`mutwo.core_events.abc.ComplexEvent` (which is used by tag
+    access and by ``concatenate_by_tag``) only the index of the first
+    child with a given tag is kept.
+
+    The mixin must be placed before the complex event class:
+
+    >>> from mutwo import clock_events
+    >>> from mutwo import core_events
+    >>> class MyEvent(clock_events.TagIndexMixin, core_events.SimultaneousEvent):
+    ...     pass
+    """
+
+    # We don't subclass 'ComplexEvent': this would overwrite the
+    # side attributes of the complex event class which is mixed in.
+
+    def _get_tag_to_index(self) -> dict[str, int]:
+        try:
+            tag_to_index = self._tag_to_index_dict
+        except AttributeError:
+            tag_to_index = None
+        if tag_to_index is None:
+            tag_to_index = {}
+            for index, event in enumerate(self):
+                if (tag := getattr(event, "tag", None)) is not None:
+                    tag_to_index.setdefault(tag, index)
+            self._tag_to_index_dict = tag_to_index
+        return tag_to_index
+
+    def _invalidate_tag_to_index(self):
+        self._tag_to_index_dict = None
+
+    def _tag_to_index(self, tag: str) -> int:
+        try:
+            index = self._get_tag_to_index()[tag]
+        except KeyError:
+            pass
+        else:
+            # Tags of child events may have been changed.
+            if getattr(list.__getitem__(self, index), "tag", None) == tag:
+                return index
+            self._invalidate_tag_to_index()
+        return super()._tag_to_index(tag)
+
+    def append(self, event: core_events.abc.Event):
+        super().append(event)
+        if (
+            getattr(self, "_tag_to_index_dict", None) is not None
+            and (tag := getattr(event, "tag", None)) is not None
+        ):
+            self._tag_to_index_dict.setdefault(tag, len(self) - 1)
+
+    def extend(self, event_iterable: typing.Iterable[core_events.abc.Event]):
+        start = len(self)
+        super().extend(event_iterable)
+        if (tag_to_index := getattr(self, "_tag_to_index_dict", None)) is not None:
+            for index in range(start, len(self)):
+                event = list.__getitem__(self, index)
+                if (tag := getattr(event, "tag", None)) is not None:
+                    tag_to_index.setdefault(tag, index)
+
+    def __iadd__(self, event_iterable: typing.Iterable[core_events.abc.Event]):
+        self.extend(event_iterable)
+        return self
+
+    def __setitem__(self, *args, **kwargs):
+        super().__setitem__(*args, **kwargs)
+        self._invalidate_tag_to_index()
+
+    def __delitem__(self, *args, **kwargs):
+        super().__delitem__(*args, **kwargs)
+        self._invalidate_tag_to_index()
+
+    def __imul__(self, *args, **kwargs):
+        self._invalidate_tag_to_index()
+        return super().__imul__(*args, **kwargs)
+
+    def insert(self, *args, **kwargs):
+        super().insert(*args, **kwargs)
+        self._invalidate_tag_to_index()
+
+    def remove(self, *args, **kwargs):
+        super().remove(*args, **kwargs)
+        self._invalidate_tag_to_index()
+
+    def pop(self, *args, **kwargs):
+        self._invalidate_tag_to_index()
+        return super().pop(*args, **kwargs)
+
+    def sort(self, *args, **kwargs):
+        super().sort(*args, **kwargs)
+        self._invalidate_tag_to_index()
+
+    def reverse(self, *args, **kwargs):
+        super().reverse(*args, **kwargs)
+        self._invalidate_tag_to_index()
+
+    def clear(self, *args, **kwargs):
+        super().clear(*args, **kwargs)
+        self._invalidate_tag_to_index()
+
+
+class ClockEvent(TagIndexMixin, core_events.TaggedSimultaneousEvent):
     def __init__(self, *args, tag: typing.Optional[str] = None, **kwargs):
         if tag is None:
             tag = clock_events.configurations.DEFAULT_CLOCK_TAG
         super().__init__(*args, tag=tag, **kwargs)
+
+
+class ControlEvent(TagIndexMixin, core_events.SimultaneousEvent):
+    """Formal structure of a clock event.
+
+    Each child is a :class:`mutwo.core_events.TaggedSequentialEvent`
+    which represents the cycles of one layer of a clock tree.
+    """
+
+
+class RepeatedSimultaneousEvent(object):
+    """Lazy concatenation of repeated simultaneous events.
+
+    :param simultaneous_event_and_repetition_count_sequence: Pairs of
+        a simultaneous event and how often it's repeated. The pairs are
+        played one after another.
+    :type simultaneous_event_and_repetition_count_sequence: typing.Sequence[tuple[core_events.SimultaneousEvent, int]]
+
+    In contrast to concatenating all repetitions to one
+    :class:`mutwo.core_events.SimultaneousEvent`, this only saves each
+    simultaneous event once. Start times of repetitions are calculated
+    when they are needed, and only the slice requested by
+    :meth:`cut_out` is built, so even very long repeated clocks
+    only need the memory of their parts.
+
+    **Example:**
+
+    >>> from mutwo import clock_events
+    >>> from mutwo import core_events
+    >>> s = core_events.SimultaneousEvent(
+    ...     [core_events.SequentialEvent([core_events.SimpleEvent(2)])]
+    ... )
+    >>> r = clock_events.RepeatedSimultaneousEvent(((s, 1000),))
+    >>> r.duration
+    DirectDuration(2000)
+    >>> r.cut_out(1, 4)
+    SimultaneousEvent([SequentialEvent([SimpleEvent(duration = DirectDuration(duration = 1)), SimpleEvent(duration = DirectDuration(duration = 2))])])
+    """
+
+    def __init__(
+        self,
+        simultaneous_event_and_repetition_count_sequence: typing.Sequence[
+            tuple[core_events.SimultaneousEvent, int]
+        ],
+    ):
+        self._part_tuple = tuple(
+            (simultaneous_event, simultaneous_event.duration.duration, repetition_count)
+            for simultaneous_event, repetition_count in simultaneous_event_and_repetition_count_sequence
+        )
+        part_start_list, start = [], 0
+        for _, duration, repetition_count in self._part_tuple:
+            part_start_list.append(start)
+            start += duration * repetition_count
+        self._part_start_tuple = tuple(part_start_list)
+        self._duration = start
+
+    def __len__(self) -> int:
+        return sum(repetition_count for *_, repetition_count in self._part_tuple)
+
+    def __iter__(
+        self,
+    ) -> typing.Iterator[
+        tuple[core_parameters.DirectDuration, core_events.SimultaneousEvent]
+    ]:
+        """Iterate over start time and simultaneous event of each repetition."""
+        for part_start, (simultaneous_event, duration, repetition_count) in zip(
+            self._part_start_tuple, self._part_tuple
+        ):
+            for index in range(repetition_count):
+                yield core_parameters.DirectDuration(
+                    part_start + (duration * index)
+                ), simultaneous_event
+
+    def _get_repetition_tuple(
+        self, start: core_parameters.abc.Duration, end: core_parameters.abc.Duration
+    ) -> tuple[tuple[typing.Any, core_events.SimultaneousEvent], ...]:
+        repetition_list = []
+        for part_start, (simultaneous_event, duration, repetition_count) in zip(
+            self._part_start_tuple, self._part_tuple
+        ):
+            if duration <= 0:
+                continue
+            first_index = max(math.floor((start - part_start) / duration), 0)
+            last_index = min(math.ceil((end - part_start) / duration), repetition_count)
+            for index in range(first_index, last_index):
+                repetition_list.append(
+                    (part_start + (duration * index), simultaneous_event)
+                )
+        return tuple(repetition_list)
+
+    @property
+    def duration(self) -> core_parameters.DirectDuration:
+        return core_parameters.DirectDuration(self._duration)
+
+    def cut_out(
+        self,
+        start: core_parameters.abc.Duration | typing.Any,
+        end: core_parameters.abc.Duration | typing.Any,
+    ) -> core_events.SimultaneousEvent:
+        """Build the slice between `start` and `end`.
+
+        :param start: Absolute start time of the slice.
+        :type start: core_parameters.abc.Duration | typing.Any
+        :param end: Absolute end time of the slice.
+        :type end: core_parameters.abc.Duration | typing.Any
+
+        Only the repetitions which overlap with the slice are copied
+        and concatenated. The tempo envelopes of the returned event are
+        the concatenated tempo envelopes of these repetitions.
+        """
+        start, end = (
+            core_events.configurations.UNKNOWN_OBJECT_TO_DURATION(
+                unknown_object
+            ).duration
+            for unknown_object in (start, end)
+        )
+        if not (repetition_tuple := self._get_repetition_tuple(start, end)):
+            return core_events.SimultaneousEvent()
+        # All repetitions are the same event: without copying each of them
+        # the concatenation would share one leaf in several places and the
+        # cut would shorten all of them at once.
+        simultaneous_event = clock_utilities.concatenate_simultaneous_event_sequence(
+            [
+                repeated_simultaneous_event.copy()
+                for _, repeated_simultaneous_event in repetition_tuple
+            ]
+        )
+        window_start = repetition_tuple[0][0]
+        return simultaneous_event.cut_out(
+            max(start - window_start, 0), min(end, self._duration) - window_start
+        )
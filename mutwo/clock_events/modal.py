@@ -1,11 +1,19 @@
+import copy
 import typing
 
 from mutwo import clock_events
+from mutwo import clock_parameters
 from mutwo import core_events
 from mutwo import core_parameters
 from mutwo import music_parameters
 
-__all__ = ("ModalEvent", "ModalEvent0", "ModalEvent1")
+__all__ = (
+    "ModalEvent",
+    "ModalEvent0",
+    "ModalEvent1",
+    "CompactModalEvent0",
+    "CompactModalEvent1",
+)
 
 
 class ModalEvent(core_events.SimpleEvent):
@@ -24,19 +32,19 @@ class ModalEvent(core_events.SimpleEvent):
 
     @property
     def duration(self):
-        try:
-            return self.clock_event.duration
-        except AttributeError:
+        # Modal events without clock event are common (before a clock
+        # tree is applied), so we avoid raising and catching exceptions.
+        if (clock_event := self.clock_event) is None:
             return 0
+        return clock_event.duration
 
     @duration.setter
     def duration(self, duration: core_parameters.abc.Duration):
+        if (clock_event := self.clock_event) is None:
+            return
         duration = core_events.configurations.UNKNOWN_OBJECT_TO_DURATION(duration)
         if duration > 0:
-            try:
-                self.clock_event.duration = duration
-            except AttributeError:
-                pass
+            clock_event.duration = duration
 
 
 class ModalEvent0(ModalEvent):
@@ -56,3 +64,83 @@ class ModalEvent1(ModalEvent):
     def __init__(self, pitch: music_parameters.abc.Pitch, *args, **kwargs):
         self.pitch = pitch
         super().__init__(*args, **kwargs)
+
+
+class CompactModalEvent0(ModalEvent0):
+    """Memory-lean variant of :class:`ModalEvent0`.
+
+    All parameters are saved in slots and the scale is interned
+    with :func:`mutwo.clock_parameters.intern_scale`, so that all
+    modal events with equal scales share the same read-only scale
+    object.
+    """
+
+    __slots__ = (
+        "start_pitch",
+        "end_pitch",
+        "scale",
+        "clock_event",
+        "control_event",
+        "energy",
+        "_tempo_envelope",
+    )
+
+    def __init__(
+        self,
+        start_pitch: music_parameters.abc.Pitch,
+        end_pitch: music_parameters.abc.Pitch,
+        scale: music_parameters.Scale,
+        *args,
+        **kwargs
+    ):
+        super().__init__(start_pitch, end_pitch, _intern_scale(scale), *args, **kwargs)
+
+    def __deepcopy__(self, memo: dict):
+        return _deepcopy_compact_modal_event(self, memo)
+
+
+class CompactModalEvent1(ModalEvent1):
+    """Memory-lean variant of :class:`ModalEvent1`.
+
+    See :class:`CompactModalEvent0` for more information.
+    """
+
+    __slots__ = (
+        "pitch",
+        "scale",
+        "clock_event",
+        "control_event",
+        "energy",
+        "_tempo_envelope",
+    )
+
+    def __init__(
+        self,
+        pitch: music_parameters.abc.Pitch,
+        scale: music_parameters.Scale,
+        *args,
+        **kwargs
+    ):
+        super().__init__(pitch, _intern_scale(scale), *args, **kwargs)
+
+    def __deepcopy__(self, memo: dict):
+        return _deepcopy_compact_modal_event(self, memo)
+
+
+def _intern_scale(scale: typing.Optional[music_parameters.Scale]):
+    if isinstance(scale, music_parameters.Scale):
+        return clock_parameters.intern_scale(scale)
+    return scale
+
+
+def _deepcopy_compact_modal_event(
+    event: CompactModalEvent0 | CompactModalEvent1, memo: dict
+) -> CompactModalEvent0 | CompactModalEvent1:
+    # Copies keep sharing the interned scale.
+    memo[id(event.scale)] = event.scale
+    new_event = memo[id(event)] = type(event).__new__(type(event))
+    for attribute in type(event).__slots__:
+        setattr(new_event, attribute, copy.deepcopy(getattr(event, attribute), memo))
+    for attribute, value in event.__dict__.items():
+        setattr(new_event, attribute, copy.deepcopy(value, memo))
+    return new_event
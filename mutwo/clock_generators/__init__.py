@@ -1,16 +1,31 @@
-from .abjad import *
 from .clock_chomsky import *
 from .pickers import *
 from .clock_trees import *
 
-from . import abjad
 from . import clock_chomsky
 from . import clock_trees
 from . import pickers
 
 from mutwo import core_utilities
 
-__all__ = core_utilities.get_all(pickers, clock_trees, abjad, clock_chomsky)
+# 'abjad' is slow to import. Notation helpers are only loaded when
+# they are accessed for the first time.
+_ABJAD_NAME_TUPLE = ("make_complex_event_to_abjad_container",)
+
+__all__ = core_utilities.get_all(pickers, clock_trees, clock_chomsky) + _ABJAD_NAME_TUPLE
+
+
+def __getattr__(name: str):
+    if name in _ABJAD_NAME_TUPLE:
+        import importlib
+
+        abjad = importlib.import_module(".abjad", __name__)
+        globals().update({name_: getattr(abjad, name_) for name_ in abjad.__all__})
+        # Force flat structure
+        globals().pop("abjad", None)
+        return globals()[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 # Force flat structure
-del core_utilities, pickers, clock_trees, abjad, clock_chomsky
+del core_utilities, pickers, clock_trees, clock_chomsky
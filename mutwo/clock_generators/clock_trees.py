@@ -3,17 +3,24 @@ import abc
 import dataclasses
 import typing
 
+import numpy as np
 import ranges
 import treelib
 
+from mutwo import clock_events
 from mutwo import clock_generators
 from mutwo import core_events
-from mutwo import core_parameters
 
 
 __all__ = ("ClockLayer", "ClockTree")
 
 
+# Module level function instead of lambda, so that clock trees
+# can be pickled (e.g. to pop them in a process pool).
+def _pick_first_event_count(event_count_tuple: tuple[int, ...]) -> int:
+    return event_count_tuple[0]
+
+
 @dataclasses.dataclass(frozen=True)
 class ClockLayer(abc.ABC):
     """Define layer in a :class:`ClockTree`.
@@ -41,7 +48,7 @@ class ClockLayer(abc.ABC):
     event_count_range: ranges.Range = ranges.Range(1, 2)
     pick_event_count: typing.Callable[
         [tuple[int, ...]], int
-    ] = lambda event_count_tuple: event_count_tuple[0]
+    ] = _pick_first_event_count
 
     # It is necessary to differentiate between SimpleEvent inside
     # a TaggedSequentialEvent inside the control event returned by
@@ -65,7 +72,7 @@ class ClockLayer(abc.ABC):
         self,
     ) -> tuple[
         core_events.SequentialEvent,
-        core_events.SimultaneousEvent[
+        clock_events.ControlEvent[
             core_events.TaggedSequentialEvent[core_events.SimpleEvent]
         ],
     ]:
@@ -91,19 +98,25 @@ class ClockLayer(abc.ABC):
         self.fetch_child.refresh(self.child_tuple)
 
         sequential_event = core_events.SequentialEvent([])
-        control_event = core_events.SimultaneousEvent(
+        control_event = clock_events.ControlEvent(
             [core_events.TaggedSequentialEvent([], tag=self.node.identifier)]
         )
         event_count = self.pick_event_count(  # type: ignore
             tuple(range(self.event_count_range.start, self.event_count_range.end))
         )
 
-        offset = core_parameters.DirectDuration(0)
+        # We track all durations with plain numbers: asking an event for
+        # its duration sums all of its children, which would make each
+        # iteration slower the more events have already been added.
+        sequential_event_duration = offset = 0
+        tag_to_child_sequential_control_event = {}
+        tag_to_child_control_duration = {}
 
         for _ in range(event_count):
 
             if (event := self.fetch_event()) is not None:  # type: ignore
                 sequential_event.append(event)
+                sequential_event_duration += event.duration.duration
 
             if (child_node := self.fetch_child()) is not None:
                 child_clock_event, child_control_event = child_node.data.pop_event()
@@ -111,12 +124,16 @@ class ClockLayer(abc.ABC):
                 sequential_event.extend(child_clock_event)
 
                 for child_sequential_control_event in child_control_event:
+                    tag = child_sequential_control_event.tag
+                    child_control_duration = (
+                        child_sequential_control_event.duration.duration
+                    )
                     try:
-                        control_event[child_sequential_control_event.tag].extend(
+                        tag_to_child_sequential_control_event[tag].extend(
                             child_sequential_control_event
                         )
                     except KeyError:
-                        delay = offset + event.duration
+                        delay = sequential_event_duration
                         if delay > 0:
                             child_sequential_control_event.insert(
                                 0,
@@ -125,19 +142,23 @@ class ClockLayer(abc.ABC):
                                 ),
                             )
                         control_event.append(child_sequential_control_event)
+                        tag_to_child_sequential_control_event[
+                            tag
+                        ] = child_sequential_control_event
+                        tag_to_child_control_duration[tag] = delay
+                    tag_to_child_control_duration[tag] += child_control_duration
 
-            sequential_event_duration = sequential_event.duration
+                sequential_event_duration += child_clock_event.duration.duration
 
-            for child_sequential_control_event in control_event[1:]:
-                difference = (
-                    sequential_event_duration - child_sequential_control_event.duration
-                )
+            for tag, child_control_duration in tag_to_child_control_duration.items():
+                difference = sequential_event_duration - child_control_duration
                 if difference > 0:
-                    child_sequential_control_event.append(
+                    tag_to_child_sequential_control_event[tag].append(
                         core_events.SimpleEvent(difference).set(
                             self.is_active_parameter_name, False
                         )
                     )
+                    tag_to_child_control_duration[tag] = sequential_event_duration
 
             cycle_duration = sequential_event_duration - offset
             control_simple_event = core_events.SimpleEvent(cycle_duration).set(
@@ -171,7 +192,7 @@ class ClockTree(treelib.Tree):
         event_count_range: ranges.Range = ranges.Range(1, 2),
         pick_event_count: typing.Callable[
             [tuple[int, ...]], int
-        ] = lambda event_count_tuple: event_count_tuple[0],
+        ] = _pick_first_event_count,
     ):
         if parent_identifier is None:
             parent = None
@@ -181,3 +202,23 @@ class ClockTree(treelib.Tree):
         node.data = ClockLayer(
             self, node, fetch_event, fetch_child, event_count_range, pick_event_count
         )
+
+    def seed(self, random_seed: int):
+        """Reset the random state of all layers.
+
+        :param random_seed: The seed from which independent seeds for
+            the `fetch_event` and `fetch_child` callables of each layer
+            are derived. Callables without a `seed` method are ignored.
+        :type random_seed: int
+
+        Calling this method with the same seed on two equally built
+        trees ensures that both trees return the same events.
+        """
+        seed_sequence_list = np.random.SeedSequence(random_seed).spawn(len(self))
+        for node, seed_sequence in zip(self.all_nodes_itr(), seed_sequence_list):
+            layer = node.data
+            for pick, layer_random_seed in zip(
+                (layer.fetch_event, layer.fetch_child), seed_sequence.generate_state(2)
+            ):
+                if (seed := getattr(pick, "seed", None)) is not None:
+                    seed(int(layer_random_seed))
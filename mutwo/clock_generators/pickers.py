@@ -29,6 +29,12 @@ class PickSample(abc.ABC):
         if hash(item_tuple) != hash(self._item_tuple_hash):
             self.reset(item_tuple)
 
+    def seed(self, random_seed: int):
+        """Reset the random state of the picker.
+
+        Deterministic pickers ignore this call.
+        """
+
     @abc.abstractmethod
     def __call__(self) -> typing.Any:
         ...
@@ -53,9 +59,12 @@ class PickSampleByCycle(PickSample):
 
 class PickSampleByChoice(PickSample):
     def __init__(self, *args, random_seed: int = 100, **kwargs):
-        self._random = np.random.default_rng(random_seed)
+        self.seed(random_seed)
         super().__init__(*args, **kwargs)
 
+    def seed(self, random_seed: int):
+        self._random = np.random.default_rng(random_seed)
+
     def __eq__(self, other: typing.Any) -> bool:
         return core_utilities.test_if_objects_are_equal_by_parameter_tuple(
             self, other, ("_item_tuple", "_random")
@@ -1,31 +1,216 @@
 from __future__ import annotations
+import bisect
 import dataclasses
+import math
 import typing
 
+from mutwo import core_events
 from mutwo import core_parameters
 from mutwo import clock_events
 from mutwo import timeline_interfaces
 
-
 __all__ = ("ClockLine", "Clock")
 
 
 class ClockLine(timeline_interfaces.TimeLine):
+    """Time line of event placements which belong to a clock event.
+
+    :param clock_event: The clock event of the time line.
+    :type clock_event: clock_events.ClockEvent
+
+    Other arguments are passed to
+    :class:`mutwo.timeline_interfaces.TimeLine`.
+
+    With :meth:`get_event_placement_tuple_at` and
+    :meth:`get_event_placement_tuple_in_range` the event placements
+    which are active at a given time can be found in logarithmic time.
+    The necessary index is built at the first query and rebuilt after
+    an event placement was registered or unregistered. If the start
+    or end of a registered event placement is changed in place, the
+    event placement needs to be unregistered and registered again.
+
+    The duration of the clock event is computed at the first query of
+    :attr:`duration` and cached. If the clock event is changed in
+    place, :meth:`invalidate_duration` needs to be called.
+    """
+
     def __init__(self, clock_event: clock_events.ClockEvent, *args, **kwargs):
         self._clock_event = clock_event
+        self._event_placement_index = None
+        self._clock_event_duration = None
         super().__init__(*args, **kwargs)
 
+    # ###################################################################### #
+    #                          private methods                               #
+    # ###################################################################### #
+
+    def _get_event_placement_index(self) -> _EventPlacementIndex:
+        if self._event_placement_index is None:
+            self._event_placement_index = _EventPlacementIndex(
+                self._event_placement_list
+            )
+        return self._event_placement_index
+
+    def _invalidate_event_placement_index(self):
+        self._event_placement_index = None
+
+    # ###################################################################### #
+    #                          public properties                             #
+    # ###################################################################### #
+
     @property
     def clock_event(self) -> clock_events.ClockEvent:
         return self._clock_event
 
     @property
     def duration(self) -> core_parameters.abc.Duration:
-        return self.clock_event.duration
+        if self._clock_event_duration is None:
+            self._clock_event_duration = self.clock_event.duration.duration
+        # Durations are mutable, so we don't return the cached object.
+        return core_parameters.DirectDuration(self._clock_event_duration)
+
+    # ###################################################################### #
+    #                          public methods                                #
+    # ###################################################################### #
+
+    def invalidate_duration(self):
+        """Forget the cached duration of the clock event.
+
+        Call this method after the clock event has been changed in place.
+        """
+        self._clock_event_duration = None
+
+    def register(self, *args, **kwargs):
+        super().register(*args, **kwargs)
+        self._invalidate_event_placement_index()
+
+    def unregister(self, *args, **kwargs):
+        super().unregister(*args, **kwargs)
+        self._invalidate_event_placement_index()
+
+    def resolve_conflicts(self, *args, **kwargs):
+        try:
+            super().resolve_conflicts(*args, **kwargs)
+        finally:
+            # Conflict resolution strategies may change event
+            # placements in place.
+            self._invalidate_event_placement_index()
+
+    def get_event_placement_tuple_at(
+        self, absolute_time: core_parameters.abc.Duration | typing.Any
+    ) -> tuple[timeline_interfaces.EventPlacement, ...]:
+        """Find all event placements which are active at the given time.
+
+        :param absolute_time: The time at which the event placements
+            are active: they start before or at `absolute_time` and
+            end after `absolute_time`.
+        :type absolute_time: core_parameters.abc.Duration | typing.Any
+        :return: The event placements sorted by their start.
+        """
+        absolute_time = core_events.configurations.UNKNOWN_OBJECT_TO_DURATION(
+            absolute_time
+        ).duration
+        index = self._get_event_placement_index()
+        return index.get_event_placement_tuple(
+            bisect.bisect_right(index.start_tuple, absolute_time), absolute_time
+        )
+
+    def get_event_placement_tuple_in_range(
+        self,
+        start: core_parameters.abc.Duration | typing.Any,
+        end: core_parameters.abc.Duration | typing.Any,
+    ) -> tuple[timeline_interfaces.EventPlacement, ...]:
+        """Find all event placements which overlap with the given range.
+
+        :param start: Absolute start time of the range.
+        :type start: core_parameters.abc.Duration | typing.Any
+        :param end: Absolute end time of the range (excluded).
+        :type end: core_parameters.abc.Duration | typing.Any
+        :return: The event placements sorted by their start.
+        """
+        start, end = (
+            core_events.configurations.UNKNOWN_OBJECT_TO_DURATION(
+                unknown_object
+            ).duration
+            for unknown_object in (start, end)
+        )
+        index = self._get_event_placement_index()
+        return index.get_event_placement_tuple(
+            bisect.bisect_left(index.start_tuple, end), start
+        )
+
+
+class _EventPlacementIndex(object):
+    """Static index of event placements sorted by their start.
+
+    Ends are saved in a binary tree in which each node knows the maximum
+    end of its leaves. So all event placements before a given position
+    which end after a given time can be found in O((k + 1) * log(n))
+    (k = count of found event placements).
+    """
+
+    def __init__(self, event_placement_sequence: typing.Sequence):
+        event_placement_and_range_list = sorted(
+            (
+                (
+                    event_placement,
+                    event_placement.min_start.duration,
+                    event_placement.max_end.duration,
+                )
+                for event_placement in event_placement_sequence
+            ),
+            key=lambda event_placement_and_range: event_placement_and_range[1],
+        )
+        self.event_placement_tuple = tuple(
+            event_placement for event_placement, *_ in event_placement_and_range_list
+        )
+        self.start_tuple = tuple(
+            start for _, start, _ in event_placement_and_range_list
+        )
+        leaf_count = 1
+        while leaf_count < len(self.event_placement_tuple):
+            leaf_count *= 2
+        self._leaf_count = leaf_count
+        # Node 'i' has the children '2i' and '2i + 1', leaves start at
+        # 'leaf_count'. Unused leaves never end after anything.
+        max_end_list = [-math.inf] * (2 * leaf_count)
+        for leaf_index, (*_, end) in enumerate(event_placement_and_range_list):
+            max_end_list[leaf_count + leaf_index] = end
+        for node_index in range(leaf_count - 1, 0, -1):
+            max_end_list[node_index] = max(
+                max_end_list[2 * node_index], max_end_list[2 * node_index + 1]
+            )
+        self._max_end_tuple = tuple(max_end_list)
+
+    def get_event_placement_tuple(
+        self, stop: int, minimal_end: typing.Any
+    ) -> tuple[timeline_interfaces.EventPlacement, ...]:
+        """Return event placements before `stop` which end after `minimal_end`."""
+        leaf_index_list = []
+        # Stack of nodes with their first and last (excluded) leaf.
+        node_stack = [(1, 0, self._leaf_count)]
+        while node_stack:
+            node_index, first_leaf, last_leaf = node_stack.pop()
+            if first_leaf >= stop or self._max_end_tuple[node_index] <= minimal_end:
+                continue
+            if node_index >= self._leaf_count:
+                leaf_index_list.append(first_leaf)
+                continue
+            middle_leaf = (first_leaf + last_leaf) // 2
+            # Right child first, so that leaves are popped in order.
+            node_stack.append((2 * node_index + 1, middle_leaf, last_leaf))
+            node_stack.append((2 * node_index, first_leaf, middle_leaf))
+        return tuple(self.event_placement_tuple[index] for index in leaf_index_list)
 
 
 @dataclasses.dataclass(frozen=True)
 class Clock(object):
+    """Main clock line with an optional start and end clock line.
+
+    :attr:`duration` reuses the cached durations of the clock lines
+    (see :meth:`ClockLine.invalidate_duration`).
+    """
+
     main_clock_line: ClockLine
     start_clock_line: typing.Optional[ClockLine] = None
     end_clock_line: typing.Optional[ClockLine] = None
@@ -47,3 +232,81 @@ class Clock(object):
                 ]
             )
         )
+
+    def invalidate_duration(self):
+        """Forget the cached durations of all clock lines.
+
+        Call this method after a clock event has been changed in place.
+        """
+        for clock_line in self.clock_line_tuple:
+            if clock_line is not None:
+                clock_line.invalidate_duration()
+
+    def get_clock_line_window_tuple(
+        self,
+        start: core_parameters.abc.Duration | typing.Any,
+        end: core_parameters.abc.Duration | typing.Any,
+        repetition_count: int = 1,
+    ) -> tuple[tuple[ClockLine, typing.Any, typing.Any, typing.Any], ...]:
+        """Find all clock lines which overlap with the given window.
+
+        :param start: Absolute start time of the window.
+        :type start: core_parameters.abc.Duration | typing.Any
+        :param end: Absolute end time of the window.
+        :type end: core_parameters.abc.Duration | typing.Any
+        :param repetition_count: How often the main clock line is repeated.
+            Default to 1.
+        :type repetition_count: int
+        :return: For each (repetition of a) clock line which overlaps with
+            the window a tuple of the clock line, its absolute start time
+            and start and end of the window relative to the clock line.
+
+        **Example:**
+
+        >>> from mutwo import clock_events
+        >>> from mutwo import clock_interfaces
+        >>> from mutwo import core_events
+        >>> clock_line = clock_interfaces.ClockLine(
+        ...     clock_events.ClockEvent(
+        ...         [core_events.SequentialEvent([core_events.SimpleEvent(4)])]
+        ...     )
+        ... )
+        >>> clock = clock_interfaces.Clock(clock_line)
+        >>> for window in clock.get_clock_line_window_tuple(3, 6, 3):
+        ...     print(window[1:])
+        (Fraction(0, 1), Fraction(3, 1), Fraction(4, 1))
+        (Fraction(4, 1), 0, Fraction(2, 1))
+        """
+        start, end = (
+            core_events.configurations.UNKNOWN_OBJECT_TO_DURATION(
+                unknown_object
+            ).duration
+            for unknown_object in (start, end)
+        )
+        window_list, clock_line_start = [], 0
+        for clock_line_repetition_count, clock_line in (
+            (1, self.start_clock_line),
+            (repetition_count, self.main_clock_line),
+            (1, self.end_clock_line),
+        ):
+            if clock_line is None:
+                continue
+            duration = clock_line.duration.duration
+            if duration > 0:
+                first_index = max(math.floor((start - clock_line_start) / duration), 0)
+                last_index = min(
+                    math.ceil((end - clock_line_start) / duration),
+                    clock_line_repetition_count,
+                )
+                for index in range(first_index, last_index):
+                    repetition_start = clock_line_start + (duration * index)
+                    window_list.append(
+                        (
+                            clock_line,
+                            repetition_start,
+                            max(start - repetition_start, 0),
+                            min(end - repetition_start, duration),
+                        )
+                    )
+            clock_line_start += duration * clock_line_repetition_count
+        return tuple(window_list)
@@ -1,3 +1,5 @@
+from . import configurations
+
 from .music_patches import *
 
 # Cleanup
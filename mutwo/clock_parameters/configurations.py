@@ -0,0 +1,4 @@
+SCALE_INTERSECTION_CACHE_SIZE = 256
+"""How many intersections of scale pairs are memorized by
+:meth:`mutwo.music_parameters.Scale.intersection`. Set to 0
+to disable the cache."""
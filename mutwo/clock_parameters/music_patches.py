@@ -1,40 +1,211 @@
 # TODO(Move to mutwo.music)
 
+import collections
+import copy
+import typing
+import weakref
+
+from mutwo import clock_parameters
 from mutwo import music_parameters
 
+__all__ = ("ScaleFamily_intersection", "Scale_intersection", "intern_scale")
+
 if 1:
 
+    def _parameter_to_key(parameter: typing.Any, value_name: str) -> typing.Hashable:
+        # Pitches and pitch intervals aren't hashable. But if they aren't
+        # rounded, they are equal if their frequencies or intervals are
+        # equal, so these values can be used for hash based membership
+        # tests.
+        return getattr(parameter, value_name)
+
+    def _pitch_to_key(pitch: music_parameters.abc.Pitch) -> typing.Hashable:
+        return _parameter_to_key(pitch, "frequency")
+
+    def _pitch_interval_to_key(
+        pitch_interval: music_parameters.abc.PitchInterval,
+    ) -> typing.Hashable:
+        return _parameter_to_key(pitch_interval, "interval")
+
+    def _is_rounded(parameter_iterable: typing.Iterable[typing.Any]) -> bool:
+        # Rounded parameters are compared by the number of digits of
+        # the left operand, so hash based membership tests could differ
+        # from '=='.
+        return any(
+            getattr(parameter, "digit_to_round_to_count", None)
+            for parameter in parameter_iterable
+        )
+
+    def _scale_to_key(scale: music_parameters.Scale) -> typing.Hashable:
+        # Contains all values which are compared by 'Scale.__eq__' and
+        # the types, so that only equal scales of the same structure
+        # share a key.
+        scale_family = scale.scale_family
+        return (
+            type(scale.tonic),
+            _pitch_to_key(scale.tonic),
+            type(scale_family),
+            tuple(
+                (type(interval), _pitch_interval_to_key(interval))
+                for interval in scale_family.interval_tuple
+            ),
+            scale_family.weight_tuple,
+            scale_family.scale_degree_tuple,
+            scale_family.period_repetition_count_tuple,
+        )
+
+    class _InternedScale(music_parameters.Scale):
+        """Read-only copy of a scale which is returned by :func:`intern_scale`."""
+
+        def __init__(self, scale: music_parameters.Scale):
+            super().__init__(
+                copy.deepcopy(scale.tonic), copy.deepcopy(scale.scale_family)
+            )
+            self._is_frozen = True
+
+        def __setattr__(self, name: str, value: typing.Any):
+            if getattr(self, "_is_frozen", False):
+                raise AttributeError(f"Can't set '{name}': interned scales are frozen.")
+            super().__setattr__(name, value)
+
+        def __delattr__(self, name: str):
+            if getattr(self, "_is_frozen", False):
+                raise AttributeError(
+                    f"Can't delete '{name}': interned scales are frozen."
+                )
+            super().__delattr__(name)
+
+    _scale_key_pair_to_intersection_index_tuple = collections.OrderedDict()
+
+    _scale_key_to_interned_scale = weakref.WeakValueDictionary()
+
+    def intern_scale(scale: music_parameters.Scale) -> music_parameters.Scale:
+        """Return a shared read-only scale which is equal to the given scale.
+
+        :param scale: The scale which shall be interned.
+        :type scale: music_parameters.Scale
+
+        Each :class:`mutwo.music_parameters.Scale` keeps all its pitches,
+        so long modal sequences in which each event holds its own copy
+        of an equal scale need a lot of memory. The interned scale is
+        a copy of the first scale which has been interned and it is
+        only kept as long as it is referenced anywhere else. Because it
+        is shared, its tonic and scale family can't be set. Its pitches
+        and intervals mustn't be mutated in place. Scales with rounded
+        pitches or intervals are returned unchanged.
+
+        **Example:**
+
+        >>> from mutwo import clock_parameters
+        >>> from mutwo import music_parameters
+        >>> def make_scale():
+        ...     return music_parameters.Scale(
+        ...         music_parameters.WesternPitch("c"),
+        ...         music_parameters.ScaleFamily(
+        ...             [music_parameters.WesternPitchInterval("p1")]
+        ...         ),
+        ...     )
+        >>> scale = clock_parameters.intern_scale(make_scale())
+        >>> clock_parameters.intern_scale(make_scale()) is scale
+        True
+        """
+        if isinstance(scale, _InternedScale):
+            return scale
+        if _is_rounded((scale.tonic,) + scale.scale_family.interval_tuple):
+            return scale
+        key = _scale_to_key(scale)
+        try:
+            return _scale_key_to_interned_scale[key]
+        except KeyError:
+            interned_scale = _scale_key_to_interned_scale[key] = _InternedScale(scale)
+            return interned_scale
+
     def ScaleFamily_intersection(
         self, other: music_parameters.ScaleFamily
     ) -> music_parameters.ScaleFamily:
         data = [[], [], [], []]
+        if _is_rounded(self.interval_tuple + other.interval_tuple):
+            other_interval_tuple = other.interval_tuple
+
+            def is_in_other(interval):
+                return interval in other_interval_tuple
+
+        else:
+            other_interval_key_set = set(
+                map(_pitch_interval_to_key, other.interval_tuple)
+            )
+
+            def is_in_other(interval):
+                return _pitch_interval_to_key(interval) in other_interval_key_set
+
         for content in zip(
             self.interval_tuple,
             self.weight_tuple,
             self.scale_degree_tuple,
             self.period_repetition_count_tuple,
         ):
-            if content[0] in other.interval_tuple:  # content[0] == interval
+            if is_in_other(content[0]):  # content[0] == interval
                 for item, list_ in zip(content, data):
                     list_.append(item)
         return music_parameters.ScaleFamily(*data)
 
     music_parameters.ScaleFamily.intersection = ScaleFamily_intersection
 
+    def _get_intersection_index_tuple(
+        pitch_tuple: tuple[music_parameters.abc.Pitch, ...],
+        other_pitch_tuple: tuple[music_parameters.abc.Pitch, ...],
+    ) -> tuple[int, ...]:
+        other_pitch_key_set = set(map(_pitch_to_key, other_pitch_tuple))
+        return tuple(
+            index
+            for index, pitch in enumerate(pitch_tuple)
+            if _pitch_to_key(pitch) in other_pitch_key_set
+        )
+
     def Scale_intersection(
         self, other: music_parameters.Scale
     ) -> music_parameters.Scale:
-        data = [[], [], [], []]
-        for pitch, *content in zip(
-            self.pitch_tuple,
-            self.scale_family.interval_tuple,
-            self.weight_tuple,
-            self.scale_degree_tuple,
-            self.period_repetition_count_tuple,
-        ):
-            if pitch in other.pitch_tuple:
-                for item, list_ in zip(content, data):
-                    list_.append(item)
-        return music_parameters.Scale(self.tonic, music_parameters.ScaleFamily(*data))
+        pitch_tuple, other_pitch_tuple = self.pitch_tuple, other.pitch_tuple
+        cache_size = clock_parameters.configurations.SCALE_INTERSECTION_CACHE_SIZE
+        if _is_rounded(pitch_tuple + other_pitch_tuple):
+            index_tuple = tuple(
+                index
+                for index, pitch in enumerate(pitch_tuple)
+                if pitch in other_pitch_tuple
+            )
+        elif cache_size <= 0:
+            index_tuple = _get_intersection_index_tuple(pitch_tuple, other_pitch_tuple)
+        else:
+            # Modal sequences often intersect the same scales again and
+            # again. We only cache which pitches are kept: the returned
+            # scale is always new, so it can't change any cache entry.
+            key = (_scale_to_key(self), _scale_to_key(other))
+            cache = _scale_key_pair_to_intersection_index_tuple
+            try:
+                index_tuple = cache[key]
+            except KeyError:
+                index_tuple = cache[key] = _get_intersection_index_tuple(
+                    pitch_tuple, other_pitch_tuple
+                )
+                while len(cache) > cache_size:
+                    cache.popitem(last=False)
+            else:
+                cache.move_to_end(key)
+
+        scale_family = self.scale_family
+        return music_parameters.Scale(
+            self.tonic,
+            music_parameters.ScaleFamily(
+                *(
+                    [tuple_[index] for index in index_tuple]
+                    for tuple_ in (
+                        scale_family.interval_tuple,
+                        scale_family.weight_tuple,
+                        scale_family.scale_degree_tuple,
+                        scale_family.period_repetition_count_tuple,
+                    )
+                )
+            ),
+        )
 
     music_parameters.Scale.intersection = Scale_intersection
@@ -1,8 +1,12 @@
 from .exceptions import *
+from .profiling import *
+from .tools import *
 
-from . import exceptions
+from . import exceptions, profiling, tools
 
-__all__ = exceptions.__all__
+from mutwo import core_utilities
+
+__all__ = core_utilities.get_all(exceptions, profiling, tools)
 
 # Force flat structure
-del exceptions
+del core_utilities, exceptions, profiling, tools
@@ -1,4 +1,8 @@
-__all__ = ("UndefinedConverterForTagWarning", "BadStaffCountWarning")
+__all__ = (
+    "UndefinedConverterForTagWarning",
+    "BadStaffCountWarning",
+    "UnpicklableTaskError",
+)
 
 
 class UndefinedConverterForTagWarning(Warning):
@@ -17,3 +21,13 @@ class BadStaffCountWarning(Warning):
             "looking notation, please use the same sequential event count in "
             "each event placement!"
         )
+
+
+class UnpicklableTaskError(TypeError):
+    def __init__(self, executor_name: str, error: Exception):
+        super().__init__(
+            f"'{executor_name}' needs picklable functions, arguments and "
+            f"results, but: {error}. Most mutwo music objects (e.g. "
+            "pitches, scales or note likes) can't be pickled. Please run "
+            "the conversion without an executor or with a thread pool."
+        )
@@ -0,0 +1,233 @@
+"""Opt-in profiling of clock converters and clock layers.
+
+The hooks are only installed while a :class:`Profiler` is active,
+so there is no overhead if no profiler is used.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import functools
+import json
+import sys
+import time
+import tracemalloc
+import types
+import typing
+
+__all__ = ("CallStatistic", "Profiler")
+
+
+@dataclasses.dataclass
+class CallStatistic(object):
+    """Measurements of all calls of one method.
+
+    :param call_count: How often the method was called.
+    :param wall_time: Summed wall time of all calls in seconds
+        (including the time spent in nested profiled calls).
+    :param allocated_memory: Summed difference of traced memory
+        in bytes between the start and the end of each call. It's
+        always 0 if the :class:`Profiler` doesn't trace memory.
+    """
+
+    call_count: int = 0
+    wall_time: float = 0
+    allocated_memory: int = 0
+
+
+class Profiler(object):
+    """Record call count, wall time and memory of clock converters.
+
+    :param trace_memory: If ``True`` memory allocations are measured
+        with :mod:`tracemalloc`. This slows down all code which runs
+        while the profiler is active. Default to ``True``.
+    :type trace_memory: bool
+
+    The profiler measures the `convert` method of each converter in
+    :mod:`mutwo.clock_converters` and
+    :meth:`mutwo.clock_generators.ClockLayer.pop_event`. The profiler
+    doesn't import :mod:`abjad`: notation converters which are loaded
+    while the profiler is active are measured from then on (see
+    :meth:`add_module`).
+
+    **Example:**
+
+    >>> from mutwo import clock_utilities
+    >>> with clock_utilities.Profiler() as profiler:
+    ...     pass  # run converters here
+    >>> report = profiler.report()
+    """
+
+    # Profilers which have been entered, but not exited yet.
+    _active_profiler_list: list[Profiler] = []
+
+    def __init__(self, trace_memory: bool = True):
+        self._trace_memory = trace_memory
+        self._name_to_call_statistic: dict[str, CallStatistic] = {}
+        self._original_method_list: list[tuple[type, str, typing.Callable]] = []
+        self._active_call_set: set[tuple[int, str]] = set([])
+        self._is_tracemalloc_owner = False
+
+    def __enter__(self) -> Profiler:
+        if self._trace_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._is_tracemalloc_owner = True
+        self._patch(self._get_target_tuple())
+        Profiler._active_profiler_list.append(self)
+        return self
+
+    def __exit__(self, *_):
+        Profiler._active_profiler_list.remove(self)
+        for cls, method_name, method in reversed(self._original_method_list):
+            setattr(cls, method_name, method)
+        self._original_method_list.clear()
+        if self._is_tracemalloc_owner:
+            tracemalloc.stop()
+            self._is_tracemalloc_owner = False
+
+    # ###################################################################### #
+    #                          private methods                               #
+    # ###################################################################### #
+
+    @staticmethod
+    def _get_converter_target_list(module: types.ModuleType) -> list[tuple[type, str]]:
+        # Import in method to avoid circular import error
+        # (clock converters import clock utilities).
+        from mutwo import core_converters
+
+        target_list = []
+        for name in module.__all__:
+            # Lazily loaded names aren't in the namespace of the module
+            # yet, and 'getattr' would load them.
+            cls = vars(module).get(name, None)
+            if (
+                isinstance(cls, type)
+                and issubclass(cls, core_converters.abc.Converter)
+                and "convert" in cls.__dict__
+            ):
+                target_list.append((cls, "convert"))
+        return target_list
+
+    @staticmethod
+    def _get_target_tuple() -> tuple[tuple[type, str], ...]:
+        from mutwo import clock_converters
+        from mutwo import clock_generators
+
+        target_list = [(clock_generators.ClockLayer, "pop_event")]
+        target_list.extend(Profiler._get_converter_target_list(clock_converters))
+        # Maybe the notation converters have been imported directly.
+        if (
+            abjad_module := sys.modules.get(f"{clock_converters.__name__}.abjad")
+        ) is not None:
+            target_list.extend(Profiler._get_converter_target_list(abjad_module))
+        return tuple(target_list)
+
+    def _patch(self, target_sequence: typing.Sequence[tuple[type, str]]):
+        patched_target_set = set(
+            (cls, method_name) for cls, method_name, _ in self._original_method_list
+        )
+        for cls, method_name in target_sequence:
+            if (cls, method_name) in patched_target_set:
+                continue
+            patched_target_set.add((cls, method_name))
+            method = cls.__dict__[method_name]
+            self._original_method_list.append((cls, method_name, method))
+            setattr(cls, method_name, self._wrap(method))
+
+    def _wrap(self, method: typing.Callable) -> typing.Callable:
+        method_name = method.__name__
+
+        @functools.wraps(method)
+        def wrapped_method(self_, *args, **kwargs):
+            # Don't count a call twice if a profiled method calls the
+            # profiled method of its parent class.
+            call = (id(self_), method_name)
+            if call in self._active_call_set:
+                return method(self_, *args, **kwargs)
+            self._active_call_set.add(call)
+            if is_tracing := tracemalloc.is_tracing():
+                memory_before, _ = tracemalloc.get_traced_memory()
+            start = time.perf_counter()
+            try:
+                return method(self_, *args, **kwargs)
+            finally:
+                wall_time = time.perf_counter() - start
+                self._active_call_set.discard(call)
+                call_statistic = self._name_to_call_statistic.setdefault(
+                    f"{type(self_).__name__}.{method_name}", CallStatistic()
+                )
+                call_statistic.call_count += 1
+                call_statistic.wall_time += wall_time
+                if is_tracing:
+                    memory_after, _ = tracemalloc.get_traced_memory()
+                    call_statistic.allocated_memory += memory_after - memory_before
+
+        return wrapped_method
+
+    # ###################################################################### #
+    #                          public properties                             #
+    # ###################################################################### #
+
+    @property
+    def name_to_call_statistic(self) -> dict[str, CallStatistic]:
+        """Measurements of all methods which have been called, sorted by wall time."""
+        return dict(
+            sorted(
+                self._name_to_call_statistic.items(),
+                key=lambda name_and_call_statistic: name_and_call_statistic[
+                    1
+                ].wall_time,
+                reverse=True,
+            )
+        )
+
+    # ###################################################################### #
+    #                          public methods                                #
+    # ###################################################################### #
+
+    @staticmethod
+    def add_module(module: types.ModuleType):
+        """Measure the converters of a lazily loaded module.
+
+        :param module: The module which has been loaded.
+        :type module: types.ModuleType
+
+        All active profilers measure the converters of `module` from now
+        on. :mod:`mutwo.clock_converters` calls this function after it
+        loaded its notation converters.
+        """
+        target_list = Profiler._get_converter_target_list(module)
+        for profiler in Profiler._active_profiler_list:
+            profiler._patch(target_list)
+
+    def reset(self):
+        """Forget all measurements."""
+        self._name_to_call_statistic.clear()
+
+    def report(self) -> str:
+        """Return human readable table of all measurements."""
+        name_to_call_statistic = self.name_to_call_statistic
+        name_width = max((len(name) for name in name_to_call_statistic), default=0)
+        line_list = [
+            f"{'name':<{name_width}}  {'calls':>8}  {'wall time [s]':>14}  "
+            f"{'memory [KiB]':>14}"
+        ]
+        for name, call_statistic in name_to_call_statistic.items():
+            line_list.append(
+                f"{name:<{name_width}}  {call_statistic.call_count:>8}  "
+                f"{call_statistic.wall_time:>14.6f}  "
+                f"{call_statistic.allocated_memory / 1024:>14.1f}"
+            )
+        return "\n".join(line_list)
+
+    def export(self, path: str):
+        """Write all measurements as JSON to `path`."""
+        with open(path, "w") as f:
+            json.dump(
+                {
+                    name: dataclasses.asdict(call_statistic)
+                    for name, call_statistic in self.name_to_call_statistic.items()
+                },
+                f,
+                indent=2,
+            )
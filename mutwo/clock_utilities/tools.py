@@ -0,0 +1,522 @@
+"""Generic utility functions."""
+
+from __future__ import annotations
+
+import bisect
+import concurrent.futures
+import copy
+import itertools
+import pickle
+import typing
+
+import quicktions as fractions
+
+from mutwo import clock_utilities
+from mutwo import core_events
+from mutwo import core_parameters
+from mutwo import core_utilities
+
+
+__all__ = (
+    "concatenate_simultaneous_event_sequence",
+    "split_simultaneous_event_sequence_in_half",
+    "cut_out_simultaneous_event",
+    "shallow_copy_event",
+    "materialize_event",
+    "map_in_executor",
+)
+
+
+class _EventConcatenation(object):
+    """Concatenation of one track (or a nested group of tracks).
+
+    It tracks the duration of its event, so that the duration
+    doesn't need to be recalculated for each concatenation. The tempo
+    envelope is saved in segments and only the last segment is adjusted
+    when concatenating, because the duration of an envelope is
+    expensive to calculate.
+    """
+
+    def __init__(self, event: core_events.abc.Event):
+        # We never change the given event.
+        self.child_list: typing.Optional[list[_EventConcatenation]] = None
+        match event:
+            case core_events.SequentialEvent():
+                self.event = event.empty_copy()
+                self.event.extend(event)
+                self.duration = event.duration
+            case core_events.SimultaneousEvent():
+                self.event = event.empty_copy()
+                self.child_list = [_EventConcatenation(child) for child in event]
+                self.tag_to_child = {}
+                for child in self.child_list:
+                    if (tag := getattr(child.event, "tag", None)) is not None:
+                        self.tag_to_child.setdefault(tag, child)
+                self.duration = max(
+                    (child.duration for child in self.child_list),
+                    default=core_parameters.DirectDuration(0),
+                )
+            case _:
+                self.event = event.copy()
+                self.duration = event.duration
+        if self.is_complex:
+            self.tempo_envelope_list = [event.tempo_envelope.copy()]
+            self.tempo_envelope_start = 0
+
+    @property
+    def is_complex(self) -> bool:
+        return isinstance(self.event, core_events.abc.ComplexEvent)
+
+    def _concatenate_tempo_envelope(
+        self, event: core_events.abc.ComplexEvent, start: core_parameters.abc.Duration
+    ):
+        # Equal to 'ComplexEvent._concatenate_tempo_envelope', but
+        # we only adjust the last segment of the tempo envelope.
+        tempo_envelope = self.tempo_envelope_list[-1]
+        duration = start - self.tempo_envelope_start
+        if duration < (tempo_envelope_duration := tempo_envelope.duration):
+            # Rare case: cutting out changes the start of the envelope,
+            # so we need to operate on the complete envelope.
+            tempo_envelope = self.get_tempo_envelope()
+            tempo_envelope.cut_out(0, start)
+            self.tempo_envelope_list = [tempo_envelope]
+        elif duration > tempo_envelope_duration:
+            tempo_envelope.extend_until(duration)
+        self.tempo_envelope_list.append(event.tempo_envelope.copy())
+        self.tempo_envelope_start = start
+
+    def get_tempo_envelope(self) -> core_events.TempoEnvelope:
+        tempo_envelope = self.tempo_envelope_list[0]
+        for tempo_envelope_segment in self.tempo_envelope_list[1:]:
+            tempo_envelope.extend(tempo_envelope_segment)
+        return tempo_envelope
+
+    def get_child(
+        self, tag_or_index: str | int
+    ) -> typing.Optional[_EventConcatenation]:
+        if isinstance(tag_or_index, str):
+            return self.tag_to_child.get(tag_or_index, None)
+        try:
+            return self.child_list[tag_or_index]
+        except IndexError:
+            return None
+
+    def append_child(self, child: _EventConcatenation):
+        self.child_list.append(child)
+        if (tag := getattr(child.event, "tag", None)) is not None:
+            self.tag_to_child.setdefault(tag, child)
+
+    def extend_until(self, duration: core_parameters.abc.Duration):
+        if self.child_list is not None:
+            if not self.child_list:
+                raise core_utilities.IneffectiveExtendUntilError(self.event)
+            for child in self.child_list:
+                child.extend_until(duration)
+        elif (difference := duration - self.duration) > 0:
+            if self.is_complex:
+                self.event.append(
+                    core_events.configurations.DEFAULT_DURATION_TO_WHITE_SPACE(
+                        difference
+                    )
+                )
+            else:
+                self.event.duration += difference
+        else:
+            return
+        self.duration = duration
+
+    def slide_in(self, white_space: core_events.SimpleEvent):
+        if self.child_list is not None:
+            for child in self.child_list:
+                child.slide_in(white_space)
+        elif self.is_complex:
+            self.event.insert(0, white_space)
+        else:
+            raise core_utilities.ImpossibleToSlideInError(self.event, white_space)
+        self.duration += white_space.duration
+
+    def concatenate(
+        self, event: core_events.abc.Event, start: core_parameters.abc.Duration
+    ):
+        if not self.is_complex:
+            raise core_utilities.ConcatenationError(self.event, event)
+        self._concatenate_tempo_envelope(event, start)
+        if self.child_list is not None:
+            self.concatenate_child_sequence(event, start)
+        else:
+            self.event.extend(event)
+            self.duration = start + event.duration
+
+    def concatenate_child_sequence(
+        self,
+        simultaneous_event: core_events.SimultaneousEvent,
+        start: core_parameters.abc.Duration,
+    ):
+        is_tagged = all(hasattr(event, "tag") for event in simultaneous_event)
+        for index, event in enumerate(simultaneous_event):
+            if (
+                ancestor := self.get_child(event.tag if is_tagged else index)
+            ) is not None:
+                ancestor.concatenate(event, start)
+            else:
+                child = _EventConcatenation(event)
+                if start > 0:
+                    child.slide_in(core_events.SimpleEvent(start))
+                self.append_child(child)
+        self.duration = max(
+            (child.duration for child in self.child_list),
+            default=core_parameters.DirectDuration(0),
+        )
+
+    def get_event(self) -> core_events.abc.Event:
+        if self.is_complex:
+            self.event.tempo_envelope = self.get_tempo_envelope()
+        if self.child_list is not None:
+            self.event.extend([child.get_event() for child in self.child_list])
+        return self.event
+
+
+def concatenate_simultaneous_event_sequence(
+    simultaneous_event_sequence: typing.Sequence[core_events.SimultaneousEvent],
+) -> core_events.SimultaneousEvent:
+    """Concatenate simultaneous events along their tags or indices.
+
+    :param simultaneous_event_sequence: The simultaneous events which
+        shall be concatenated.
+    :type simultaneous_event_sequence: typing.Sequence[core_events.SimultaneousEvent]
+    :return: New simultaneous event of the same type as the first event.
+
+    The result is equal to successively calling
+    :meth:`mutwo.core_events.SimultaneousEvent.concatenate_by_tag` (or
+    :meth:`mutwo.core_events.SimultaneousEvent.concatenate_by_index` if
+    not all children of an event have a tag) on a copy of the first
+    event. But durations are only calculated once for each event, so
+    the runtime grows linear with the number of events. The given
+    events aren't changed, but the new event shares the leaves of the
+    given events.
+
+    **Example:**
+
+    >>> from mutwo import clock_utilities
+    >>> from mutwo import core_events
+    >>> s = core_events.SimultaneousEvent(
+    ...     [core_events.TaggedSequentialEvent([core_events.SimpleEvent(1)], tag="a")]
+    ... )
+    >>> clock_utilities.concatenate_simultaneous_event_sequence([s, s, s])
+    SimultaneousEvent([TaggedSequentialEvent([SimpleEvent(duration = DirectDuration(duration = 1)), SimpleEvent(duration = DirectDuration(duration = 1)), SimpleEvent(duration = DirectDuration(duration = 1))])])
+    """
+    if not simultaneous_event_sequence:
+        return core_events.SimultaneousEvent()
+    concatenation = _EventConcatenation(simultaneous_event_sequence[0].empty_copy())
+    for simultaneous_event in simultaneous_event_sequence:
+        if (start := concatenation.duration) > 0:
+            concatenation.extend_until(start)
+        concatenation.concatenate_child_sequence(simultaneous_event, start)
+    return concatenation.get_event()
+
+
+def _get_end_list(
+    sequential_event: core_events.SequentialEvent,
+) -> typing.Optional[list]:
+    # Return end times of all children of a sequential event which
+    # only contains simple events (otherwise 'None').
+    duration_list = []
+    for event in sequential_event:
+        if not isinstance(event, core_events.SimpleEvent):
+            return None
+        duration_list.append(event.duration.duration)
+    return list(itertools.accumulate(duration_list))
+
+
+def _split_simultaneous_event_in_half(
+    simultaneous_event: core_events.SimultaneousEvent, share_event: bool
+) -> tuple[core_events.SimultaneousEvent, ...]:
+    end_list_list = []
+    for sequential_event in simultaneous_event:
+        if (
+            not isinstance(sequential_event, core_events.SequentialEvent)
+            or (end_list := _get_end_list(sequential_event)) is None
+        ):
+            # Rare case: nested events. We use the slow, but generic
+            # implementation of mutwo.core.
+            return simultaneous_event.split_at(simultaneous_event.duration / 2)
+        end_list_list.append(end_list)
+
+    duration = max((end_list[-1] for end_list in end_list_list if end_list), default=0)
+    if duration == 0:
+        return simultaneous_event.split_at(core_parameters.DirectDuration(0))
+    split_time = duration / 2
+
+    head, tail = (simultaneous_event.empty_copy() for _ in range(2))
+    for sequential_event, end_list in zip(simultaneous_event, end_list_list):
+        if not sequential_event:
+            # Same like mutwo.core: empty events are dropped.
+            continue
+        # Same like mutwo.core: both halves share one copy of the tempo
+        # envelope, so that concatenating a half doesn't change the
+        # original event.
+        if share_event:
+            empty_sequential_event = copy.deepcopy(sequential_event.empty_copy())
+            event_list = list(sequential_event)
+        else:
+            # One copy of the complete event is faster than copying
+            # each child separately.
+            empty_sequential_event = sequential_event.copy()
+            event_list = list(empty_sequential_event)
+            empty_sequential_event.clear()
+        split_event_tuple = ()
+        # Index of first event which ends at or after split time.
+        index = bisect.bisect_left(end_list, split_time)
+        if index < len(end_list) - 1 and end_list[index] == split_time:
+            # Split time is the start of an event: no event needs to be
+            # split (zero-duration events at split time belong to tail).
+            head_end = tail_start = index + 1
+        elif split_time >= end_list[-1]:
+            head_end = tail_start = len(event_list)
+        else:
+            start = end_list[index - 1] if index else 0
+            event = event_list[index]
+            split_event_tuple = (
+                event.copy() if share_event else event,
+                event.copy(),
+            )
+            split_event_tuple[0].duration = split_time - start
+            split_event_tuple[1].duration = end_list[index] - split_time
+            head_end, tail_start = index, index + 1
+        for half, half_event_list in (
+            (head, event_list[:head_end] + list(split_event_tuple[:1])),
+            (tail, list(split_event_tuple[1:]) + event_list[tail_start:]),
+        ):
+            if half_event_list:
+                half_sequential_event = empty_sequential_event.empty_copy()
+                half_sequential_event.extend(half_event_list)
+                half.append(half_sequential_event)
+    return tuple(half for half in (head, tail) if half)
+
+
+def split_simultaneous_event_sequence_in_half(
+    simultaneous_event_sequence: typing.Sequence[core_events.SimultaneousEvent],
+    share_event: bool = False,
+) -> tuple[tuple[core_events.SimultaneousEvent, ...], ...]:
+    """Split each simultaneous event at the half of its duration.
+
+    :param simultaneous_event_sequence: The simultaneous events which
+        shall be split.
+    :type simultaneous_event_sequence: typing.Sequence[core_events.SimultaneousEvent]
+    :param share_event: If ``True`` the returned events share all simple
+        events which don't need to be split with the given events. This
+        is much faster, but changing a simple event of the returned events
+        also changes it in the given events. Default to ``False``.
+    :type share_event: bool
+    :return: For each event the same tuple as
+        ``event.split_at(event.duration / 2)`` returns.
+
+    For events which only contain sequential events of simple events
+    the end times of each sequential event are only calculated once.
+    With these the position of the split time is found by bisection and
+    only the simple event at the split time is split. All other events
+    are split with :meth:`mutwo.core_events.SimultaneousEvent.split_at`.
+
+    **Example:**
+
+    >>> from mutwo import clock_utilities
+    >>> from mutwo import core_events
+    >>> s = core_events.SimultaneousEvent(
+    ...     [core_events.SequentialEvent([core_events.SimpleEvent(3)])]
+    ... )
+    >>> clock_utilities.split_simultaneous_event_sequence_in_half([s])
+    ((SimultaneousEvent([SequentialEvent([SimpleEvent(duration = DirectDuration(duration = 3/2))])]), SimultaneousEvent([SequentialEvent([SimpleEvent(duration = DirectDuration(duration = 3/2))])])),)
+    """
+    return tuple(
+        _split_simultaneous_event_in_half(simultaneous_event, share_event)
+        for simultaneous_event in simultaneous_event_sequence
+    )
+
+
+def _cut_out_child(
+    event: core_events.abc.Event, start: fractions.Fraction, end: fractions.Fraction
+) -> core_events.abc.Event:
+    if not isinstance(event, core_events.SequentialEvent) or (
+        (end_list := _get_end_list(event)) is None
+    ):
+        return event.cut_out(start, end, mutate=False)
+    # Only copy children which overlap with (or touch) the slice: the
+    # final decision is left to 'cut_out', which keeps for instance
+    # events without duration at the borders of the slice.
+    first_index = bisect.bisect_left(end_list, start)
+    offset = end_list[first_index - 1] if first_index > 0 else 0
+    child_slice = event.empty_copy()
+    for index in range(first_index, len(end_list)):
+        if index > 0 and end_list[index - 1] > end:
+            break
+        child_slice.append(list.__getitem__(event, index).copy())
+    child_slice.cut_out(start - offset, end - offset)
+    return child_slice
+
+
+def cut_out_simultaneous_event(
+    simultaneous_event: core_events.SimultaneousEvent,
+    start: core_parameters.abc.Duration | typing.Any,
+    end: core_parameters.abc.Duration | typing.Any,
+) -> core_events.SimultaneousEvent:
+    """Return a copy of the slice between `start` and `end`.
+
+    :param simultaneous_event: The event which shall be cut.
+    :type simultaneous_event: core_events.SimultaneousEvent
+    :param start: Absolute start time of the slice.
+    :type start: core_parameters.abc.Duration | typing.Any
+    :param end: Absolute end time of the slice.
+    :type end: core_parameters.abc.Duration | typing.Any
+
+    The result is equal to ``simultaneous_event.cut_out(start, end,
+    mutate=False)``, but only the simple events of the slice are copied
+    (if a child is a sequential event of simple events). This is much
+    faster if the slice is short and the event is long.
+
+    **Example:**
+
+    >>> from mutwo import clock_utilities
+    >>> from mutwo import core_events
+    >>> s = core_events.SimultaneousEvent(
+    ...     [core_events.SequentialEvent([core_events.SimpleEvent(1)] * 4)]
+    ... )
+    >>> clock_utilities.cut_out_simultaneous_event(s, 1.5, 3)
+    SimultaneousEvent([SequentialEvent([SimpleEvent(duration = DirectDuration(duration = 1/2)), SimpleEvent(duration = DirectDuration(duration = 1))])])
+    """
+    start, end = (
+        core_events.configurations.UNKNOWN_OBJECT_TO_DURATION(unknown_object).duration
+        for unknown_object in (start, end)
+    )
+    simultaneous_event_slice = simultaneous_event.empty_copy()
+    simultaneous_event_slice.extend(
+        _cut_out_child(event, start, end) for event in simultaneous_event
+    )
+    return simultaneous_event_slice
+
+
+def shallow_copy_event(event: core_events.abc.Event) -> core_events.abc.Event:
+    """Copy all complex events and tempo envelopes, but share simple events.
+
+    :param event: The event which shall be copied.
+    :type event: core_events.abc.Event
+
+    This is much cheaper than :meth:`mutwo.core_events.abc.Event.copy`.
+    The new event can be extended or concatenated without changing
+    the original event. But changing a simple event of the new event
+    changes it in the original event too. This includes cutting or
+    splitting the new event, because these methods change the duration
+    of the simple events at the borders. Call :func:`materialize_event`
+    before doing this.
+
+    **Example:**
+
+    >>> from mutwo import clock_utilities
+    >>> from mutwo import core_events
+    >>> s = core_events.SequentialEvent([core_events.SimpleEvent(1)])
+    >>> s_copy = clock_utilities.shallow_copy_event(s)
+    >>> s_copy.append(core_events.SimpleEvent(2))
+    >>> len(s), len(s_copy)
+    (1, 2)
+    >>> s[0] is s_copy[0]
+    True
+    """
+    if isinstance(event, core_events.abc.ComplexEvent):
+        copied_event = event.empty_copy()
+        # 'empty_copy' shares the tempo envelope, which is changed in place
+        # by concatenations.
+        copied_event.tempo_envelope = event.tempo_envelope.copy()
+        copied_event.extend([shallow_copy_event(child) for child in event])
+        return copied_event
+    return event
+
+
+def materialize_event(event: core_events.abc.Event) -> core_events.abc.Event:
+    """Copy event so that it doesn't share any simple event or tempo envelope.
+
+    :param event: The event which shall be copied.
+    :type event: core_events.abc.Event
+
+    Converters which share simple events (for instance
+    :class:`mutwo.clock_converters.ClockLineToSimultaneousEvent` with
+    ``share_clock_event=True`` or
+    :class:`mutwo.clock_converters.EventToSilencedEvent` with
+    ``share_event=True``) return events where the same simple event
+    can appear multiple times. In contrast to
+    :meth:`mutwo.core_events.abc.Event.copy` (where such events are still
+    the same object within the copy) each simple event of the returned
+    event is unique.
+
+    **Example:**
+
+    >>> from mutwo import clock_utilities
+    >>> from mutwo import core_events
+    >>> e = core_events.SimpleEvent(1)
+    >>> s = core_events.SequentialEvent([e, e])
+    >>> s_copy = clock_utilities.materialize_event(s)
+    >>> s_copy[0] is s_copy[1]
+    False
+    """
+    if isinstance(event, core_events.abc.ComplexEvent):
+        materialized_event = event.empty_copy()
+        materialized_event.tempo_envelope = event.tempo_envelope.copy()
+        materialized_event.extend([materialize_event(child) for child in event])
+        return materialized_event
+    return event.copy()
+
+
+def map_in_executor(
+    executor: typing.Optional[concurrent.futures.Executor],
+    function: typing.Callable,
+    *iterable: typing.Iterable,
+) -> typing.Iterator:
+    """Call `function` for each item of `iterable` in `executor`.
+
+    :param executor: The executor which calls the function. If ``None``
+        the function is called in the current thread.
+    :type executor: typing.Optional[concurrent.futures.Executor]
+    :param function: The function which shall be called.
+    :type function: typing.Callable
+    :param iterable: Arguments of the function as in :func:`map`.
+    :type iterable: typing.Iterable
+    :return: Iterator over the results, in the same order as the arguments.
+
+    All calls are submitted immediately, like in
+    :meth:`concurrent.futures.Executor.map`. A
+    :class:`concurrent.futures.ProcessPoolExecutor` needs to pickle
+    function, arguments and results. If any of them can't be pickled,
+    :class:`mutwo.clock_utilities.UnpicklableTaskError` is raised.
+    Arguments are checked before any call is submitted.
+
+    **Example:**
+
+    >>> import concurrent.futures
+    >>> from mutwo import clock_utilities
+    >>> with concurrent.futures.ThreadPoolExecutor() as executor:
+    ...     list(clock_utilities.map_in_executor(executor, abs, [-1, 2]))
+    [1, 2]
+    """
+    if executor is None:
+        return map(function, *iterable)
+    if not isinstance(executor, concurrent.futures.ProcessPoolExecutor):
+        return executor.map(function, *iterable)
+    argument_tuple_list = list(zip(*iterable))
+    executor_name = type(executor).__name__
+    try:
+        pickle.dumps((function, argument_tuple_list))
+    except (pickle.PicklingError, AttributeError, TypeError) as error:
+        raise clock_utilities.UnpicklableTaskError(executor_name, error) from error
+    return _iterate_process_result(
+        executor_name,
+        executor.map(function, *zip(*argument_tuple_list))
+        if argument_tuple_list
+        else iter(()),
+    )
+
+
+def _iterate_process_result(
+    executor_name: str, result_iterator: typing.Iterator
+) -> typing.Iterator:
+    try:
+        yield from result_iterator
+    except pickle.PicklingError as error:
+        raise clock_utilities.UnpicklableTaskError(executor_name, error) from error
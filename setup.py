@@ -9,7 +9,10 @@ VERSION = version["VERSION"]
 with open("README.md", "r", encoding="utf-8") as fh:
     long_description = fh.read()
 
-extras_require = {"testing": ["pytest>=7.1.1"]}
+extras_require = {
+    "testing": ["pytest>=7.1.1"],
+    "benchmark": ["pytest>=7.1.1", "pytest-benchmark>=4.0.0"],
+}
 
 setuptools.setup(
     name="mutwo.clock",
@@ -1,15 +1,47 @@
+import concurrent.futures
+import multiprocessing
+import subprocess
+import sys
+import tempfile
 import unittest
+from unittest import mock
 
 import abjad
+import ranges
 
 from mutwo import clock_converters
 from mutwo import clock_events
+from mutwo import clock_generators
 from mutwo import clock_interfaces
+from mutwo import clock_utilities
 from mutwo import core_events
 from mutwo import music_events
 from mutwo import timeline_interfaces
 
 
+class LazyImportTest(unittest.TestCase):
+    def test_abjad_is_not_imported(self):
+        code = (
+            "import sys; from mutwo import clock_converters; "
+            "assert 'abjad' not in sys.modules; "
+            "clock_converters.ClockToAbjadScore; "
+            "assert 'abjad' in sys.modules"
+        )
+        subprocess.run([sys.executable, "-c", code], check=True)
+
+    def test_all(self):
+        from mutwo.clock_converters import abjad as clock_converters_abjad
+
+        self.assertEqual(
+            clock_converters._ABJAD_NAME_TUPLE, clock_converters_abjad.__all__
+        )
+        for name in clock_converters_abjad.__all__:
+            self.assertIn(name, clock_converters.__all__)
+            self.assertEqual(
+                getattr(clock_converters, name), getattr(clock_converters_abjad, name)
+            )
+
+
 class ClockToAbjadScoreTest(unittest.TestCase):
     def setUp(self):
         self.tag_1 = "instr1"
@@ -169,3 +201,536 @@ class ClockToAbjadScoreTest(unittest.TestCase):
             [abjad_score_block]
         )
         abjad.persist.as_pdf(lilypond_file, "test.pdf")
+
+    def test_convert_with_time_range(self):
+        abjad_score = self.clock_to_abjad_score.convert(
+            self.clock, (self.tag_1, self.tag_2), time_range=ranges.Range(5, 30)
+        )
+        # Window covers the end of the start clock line and
+        # the first 22.5 beats of the main clock line.
+        self.assertEqual(
+            [abjad.get.duration(staff_group) for staff_group in abjad_score[0]],
+            [abjad.Duration(5, 2), abjad.Duration(45, 2)],
+        )
+        # Three event placements and three rests for 'tag_2', one cut
+        # event placement and one rest for 'tag_1'.
+        self.assertEqual(
+            [
+                [staff_group.name for staff_group in abjad_container]
+                for abjad_container in abjad_score[1:]
+            ],
+            [[self.tag_2] * 6, [self.tag_1] * 2],
+        )
+
+    def test_convert_with_process_count(self):
+        clock_to_abjad_score = clock_converters.ClockToAbjadScore(
+            self.tag_to_abjad_staff_group_converter, process_count=2
+        )
+        # Tags are appended in the order of 'ordered_tag_tuple'.
+        ordered_tag_tuple = (self.tag_2, self.tag_1)
+        self.assertEqual(
+            abjad.lilypond(
+                clock_to_abjad_score.convert(
+                    self.clock, (self.tag_1, self.tag_2), ordered_tag_tuple
+                )
+            ),
+            abjad.lilypond(
+                self.clock_to_abjad_score.convert(
+                    self.clock, (self.tag_1, self.tag_2), ordered_tag_tuple
+                )
+            ),
+        )
+
+    def test_convert_with_process_count_and_cache(self):
+        # Two equal event placements with the wrong staff count
+        event_placement_list = [
+            self.event_placement_list[0].copy().move_by(offset) for offset in (0, 2)
+        ]
+        clock = clock_interfaces.Clock(
+            clock_interfaces.ClockLine(self.clock_event, event_placement_list)
+        )
+        event_placement_to_abjad_staff_group = (
+            clock_converters.EventPlacementToAbjadStaffGroup(
+                staff_count=2, use_cache=True
+            )
+        )
+        clock_to_abjad_score = clock_converters.ClockToAbjadScore(
+            {self.tag_2: event_placement_to_abjad_staff_group},
+            clock_event_to_abjad_staff_group=None,
+            process_count=2,
+        )
+        with self.assertWarns(clock_utilities.BadStaffCountWarning):
+            clock_to_abjad_score.convert(clock, (self.tag_2,))
+        # The cache entries of the workers are merged into the main process:
+        # the event placement and the rests before and after it.
+        self.assertEqual(
+            len(event_placement_to_abjad_staff_group._fingerprint_to_abjad_staff_group),
+            3,
+        )
+
+    def test_convert_with_process_count_and_spawn(self):
+        # Without 'fork' the jobs need to be pickled, but note likes
+        # can't be pickled.
+        clock_to_abjad_score = clock_converters.ClockToAbjadScore(
+            self.tag_to_abjad_staff_group_converter, process_count=2
+        )
+        with mock.patch.object(
+            multiprocessing, "get_all_start_methods", return_value=["spawn"]
+        ):
+            with self.assertRaises(clock_utilities.UnpicklableTaskError):
+                clock_to_abjad_score.convert(self.clock, (self.tag_1, self.tag_2))
+
+    def test_convert_with_merge_rests(self):
+        def make_rest_event_placement(start, end):
+            return timeline_interfaces.EventPlacement(
+                core_events.SimultaneousEvent(
+                    [core_events.TaggedSimpleEvent(0, tag=self.tag_2)]
+                ),
+                start,
+                end,
+            )
+
+        clock = clock_interfaces.Clock(
+            clock_interfaces.ClockLine(
+                self.clock_event,
+                [
+                    make_rest_event_placement(0, 1),
+                    make_rest_event_placement(1, 3),
+                    self.event_placement_list[0].copy().move_by(3),
+                ],
+            )
+        )
+        for merge_rests, staff_group_count in ((False, 4), (True, 3)):
+            abjad_score = clock_converters.ClockToAbjadScore(
+                self.tag_to_abjad_staff_group_converter, merge_rests=merge_rests
+            ).convert(clock, (self.tag_2,))
+            # Rests, event placement and rest until the end of the clock
+            abjad_container = abjad_score[1]
+            self.assertEqual(len(abjad_container), staff_group_count)
+            self.assertEqual(
+                r"\scaleDurations 3/1" in abjad.lilypond(abjad_container[0]),
+                merge_rests,
+            )
+
+
+class EventPlacementToAbjadStaffGroupTest(unittest.TestCase):
+    def make_event_placement(self, tag, pitch="d", end=2):
+        return timeline_interfaces.EventPlacement(
+            core_events.SimultaneousEvent(
+                [
+                    core_events.TaggedSimultaneousEvent(
+                        [
+                            core_events.SequentialEvent(
+                                [
+                                    music_events.NoteLike(pitch, 1),
+                                    music_events.NoteLike("e", 0.5),
+                                ]
+                            )
+                        ],
+                        tag=tag,
+                    )
+                ]
+            ),
+            0,
+            end,
+        )
+
+    def test_convert_with_cache(self):
+        event_placement_to_abjad_staff_group = (
+            clock_converters.EventPlacementToAbjadStaffGroup(staff_count=1)
+        )
+        with tempfile.TemporaryDirectory() as cache_directory_path:
+            cached_event_placement_to_abjad_staff_group = (
+                clock_converters.EventPlacementToAbjadStaffGroup(
+                    staff_count=1,
+                    use_cache=True,
+                    cache_directory_path=cache_directory_path,
+                )
+            )
+            for tag, pitch, end in (
+                ("a", "d", 2),
+                # Equal content with other tag: staves are renamed
+                ("b", "d", 2),
+                # Different pitch or duration: no cache hit
+                ("a", "c", 2),
+                ("a", "d", 3),
+            ):
+                self.assertEqual(
+                    abjad.lilypond(
+                        cached_event_placement_to_abjad_staff_group.convert(
+                            self.make_event_placement(tag, pitch, end)
+                        )
+                    ),
+                    abjad.lilypond(
+                        event_placement_to_abjad_staff_group.convert(
+                            self.make_event_placement(tag, pitch, end)
+                        )
+                    ),
+                )
+            self.assertEqual(
+                len(
+                    cached_event_placement_to_abjad_staff_group._fingerprint_to_abjad_staff_group
+                ),
+                3,
+            )
+
+            # A new converter reads the cached staff groups from disk.
+            persistent_event_placement_to_abjad_staff_group = (
+                clock_converters.EventPlacementToAbjadStaffGroup(
+                    staff_count=1,
+                    use_cache=True,
+                    cache_directory_path=cache_directory_path,
+                )
+            )
+            persistent_event_placement_to_abjad_staff_group._convert = None
+            self.assertEqual(
+                abjad.lilypond(
+                    persistent_event_placement_to_abjad_staff_group.convert(
+                        self.make_event_placement("c")
+                    )
+                ),
+                abjad.lilypond(
+                    event_placement_to_abjad_staff_group.convert(
+                        self.make_event_placement("c")
+                    )
+                ),
+            )
+
+            # Other container converter settings: no cache hit
+            complex_event_to_abjad_container = (
+                clock_generators.make_complex_event_to_abjad_container(
+                    duration_line=True
+                )
+            )
+            self.assertEqual(
+                abjad.lilypond(
+                    clock_converters.EventPlacementToAbjadStaffGroup(
+                        complex_event_to_abjad_container,
+                        staff_count=1,
+                        use_cache=True,
+                        cache_directory_path=cache_directory_path,
+                    ).convert(self.make_event_placement("a"))
+                ),
+                abjad.lilypond(
+                    clock_converters.EventPlacementToAbjadStaffGroup(
+                        complex_event_to_abjad_container, staff_count=1
+                    ).convert(self.make_event_placement("a"))
+                ),
+            )
+
+    def test_convert_same_event_placement_with_cache(self):
+        event_placement_to_abjad_staff_group = (
+            clock_converters.EventPlacementToAbjadStaffGroup(
+                staff_count=1, use_cache=True
+            )
+        )
+        event_placement = self.make_event_placement("a")
+        abjad_staff_group = event_placement_to_abjad_staff_group.convert(
+            event_placement
+        )
+        # The event placement isn't changed by the conversion,
+        # so the second conversion is a cache hit.
+        self.assertFalse(hasattr(event_placement.event[0][0], "time_signature_tuple"))
+        event_placement_to_abjad_staff_group._convert = None
+        self.assertEqual(
+            abjad.lilypond(
+                event_placement_to_abjad_staff_group.convert(event_placement)
+            ),
+            abjad.lilypond(abjad_staff_group),
+        )
+
+    def test_convert_with_cache_and_other_version(self):
+        event_placement_to_abjad_staff_group = (
+            clock_converters.EventPlacementToAbjadStaffGroup(
+                staff_count=1, use_cache=True
+            )
+        )
+        fingerprint = event_placement_to_abjad_staff_group._get_fingerprint(
+            self.make_event_placement("a")
+        )
+        event_placement_to_abjad_staff_group._version_tuple = ("0.0.0",)
+        self.assertNotEqual(
+            event_placement_to_abjad_staff_group._get_fingerprint(
+                self.make_event_placement("a")
+            ),
+            fingerprint,
+        )
+
+
+class ClockToSimultaneousEventTest(unittest.TestCase):
+    def setUp(self):
+        def make_clock_line(duration):
+            return clock_interfaces.ClockLine(
+                clock_events.ClockEvent(
+                    [core_events.SequentialEvent([core_events.SimpleEvent(duration)])]
+                ),
+                [
+                    timeline_interfaces.EventPlacement(
+                        core_events.SimultaneousEvent(
+                            [
+                                core_events.TaggedSimultaneousEvent(
+                                    [
+                                        core_events.SequentialEvent(
+                                            [music_events.NoteLike("c", 1)]
+                                        )
+                                    ],
+                                    tag="a",
+                                )
+                            ]
+                        ),
+                        1,
+                        2,
+                    )
+                ],
+            )
+
+        self.clock = clock_interfaces.Clock(
+            make_clock_line(4), make_clock_line(3), make_clock_line(2)
+        )
+
+    def test_convert_with_tile_repetition(self):
+        for repetition_count in (1, 2, 5):
+            self.assertEqual(
+                clock_converters.ClockToSimultaneousEvent(tile_repetition=True).convert(
+                    self.clock, repetition_count
+                ),
+                clock_converters.ClockToSimultaneousEvent().convert(
+                    self.clock, repetition_count
+                ),
+            )
+
+    def test_convert_with_tile_repetition_copies_repetitions(self):
+        simultaneous_event = clock_converters.ClockToSimultaneousEvent(
+            tile_repetition=True
+        ).convert(self.clock, 5)
+        expected_simultaneous_event = (
+            clock_converters.ClockToSimultaneousEvent().convert(self.clock, 5)
+        )
+        simultaneous_event[0][0][1].set_parameter("duration", 100)
+        expected_simultaneous_event[0][0][1].set_parameter("duration", 100)
+        self.assertEqual(simultaneous_event, expected_simultaneous_event)
+
+    def test_convert_with_time_range(self):
+        clock_to_simultaneous_event = clock_converters.ClockToSimultaneousEvent()
+        for repetition_count in (1, 3):
+            simultaneous_event = clock_to_simultaneous_event.convert(
+                self.clock, repetition_count
+            )
+            for start, end in ((0, 3), (2.5, 7), (4, 30), (0, 100)):
+                simultaneous_event_slice = clock_to_simultaneous_event.convert(
+                    self.clock, repetition_count, ranges.Range(start, end)
+                )
+                # Tempo envelopes differ, so we only compare leaves.
+                expected_simultaneous_event_slice = simultaneous_event.cut_out(
+                    start, end, mutate=False
+                )
+                self.assertEqual(
+                    simultaneous_event_slice.get_parameter("duration"),
+                    expected_simultaneous_event_slice.get_parameter("duration"),
+                )
+                self.assertEqual(
+                    [getattr(event, "tag", None) for event in simultaneous_event_slice],
+                    [getattr(event, "tag", None) for event in simultaneous_event],
+                )
+
+
+class ClockLineToSimultaneousEventTest(unittest.TestCase):
+    setUp = ClockToSimultaneousEventTest.setUp
+
+    def test_convert_with_share_clock_event(self):
+        clock_line = self.clock.main_clock_line
+        simultaneous_event = clock_converters.ClockLineToSimultaneousEvent(
+            share_clock_event=True
+        ).convert(clock_line)
+        self.assertEqual(
+            simultaneous_event,
+            clock_converters.ClockLineToSimultaneousEvent().convert(clock_line),
+        )
+        self.assertIsNot(simultaneous_event[0], clock_line.clock_event)
+        self.assertIs(simultaneous_event[0][0][0], clock_line.clock_event[0][0])
+
+    def test_convert_with_share_clock_event_keeps_clock_line(self):
+        clock_line = self.clock.main_clock_line
+        clock_event = clock_line.clock_event.copy()
+        clock_line_to_simultaneous_event = (
+            clock_converters.ClockLineToSimultaneousEvent(share_clock_event=True)
+        )
+        simultaneous_event = clock_line_to_simultaneous_event.convert(clock_line)
+        simultaneous_event.concatenate_by_tag(
+            clock_line_to_simultaneous_event.convert(clock_line)
+        )
+        clock_utilities.materialize_event(simultaneous_event).cut_out(1, 2)
+        self.assertEqual(clock_line.clock_event, clock_event)
+        self.assertEqual(
+            clock_line.clock_event.tempo_envelope, clock_event.tempo_envelope
+        )
+
+
+class EventToSilencedEventTest(unittest.TestCase):
+    def setUp(self):
+        self.sequential_event = core_events.SequentialEvent(
+            [
+                core_events.SimpleEvent(1).set("tag", "a"),
+                core_events.SimpleEvent(2).set("tag", "b"),
+            ]
+        )
+
+    def test_convert(self):
+        for share_event in (False, True):
+            silenced_event = clock_converters.EventToSilencedEvent(
+                lambda event: event.tag == "b", share_event=share_event
+            ).convert(self.sequential_event)
+            self.assertEqual(
+                silenced_event,
+                core_events.SequentialEvent(
+                    [self.sequential_event[0], core_events.SimpleEvent(2)]
+                ),
+            )
+            self.assertEqual(
+                silenced_event[0] is self.sequential_event[0], share_event
+            )
+
+
+class SplitEventByTagTest(unittest.TestCase):
+    def test_convert(self):
+        event = core_events.SimultaneousEvent(
+            [
+                core_events.SequentialEvent(
+                    [
+                        core_events.SimpleEvent(1).set("tag", "a"),
+                        core_events.SimpleEvent(2).set("tag", "b"),
+                        core_events.SimpleEvent(3),
+                    ]
+                )
+            ]
+        )
+        tag_tuple = ("a", "b", "c")
+        split_event = clock_converters.SplitEventByTag(tag_tuple).convert(event)
+        self.assertEqual(len(split_event), 3)
+        for layer, tag in zip(split_event, tag_tuple):
+            self.assertEqual(layer.tag, tag)
+            self.assertEqual(
+                layer,
+                clock_converters.EventToSilencedEvent(
+                    lambda simple_event: getattr(simple_event, "tag", None) != tag
+                ).convert(event),
+            )
+
+
+class ClockToRepeatedSimultaneousEventTest(unittest.TestCase):
+    setUp = ClockToSimultaneousEventTest.setUp
+
+    def test_convert(self):
+        repeated_simultaneous_event = (
+            clock_converters.ClockToRepeatedSimultaneousEvent().convert(self.clock, 5)
+        )
+        simultaneous_event = clock_converters.ClockToSimultaneousEvent().convert(
+            self.clock, 5
+        )
+        self.assertEqual(
+            repeated_simultaneous_event.duration, simultaneous_event.duration
+        )
+        self.assertEqual(len(repeated_simultaneous_event), 7)
+        self.assertEqual(
+            [start for start, _ in repeated_simultaneous_event],
+            [0, 3, 7, 11, 15, 19, 23],
+        )
+        for start, end in ((0, 25), (4, 9), (8.5, 9), (20, 25), (22, 100)):
+            self.assertEqual(
+                # Tempo envelopes differ, so we only compare the events
+                [
+                    [list(sequential_event) for sequential_event in event]
+                    for event in repeated_simultaneous_event.cut_out(start, end)
+                ],
+                [
+                    [list(sequential_event) for sequential_event in event]
+                    for event in simultaneous_event.cut_out(
+                        start, min(end, 25), mutate=False
+                    )
+                ],
+            )
+
+
+class ClockTreeSequenceToEventTupleTest(unittest.TestCase):
+    def make_clock_tree(
+        self, random_seed: int, make_event=lambda d: music_events.NoteLike("c", d)
+    ) -> clock_generators.ClockTree:
+        clock_tree = clock_generators.ClockTree()
+        clock_tree.create_layer(
+            "root",
+            None,
+            clock_generators.PickSampleByChoice(
+                tuple(make_event(d) for d in (1, 2, 3)),
+                random_seed=random_seed,
+            ),
+            clock_generators.PickSampleByCycle(),
+        )
+        clock_tree.create_layer(
+            "leaf",
+            "root",
+            clock_generators.PickSampleByChoice(
+                tuple(make_event(d) for d in (0.25, 0.5)),
+                random_seed=random_seed,
+            ),
+            clock_generators.PickSampleByCycle(),
+            event_count_range=ranges.Range(2, 4),
+        )
+        return clock_tree
+
+    def make_expected_event_tuple(self, **kwargs):
+        return tuple(
+            clock_converters.ClockTreeToEvent().convert(
+                self.make_clock_tree(i, **kwargs), cycle_count=3
+            )
+            for i in range(4)
+        )
+
+    def test_convert(self):
+        expected_event_tuple = self.make_expected_event_tuple()
+        self.assertEqual(
+            clock_converters.ClockTreeSequenceToEventTuple().convert(
+                tuple(self.make_clock_tree(i) for i in range(4)), cycle_count=3
+            ),
+            expected_event_tuple,
+        )
+        with concurrent.futures.ThreadPoolExecutor(2) as executor:
+            event_tuple = clock_converters.ClockTreeSequenceToEventTuple(
+                executor=executor
+            ).convert(tuple(self.make_clock_tree(i) for i in range(4)), cycle_count=3)
+        self.assertEqual(event_tuple, expected_event_tuple)
+
+    def test_convert_with_process_pool(self):
+        # Process pools need picklable events.
+        make_event = core_events.SimpleEvent
+        expected_event_tuple = self.make_expected_event_tuple(make_event=make_event)
+        clock_tree_tuple = tuple(
+            self.make_clock_tree(i, make_event=make_event) for i in range(4)
+        )
+        with concurrent.futures.ProcessPoolExecutor(2) as executor:
+            event_tuple = clock_converters.ClockTreeSequenceToEventTuple(
+                executor=executor
+            ).convert(clock_tree_tuple, cycle_count=3)
+        self.assertEqual(event_tuple, expected_event_tuple)
+
+    def test_convert_with_process_pool_and_note_likes(self):
+        clock_tree_tuple = tuple(self.make_clock_tree(i) for i in range(4))
+        with concurrent.futures.ProcessPoolExecutor(2) as executor:
+            with self.assertRaises(clock_utilities.UnpicklableTaskError):
+                clock_converters.ClockTreeSequenceToEventTuple(
+                    executor=executor
+                ).convert(clock_tree_tuple, cycle_count=3)
+
+    def test_convert_with_random_seed(self):
+        with concurrent.futures.ThreadPoolExecutor(2) as executor:
+            c = clock_converters.ClockTreeSequenceToEventTuple(executor=executor)
+            event_tuple0, event_tuple1 = (
+                c.convert(
+                    tuple(self.make_clock_tree(0) for _ in range(4)),
+                    cycle_count=5,
+                    random_seed=10,
+                )
+                for _ in range(2)
+            )
+        self.assertEqual(event_tuple0, event_tuple1)
+        # Each tree has its own seed
+        self.assertNotEqual(event_tuple0[0], event_tuple0[1])
@@ -1,6 +1,12 @@
 import unittest
 
+import quicktions as fractions
+
+from mutwo import clock_converters
 from mutwo import clock_events
+from mutwo import core_events
+from mutwo import music_events
+from mutwo import music_parameters
 
 
 class ClockEventTest(unittest.TestCase):
@@ -13,3 +19,232 @@ class ClockEventTest(unittest.TestCase):
         self._test_tag()
         clock_events.configurations.DEFAULT_CLOCK_TAG = "my-clock"
         self._test_tag()
+
+    def test_get_item_by_tag(self):
+        clock_event = clock_events.ClockEvent(
+            [core_events.TaggedSequentialEvent([], tag=tag) for tag in "abc"]
+        )
+        self.assertEqual(clock_event["b"].tag, "b")
+
+        clock_event.append(core_events.TaggedSequentialEvent([], tag="d"))
+        self.assertEqual(clock_event["d"].tag, "d")
+
+        clock_event.insert(0, core_events.TaggedSequentialEvent([], tag="c"))
+        self.assertIs(clock_event["c"], clock_event[0])
+
+        del clock_event[0]
+        self.assertIs(clock_event["c"], clock_event[2])
+
+        clock_event["c"].tag = "e"
+        self.assertIs(clock_event["e"], clock_event[2])
+        self.assertRaises(KeyError, lambda: clock_event["c"])
+
+    def test_empty_copy(self):
+        clock_event = clock_events.ClockEvent(tag="my-tag")
+        self.assertEqual(clock_event.empty_copy().tag, "my-tag")
+
+    def test_duration_after_in_place_change(self):
+        clock_event = clock_events.ClockEvent(
+            [core_events.SequentialEvent([core_events.SimpleEvent(1)])]
+        )
+        self.assertEqual(clock_event.duration, 1)
+
+        clock_event[0][0].duration = 3
+        self.assertEqual(clock_event.duration, 3)
+
+        clock_event[0].set_parameter("duration", 5)
+        self.assertEqual(clock_event.duration, 5)
+
+
+class ArrayClockEventTest(unittest.TestCase):
+    def setUp(self):
+        self.clock_event = clock_events.ClockEvent(
+            [
+                core_events.TaggedSequentialEvent(
+                    [core_events.SimpleEvent(duration) for duration in (1, 0.5, 1.5)],
+                    tag="a",
+                ),
+                core_events.TaggedSequentialEvent(
+                    [core_events.SimpleEvent(duration) for duration in (2, 2)],
+                    tag="b",
+                ),
+            ]
+        )
+        self.array_clock_event = clock_converters.ClockEventToArrayClockEvent().convert(
+            self.clock_event
+        )
+        self.to_clock_event = clock_converters.ArrayClockEventToClockEvent().convert
+
+    def assertEventEqual(self, event0, event1):
+        # Tempo envelopes differ and 'ArrayClockEvent' keeps empty
+        # tracks, so we only compare the events of non-empty tracks.
+        self.assertEqual(
+            [(e.tag, list(e)) for e in event0 if e],
+            [(e.tag, list(e)) for e in event1 if e],
+        )
+
+    def test_convert(self):
+        self.assertEqual(self.array_clock_event.denominator, 2)
+        self.assertEqual(self.array_clock_event.tick_array_tuple[0].tolist(), [2, 1, 3])
+        self.assertEqual(len(self.array_clock_event.prototype_tuple), 1)
+        self.assertEqual(self.to_clock_event(self.array_clock_event), self.clock_event)
+
+    def test_duration(self):
+        self.assertEqual(self.array_clock_event.duration, self.clock_event.duration)
+
+    def test_get_event_index_tuple_at(self):
+        for absolute_time, index_tuple in (
+            (0, (0, 0)),
+            (1.25, (1, 0)),
+            (1.5, (2, 0)),
+            (3.5, (None, 1)),
+            (4, (None, None)),
+        ):
+            self.assertEqual(
+                self.array_clock_event.get_event_index_tuple_at(absolute_time),
+                index_tuple,
+            )
+
+    def test_split_at(self):
+        for absolute_time in (1.25, 2, 3.5):
+            for array_clock_event, clock_event in zip(
+                self.array_clock_event.split_at(absolute_time),
+                self.clock_event.split_at(absolute_time),
+                strict=True,
+            ):
+                self.assertEventEqual(
+                    self.to_clock_event(array_clock_event), clock_event
+                )
+
+    def test_concatenate(self):
+        other_clock_event = clock_events.ClockEvent(
+            [
+                core_events.TaggedSequentialEvent(
+                    [core_events.SimpleEvent(fractions.Fraction(1, 3))], tag="c"
+                ),
+                core_events.TaggedSequentialEvent(
+                    [core_events.SimpleEvent(fractions.Fraction(1, 3))], tag="b"
+                ),
+            ]
+        )
+        self.assertEventEqual(
+            self.to_clock_event(
+                self.array_clock_event.concatenate(
+                    clock_converters.ClockEventToArrayClockEvent().convert(
+                        other_clock_event
+                    )
+                )
+            ),
+            self.clock_event.copy().concatenate_by_tag(other_clock_event),
+        )
+
+    def test_convert_enharmonic_pitches(self):
+        pitch_name_tuple = ("cs", "df", "cs")
+        clock_event = clock_events.ClockEvent(
+            [
+                core_events.SequentialEvent(
+                    [
+                        music_events.NoteLike(pitch_name, 1)
+                        for pitch_name in pitch_name_tuple
+                    ]
+                )
+            ]
+        )
+        array_clock_event = clock_converters.ClockEventToArrayClockEvent().convert(
+            clock_event
+        )
+        self.assertEqual(len(array_clock_event.prototype_tuple), 2)
+        self.assertEqual(
+            tuple(
+                note_like.pitch_list[0].pitch_class_name
+                for note_like in self.to_clock_event(array_clock_event)[0]
+            ),
+            pitch_name_tuple,
+        )
+
+    def test_concatenate_merges_prototypes(self):
+        array_clock_event = self.array_clock_event
+        for _ in range(3):
+            array_clock_event = array_clock_event.concatenate(self.array_clock_event)
+        # The simple events of 'self.clock_event' and the rests are equal.
+        self.assertEqual(len(array_clock_event.prototype_tuple), 1)
+
+    def test_convert_note_likes(self):
+        clock_event = clock_events.ClockEvent(
+            [
+                core_events.SequentialEvent(
+                    [
+                        music_events.NoteLike(pitch, duration)
+                        for pitch, duration in (("c", 1), ("d", 1), ("c", 0.5))
+                    ]
+                )
+            ]
+        )
+        array_clock_event = clock_converters.ClockEventToArrayClockEvent().convert(
+            clock_event
+        )
+        self.assertEqual(len(array_clock_event.prototype_tuple), 2)
+        self.assertEqual(
+            list(
+                self.to_clock_event(array_clock_event.concatenate(array_clock_event))[0]
+            ),
+            list(clock_event.copy().concatenate_by_index(clock_event)[0]),
+        )
+
+
+class CompactModalEventTest(unittest.TestCase):
+    def make_scale(self):
+        return music_parameters.Scale(
+            music_parameters.WesternPitch("c"),
+            music_parameters.RepeatingScaleFamily(
+                [
+                    music_parameters.WesternPitchInterval(interval)
+                    for interval in "p1 m3 p5".split(" ")
+                ],
+                repetition_interval=music_parameters.WesternPitchInterval("p8"),
+            ),
+        )
+
+    def setUp(self):
+        self.pitch_pair = (
+            music_parameters.WesternPitch("c"),
+            music_parameters.WesternPitch("g"),
+        )
+        self.modal_event_0 = clock_events.CompactModalEvent0(
+            *self.pitch_pair, self.make_scale()
+        )
+        self.modal_event_1 = clock_events.CompactModalEvent1(
+            self.pitch_pair[0], self.make_scale()
+        )
+
+    def test_slots(self):
+        self.assertEqual(self.modal_event_0.__dict__, {})
+        self.assertEqual(self.modal_event_1.__dict__, {})
+
+    def test_shared_scale(self):
+        self.assertIs(self.modal_event_0.scale, self.modal_event_1.scale)
+        self.assertIs(self.modal_event_0.copy().scale, self.modal_event_0.scale)
+        self.assertIsNot(
+            clock_events.ModalEvent0(*self.pitch_pair, self.make_scale()).scale,
+            self.modal_event_0.scale,
+        )
+
+    def test_equal(self):
+        self.assertEqual(
+            self.modal_event_0,
+            clock_events.ModalEvent0(*self.pitch_pair, self.make_scale()),
+        )
+        self.assertEqual(self.modal_event_0.copy(), self.modal_event_0)
+
+    def test_duration(self):
+        self.assertEqual(self.modal_event_0.duration, 0)
+        # Without clock event duration can't be set
+        self.modal_event_0.duration = 2
+        self.assertEqual(self.modal_event_0.duration, 0)
+
+        self.modal_event_0.clock_event = clock_events.ClockEvent(
+            [core_events.SequentialEvent([core_events.SimpleEvent(1)])]
+        )
+        self.assertEqual(self.modal_event_0.duration, 1)
+        self.modal_event_0.duration = 2
+        self.assertEqual(self.modal_event_0.duration, 2)
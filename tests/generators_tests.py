@@ -1,9 +1,88 @@
+import random
 import unittest
 
+import ranges
 import treelib
 
 from mutwo import clock_generators
 from mutwo import core_events
+from mutwo import core_parameters
+
+
+def _reference_pop_event(clock_layer: clock_generators.ClockLayer):
+    # Implementation of 'ClockLayer.pop_event' before it tracked durations
+    # with plain numbers: durations are recomputed in each iteration.
+    clock_layer.fetch_child.refresh(clock_layer.child_tuple)
+
+    sequential_event = core_events.SequentialEvent([])
+    control_event = core_events.SimultaneousEvent(
+        [core_events.TaggedSequentialEvent([], tag=clock_layer.node.identifier)]
+    )
+    event_count = clock_layer.pick_event_count(
+        tuple(
+            range(
+                clock_layer.event_count_range.start, clock_layer.event_count_range.end
+            )
+        )
+    )
+
+    offset = core_parameters.DirectDuration(0)
+
+    for _ in range(event_count):
+        if (event := clock_layer.fetch_event()) is not None:
+            sequential_event.append(event)
+
+        if (child_node := clock_layer.fetch_child()) is not None:
+            child_clock_event, child_control_event = _reference_pop_event(
+                child_node.data
+            )
+
+            sequential_event.extend(child_clock_event)
+
+            for child_sequential_control_event in child_control_event:
+                try:
+                    control_event[child_sequential_control_event.tag].extend(
+                        child_sequential_control_event
+                    )
+                except KeyError:
+                    delay = offset + event.duration
+                    if delay > 0:
+                        child_sequential_control_event.insert(
+                            0,
+                            core_events.SimpleEvent(delay).set(
+                                clock_layer.is_active_parameter_name, False
+                            ),
+                        )
+                    control_event.append(child_sequential_control_event)
+
+        sequential_event_duration = sequential_event.duration
+
+        for child_sequential_control_event in control_event[1:]:
+            difference = (
+                sequential_event_duration - child_sequential_control_event.duration
+            )
+            if difference > 0:
+                child_sequential_control_event.append(
+                    core_events.SimpleEvent(difference).set(
+                        clock_layer.is_active_parameter_name, False
+                    )
+                )
+
+        cycle_duration = sequential_event_duration - offset
+        control_simple_event = core_events.SimpleEvent(cycle_duration).set(
+            clock_layer.is_active_parameter_name, True
+        )
+
+        control_event[0].append(control_simple_event)
+
+        offset = sequential_event_duration
+
+    control_event.tie_by(
+        lambda event0, event1: (not event0.is_active) and (not event1.is_active),
+        event_type_to_examine=core_events.SimpleEvent,
+    )
+
+    return sequential_event, control_event
 
 
 class PickSampleTest(unittest.TestCase):
@@ -56,6 +135,13 @@ class PickSampleByChoiceTest(PickSampleTest):
     def get_pick_sample_test_class(self):
         return clock_generators.PickSampleByChoice
 
+    def test_seed(self):
+        self.pick_sample.seed(10)
+        pick_list0 = [self.pick_sample() for _ in range(10)]
+        self.pick_sample.seed(10)
+        pick_list1 = [self.pick_sample() for _ in range(10)]
+        self.assertEqual(pick_list0, pick_list1)
+
 
 class ClockTreeTest(unittest.TestCase):
     def setUp(self):
@@ -152,3 +238,76 @@ class ClockLayerTest(unittest.TestCase):
                 ),
             ),
         )
+
+    def make_clock_tree(self, random_seed: int) -> clock_generators.ClockTree:
+        random_ = random.Random(random_seed)
+
+        def pick_event_count(event_count_tuple):
+            return random_.choice(event_count_tuple)
+
+        def make_fetch_event(*duration):
+            return clock_generators.PickSampleByChoice(
+                tuple(map(core_events.SimpleEvent, duration))
+            )
+
+        clock_tree = clock_generators.ClockTree()
+        clock_tree.create_layer(
+            "root",
+            None,
+            make_fetch_event(3, 4, 5.5),
+            clock_generators.PickSampleByChoice(),
+            ranges.Range(1, 6),
+            pick_event_count,
+        )
+        clock_tree.create_layer(
+            "a",
+            "root",
+            make_fetch_event(1, 2),
+            clock_generators.PickSampleByChoice(),
+            ranges.Range(1, 4),
+            pick_event_count,
+        )
+        clock_tree.create_layer(
+            "a0",
+            "a",
+            make_fetch_event(0.25, 0.5),
+            clock_generators.PickSampleByCycle(),
+            ranges.Range(1, 5),
+            pick_event_count,
+        )
+        # Single event layer
+        clock_tree.create_layer(
+            "b", "root", make_fetch_event(0.75), clock_generators.PickSampleByCycle()
+        )
+        # Empty layers: without events and without event count
+        clock_tree.create_layer(
+            "c", "root", make_fetch_event(), clock_generators.PickSampleByCycle()
+        )
+        clock_tree.create_layer(
+            "d",
+            "root",
+            make_fetch_event(1),
+            clock_generators.PickSampleByCycle(),
+            ranges.Range(0, 1),
+        )
+        clock_tree.seed(random_seed)
+        return clock_tree
+
+    def test_pop_event_equals_reference(self):
+        for random_seed in range(10):
+            clock_tree, reference_clock_tree = (
+                self.make_clock_tree(random_seed) for _ in range(2)
+            )
+            for identifier in ("root", "a", "b", "c", "d"):
+                for _ in range(3):
+                    clock_event, control_event = clock_tree[identifier].data.pop_event()
+                    (
+                        reference_clock_event,
+                        reference_control_event,
+                    ) = _reference_pop_event(reference_clock_tree[identifier].data)
+                    self.assertEqual(clock_event, reference_clock_event)
+                    self.assertEqual(control_event, reference_control_event)
+                    self.assertEqual(
+                        [event.tag for event in control_event],
+                        [event.tag for event in reference_control_event],
+                    )
@@ -1,7 +1,11 @@
+import random
 import unittest
+from unittest import mock
 
 from mutwo import clock_events
 from mutwo import clock_interfaces
+from mutwo import core_events
+from mutwo import timeline_interfaces
 
 
 class ClockLineTest(unittest.TestCase):
@@ -10,3 +14,92 @@ class ClockLineTest(unittest.TestCase):
 
     def test_is(self):
         self.assertTrue(self.clock_line)
+
+    def test_get_event_placement_tuple_at(self):
+        random.seed(10)
+        for _ in range(40):
+            start = random.randint(0, 100)
+            self.clock_line.register(
+                timeline_interfaces.EventPlacement(
+                    core_events.SimultaneousEvent(
+                        [core_events.TaggedSimultaneousEvent([], tag="a")]
+                    ),
+                    start,
+                    start + random.randint(1, 20),
+                )
+            )
+        for absolute_time in range(-1, 122):
+            self.assertEqual(
+                set(
+                    map(id, self.clock_line.get_event_placement_tuple_at(absolute_time))
+                ),
+                set(
+                    id(event_placement)
+                    for event_placement in self.clock_line.event_placement_tuple
+                    if event_placement.min_start
+                    <= absolute_time
+                    < event_placement.max_end
+                ),
+            )
+        for start, end in ((0, 10), (50.5, 52), (119, 200)):
+            self.assertEqual(
+                set(
+                    map(
+                        id,
+                        self.clock_line.get_event_placement_tuple_in_range(start, end),
+                    )
+                ),
+                set(
+                    id(event_placement)
+                    for event_placement in self.clock_line.event_placement_tuple
+                    if event_placement.min_start < end
+                    and event_placement.max_end > start
+                ),
+            )
+
+    def test_get_event_placement_tuple_at_after_register(self):
+        self.assertEqual(self.clock_line.get_event_placement_tuple_at(1), ())
+        event_placement = timeline_interfaces.EventPlacement(
+            core_events.SimultaneousEvent(
+                [core_events.TaggedSimultaneousEvent([], tag="a")]
+            ),
+            0,
+            2,
+        )
+        self.clock_line.register(event_placement)
+        self.assertEqual(
+            self.clock_line.get_event_placement_tuple_at(1), (event_placement,)
+        )
+        self.assertEqual(self.clock_line.get_event_placement_tuple_at(2), ())
+        self.clock_line.unregister(event_placement)
+        self.assertEqual(self.clock_line.get_event_placement_tuple_at(1), ())
+
+    def test_duration(self):
+        clock_event = clock_events.ClockEvent(
+            [core_events.SequentialEvent([core_events.SimpleEvent(2)])]
+        )
+        clock_line = clock_interfaces.ClockLine(clock_event)
+        clock = clock_interfaces.Clock(clock_line, clock_line)
+        with mock.patch.object(
+            clock_events.ClockEvent,
+            "duration",
+            new_callable=mock.PropertyMock,
+            side_effect=lambda: core_events.SimultaneousEvent.duration.fget(
+                clock_event
+            ),
+        ) as duration:
+            for _ in range(3):
+                self.assertEqual(clock_line.duration, 2)
+                self.assertEqual(clock.duration, 4)
+            # The duration of the clock event is only computed once.
+            self.assertEqual(duration.call_count, 1)
+
+        clock_event[0][0].duration = 3
+        self.assertEqual(clock.duration, 4)
+        clock.invalidate_duration()
+        self.assertEqual(clock_line.duration, 3)
+        self.assertEqual(clock.duration, 6)
+
+        # The returned duration is a copy of the cached duration.
+        clock_line.duration.duration = 10
+        self.assertEqual(clock_line.duration, 3)
@@ -1,3 +1,6 @@
+import concurrent.futures
+import time
+
 import ranges
 import pytest
 
@@ -5,6 +8,7 @@ from mutwo import clock_converters
 from mutwo import clock_events
 from mutwo import clock_generators
 from mutwo import clock_interfaces
+from mutwo import clock_utilities
 from mutwo import core_events
 from mutwo import music_events
 from mutwo import music_parameters
@@ -108,6 +112,143 @@ def _apply_clock_tree_on_modal_event(
     ).convert(modal_sequential_event)
 
 
+class CountingModalEvent0ToClockTree(SimpleModalEvent0ToClockTree):
+    def __init__(self):
+        self.call_count = 0
+
+    def convert(self, *args, **kwargs):
+        self.call_count += 1
+        return super().convert(*args, **kwargs)
+
+
+def test_apply_clock_tree_on_modal_event_with_cache(
+    modal_sequential_event: core_events.SequentialEvent[clock_events.ModalEvent],
+):
+    modal_sequential_event.extend(list(modal_sequential_event))
+    modal_event_0_to_clock_tree = CountingModalEvent0ToClockTree()
+    converter = clock_converters.ApplyClockTreeOnModalEvent0(
+        modal_event_0_to_clock_tree, use_cache=True
+    )
+    modal_sequential_event_with_clock_tree = converter.convert(modal_sequential_event)
+    assert modal_sequential_event_with_clock_tree == _apply_clock_tree_on_modal_event(
+        modal_sequential_event
+    )
+    # Each modal event is contained twice
+    assert modal_event_0_to_clock_tree.call_count == 3
+    # Modal events don't share their events
+    assert (
+        modal_sequential_event_with_clock_tree[0].clock_event[0][0]
+        is not modal_sequential_event_with_clock_tree[-3].clock_event[0][0]
+    )
+
+
+def test_apply_clock_tree_on_modal_event_with_cache_and_equal_scales(scale):
+    def make_modal_event_0():
+        # Equal, but not identical pitches and scales
+        return clock_events.ModalEvent0(
+            music_parameters.WesternPitch("c"),
+            music_parameters.WesternPitch("g"),
+            music_parameters.Scale(scale.tonic, scale.scale_family),
+        )
+
+    modal_sequential_event = core_events.SequentialEvent(
+        [make_modal_event_0() for _ in range(3)]
+    )
+    modal_event_0_to_clock_tree = CountingModalEvent0ToClockTree()
+    clock_converters.ApplyClockTreeOnModalEvent0(
+        modal_event_0_to_clock_tree, use_cache=True
+    ).convert(modal_sequential_event)
+    assert modal_event_0_to_clock_tree.call_count == 1
+
+
+def test_apply_clock_tree_on_compact_modal_event_with_cache(scale):
+    pitch_pair_tuple = (("c", "g"), ("g", "c"), ("c", "g"))
+    modal_sequential_event = core_events.SequentialEvent(
+        [
+            clock_events.CompactModalEvent0(
+                music_parameters.WesternPitch(start_pitch),
+                music_parameters.WesternPitch(end_pitch),
+                scale,
+            )
+            for start_pitch, end_pitch in pitch_pair_tuple
+        ]
+    )
+    modal_event_0_to_clock_tree = CountingModalEvent0ToClockTree()
+    clock_converters.ApplyClockTreeOnModalEvent0(
+        modal_event_0_to_clock_tree, use_cache=True
+    ).convert(modal_sequential_event)
+    # Slots are part of the signature: only the last event is cached.
+    assert modal_event_0_to_clock_tree.call_count == 2
+
+
+class RandomModalEvent0ToClockTree(clock_converters.ModalEvent0ToClockTree):
+    def convert(self, _: clock_events.ModalEvent0) -> clock_generators.ClockTree:
+        clock_tree = clock_generators.ClockTree()
+        clock_tree.create_layer(
+            "root",
+            None,
+            clock_generators.PickSampleByChoice(
+                tuple(core_events.SimpleEvent(duration) for duration in (1, 2, 3))
+            ),
+            clock_generators.PickSampleByCycle(),
+            event_count_range=ranges.Range(4, 5),
+        )
+        return clock_tree
+
+
+@pytest.mark.parametrize(
+    "executor_class",
+    (concurrent.futures.ThreadPoolExecutor, concurrent.futures.ProcessPoolExecutor),
+)
+def test_apply_clock_tree_on_modal_event_with_executor(executor_class):
+    # Process pools need picklable modal events and clock trees,
+    # so we use integers instead of pitches and no scale.
+    modal_sequential_event = core_events.SequentialEvent(
+        [clock_events.ModalEvent0(index, index + 1, None) for index in range(8)]
+    )
+    modal_sequential_event.insert(2, core_events.SimpleEvent(3))
+
+    def convert(**kwargs):
+        return clock_converters.ApplyClockTreeOnModalEvent0(
+            RandomModalEvent0ToClockTree(), random_seed=10, **kwargs
+        ).convert(modal_sequential_event)
+
+    with executor_class(max_workers=4) as executor:
+        modal_sequential_event_with_clock_tree = convert(executor=executor)
+    assert modal_sequential_event_with_clock_tree == convert()
+    assert [
+        getattr(event, "start_pitch", None)
+        for event in modal_sequential_event_with_clock_tree
+    ] == [0, 1, None, 2, 3, 4, 5, 6, 7]
+    # Each modal event has its own seed
+    duration_tuple_set = set(
+        tuple(e.duration.duration for e in event.clock_event[0])
+        for event in modal_sequential_event_with_clock_tree
+        if isinstance(event, clock_events.ModalEvent)
+    )
+    assert len(duration_tuple_set) > 1
+
+
+def test_apply_clock_tree_on_modal_event_with_thread_pool(
+    modal_sequential_event: core_events.SequentialEvent[clock_events.ModalEvent],
+):
+    # Music events with scales and pitches can't be pickled,
+    # so only thread pools work with real modal events.
+    def convert(**kwargs):
+        return clock_converters.ApplyClockTreeOnModalEvent0(
+            SimpleModalEvent0ToClockTree(), random_seed=10, **kwargs
+        ).convert(modal_sequential_event)
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
+        modal_sequential_event_with_clock_tree = convert(executor=executor)
+    assert modal_sequential_event_with_clock_tree == convert()
+    assert all(
+        isinstance(event.clock_event, clock_events.ClockEvent)
+        for event in modal_sequential_event_with_clock_tree
+        if isinstance(event, clock_events.ModalEvent)
+    )
+
+
 @pytest.fixture
 def modal_sequential_event_with_clock_tree(
     modal_sequential_event: core_events.SequentialEvent[clock_events.ModalEvent],
@@ -147,6 +288,14 @@ def test_modal_sequential_event_to_clock_event(
     assert clock_event.duration == modal_sequential_event_with_clock_tree.duration
 
 
+def test_empty_modal_sequential_event_to_clock_event():
+    clock_event = clock_converters.Modal0SequentialEventToClockEvent().convert(
+        core_events.SequentialEvent([])
+    )
+    assert isinstance(clock_event, clock_events.ClockEvent)
+    assert not clock_event
+
+
 def test_modal_sequential_event_to_event_placement_tuple(
     modal_sequential_event_with_clock_tree: core_events.SequentialEvent[
         clock_events.ModalEvent
@@ -184,6 +333,52 @@ def test_modal_sequential_event_to_clock_line(
     assert violin_event_placement.event[0].tag == "violin"
 
 
+class SleepingModal0SequentialEventToEventPlacementTuple(
+    SimpleModal0SequentialEventToEventPlacementTuple
+):
+    """Dummy converter which returns after a given time"""
+
+    def __init__(self, tag: str, sleep_time: float):
+        self.tag, self.sleep_time = tag, sleep_time
+
+    def convert(self, *args, **kwargs):
+        time.sleep(self.sleep_time)
+        event_placement_tuple = super().convert(*args, **kwargs)
+        event_placement_tuple[0].event[0].tag = self.tag
+        return event_placement_tuple
+
+
+def test_modal_sequential_event_to_clock_line_with_executor(
+    modal_sequential_event_with_clock_tree: core_events.SequentialEvent[
+        clock_events.ModalEvent0
+    ],
+):
+    # Later makers finish earlier. Real modal events and event
+    # placements can't be pickled, so we use a thread pool.
+    maker_tuple = tuple(
+        SleepingModal0SequentialEventToEventPlacementTuple(tag, sleep_time)
+        for tag, sleep_time in (("a", 0.03), ("b", 0.02), ("c", 0.01), ("d", 0))
+    )
+    with concurrent.futures.ThreadPoolExecutor(max_workers=4) as executor:
+        clock_line = clock_converters.Modal0SequentialEventToClockLine(
+            maker_tuple[:2], maker_tuple[2:], executor=executor
+        ).convert(modal_sequential_event_with_clock_tree)
+    assert [
+        event_placement.event[0].tag
+        for event_placement in clock_line.event_placement_tuple
+    ] == ["a", "b", "c", "d"]
+    serial_clock_line = clock_converters.Modal0SequentialEventToClockLine(
+        maker_tuple[:2], maker_tuple[2:]
+    ).convert(modal_sequential_event_with_clock_tree)
+    assert clock_line.clock_event == serial_clock_line.clock_event
+    assert [
+        event_placement.event for event_placement in clock_line.event_placement_tuple
+    ] == [
+        event_placement.event
+        for event_placement in serial_clock_line.event_placement_tuple
+    ]
+
+
 def test_Modal0SequentialEventToModal1SequentialEventTest(
     # Schwierig das so zu testen, weil es ein event mit pausen gibt und
     # eins ohne pausen..
@@ -191,4 +386,61 @@ def test_Modal0SequentialEventToModal1SequentialEventTest(
         clock_events.ModalEvent0
     ],
 ):
-    pass
+    m0seq = modal_sequential_event_with_clock_tree
+    m1seq = clock_converters.Modal0SequentialEventToModal1SequentialEvent().convert(
+        m0seq
+    )
+    assert m1seq.duration == m0seq.duration
+    assert isinstance(m1seq[0], clock_events.ModalEvent1)
+    assert m1seq[0].pitch == m0seq[0].start_pitch
+    assert m1seq[-1].duration == m0seq[-1].duration / 2
+    assert (
+        clock_converters.Modal0SequentialEventToModal1SequentialEvent(
+            share_event=True
+        ).convert(m0seq)
+        == m1seq
+    )
+
+
+def test_Modal0EventIterableToModal1EventIterator(
+    modal_sequential_event_with_clock_tree: core_events.SequentialEvent[
+        clock_events.ModalEvent0
+    ],
+):
+    m0seq = modal_sequential_event_with_clock_tree
+    m1_event_iterator = clock_converters.Modal0EventIterableToModal1EventIterator()
+    m1seq = clock_converters.Modal0SequentialEventToModal1SequentialEvent().convert(
+        m0seq
+    )
+    # Works with any iterable, e.g. with a generator
+    assert list(m1_event_iterator.convert(m0_ev for m0_ev in m0seq)) == list(m1seq)
+    # Only the current modal event is consumed
+    m0_ev_iterator = iter(m0seq)
+    next(m1_event_iterator.convert(m0_ev_iterator))
+    assert len(list(m0_ev_iterator)) == len(m0seq) - 1
+    assert list(m1_event_iterator.convert([])) == []
+
+
+def test_apply_clock_tree_on_modal_event_with_process_pool(
+    modal_sequential_event: core_events.SequentialEvent[clock_events.ModalEvent],
+):
+    # Scales and pitches can't be pickled, so process pools
+    # have to fail with a clear error instead of a pickling error.
+    with concurrent.futures.ProcessPoolExecutor(max_workers=2) as executor:
+        with pytest.raises(clock_utilities.UnpicklableTaskError):
+            clock_converters.ApplyClockTreeOnModalEvent0(
+                SimpleModalEvent0ToClockTree(), executor=executor
+            ).convert(modal_sequential_event)
+
+
+def test_modal_sequential_event_to_clock_line_with_process_pool(
+    modal_sequential_event_with_clock_tree: core_events.SequentialEvent[
+        clock_events.ModalEvent0
+    ],
+):
+    with concurrent.futures.ProcessPoolExecutor(max_workers=2) as executor:
+        with pytest.raises(clock_utilities.UnpicklableTaskError):
+            clock_converters.Modal0SequentialEventToClockLine(
+                (SimpleModal0SequentialEventToEventPlacementTuple(),),
+                executor=executor,
+            ).convert(modal_sequential_event_with_clock_tree)
@@ -0,0 +1,96 @@
+import unittest
+
+from mutwo import clock_parameters
+from mutwo import music_parameters
+
+
+class ScaleIntersectionTest(unittest.TestCase):
+    def setUp(self):
+        self.cache_size = clock_parameters.configurations.SCALE_INTERSECTION_CACHE_SIZE
+
+    def tearDown(self):
+        clock_parameters.configurations.SCALE_INTERSECTION_CACHE_SIZE = self.cache_size
+
+    def make_scale(self, tonic: str, interval_sequence: str) -> music_parameters.Scale:
+        return music_parameters.Scale(
+            music_parameters.WesternPitch(tonic),
+            music_parameters.RepeatingScaleFamily(
+                [
+                    music_parameters.WesternPitchInterval(interval)
+                    for interval in interval_sequence.split(" ")
+                ],
+                repetition_interval=music_parameters.WesternPitchInterval("p8"),
+            ),
+        )
+
+    def test_scale_family_intersection(self):
+        scale_family = music_parameters.ScaleFamily(
+            [music_parameters.DirectPitchInterval(cents) for cents in (0, 200, 700)]
+        )
+        other_scale_family = music_parameters.ScaleFamily(
+            [
+                music_parameters.WesternPitchInterval(interval)
+                for interval in ("p1", "p5")
+            ]
+        )
+        self.assertEqual(
+            scale_family.intersection(other_scale_family).interval_tuple,
+            (
+                music_parameters.DirectPitchInterval(0),
+                music_parameters.DirectPitchInterval(700),
+            ),
+        )
+
+    def test_scale_intersection(self):
+        scale = self.make_scale("c", "p1 M2 M3 p5 M6")
+        other_scale = self.make_scale("g", "p1 M2 M3 p5 M6")
+        intersection = scale.intersection(other_scale)
+        self.assertEqual(
+            intersection.pitch_tuple,
+            tuple(p for p in scale.pitch_tuple if p in other_scale.pitch_tuple),
+        )
+        self.assertEqual(intersection.tonic, scale.tonic)
+
+    def test_scale_intersection_cache(self):
+        scale_pair = (self.make_scale("c", "p1 m3 p5"), self.make_scale("c", "p1 p5"))
+        intersection = scale_pair[0].intersection(scale_pair[1])
+        # Equal scale pairs share a cache entry, but each call
+        # returns its own scale.
+        cached_intersection = self.make_scale("c", "p1 m3 p5").intersection(
+            scale_pair[1]
+        )
+        self.assertEqual(cached_intersection, intersection)
+        self.assertIsNot(cached_intersection, intersection)
+
+        # Changing a returned scale doesn't change later results.
+        intersection.tonic = music_parameters.WesternPitch("d")
+        self.assertEqual(
+            scale_pair[0].intersection(scale_pair[1]).tonic,
+            music_parameters.WesternPitch("c"),
+        )
+
+        clock_parameters.configurations.SCALE_INTERSECTION_CACHE_SIZE = 0
+        self.assertEqual(scale_pair[0].intersection(scale_pair[1]), cached_intersection)
+
+    def test_intern_scale(self):
+        original_scale = self.make_scale("c", "p1 m3 p5")
+        scale = clock_parameters.intern_scale(original_scale)
+        self.assertIs(
+            clock_parameters.intern_scale(self.make_scale("c", "p1 m3 p5")), scale
+        )
+        self.assertIsNot(
+            clock_parameters.intern_scale(self.make_scale("d", "p1 m3 p5")), scale
+        )
+        self.assertIs(clock_parameters.intern_scale(scale), scale)
+
+        # Interned scales are read-only copies.
+        self.assertIsNot(scale, original_scale)
+        self.assertEqual(scale, original_scale)
+        with self.assertRaises(AttributeError):
+            scale.tonic = music_parameters.WesternPitch("d")
+        original_scale.tonic = music_parameters.WesternPitch("d")
+        self.assertEqual(scale.tonic, music_parameters.WesternPitch("c"))
+        self.assertEqual(
+            scale.intersection(self.make_scale("c", "p1 p5")).pitch_tuple,
+            self.make_scale("c", "p1 p5").pitch_tuple,
+        )
@@ -0,0 +1,319 @@
+import concurrent.futures
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+
+from mutwo import clock_converters
+from mutwo import clock_events
+from mutwo import clock_utilities
+from mutwo import core_events
+from mutwo import core_utilities
+from mutwo import music_events
+
+
+def _make_note_like(duration):
+    return music_events.NoteLike("c", duration)
+
+
+class MapInExecutorTest(unittest.TestCase):
+    def test_map_in_executor(self):
+        for executor_class in (
+            concurrent.futures.ThreadPoolExecutor,
+            concurrent.futures.ProcessPoolExecutor,
+        ):
+            with executor_class(2) as executor:
+                self.assertEqual(
+                    list(
+                        clock_utilities.map_in_executor(executor, pow, (1, 2), (2, 3))
+                    ),
+                    [1, 8],
+                )
+        self.assertEqual(list(clock_utilities.map_in_executor(None, abs, (-1,))), [1])
+
+    def test_map_in_executor_with_unpicklable_task(self):
+        note_like = music_events.NoteLike("c", 1)
+        with concurrent.futures.ProcessPoolExecutor(2) as executor:
+            # Unpicklable arguments
+            with self.assertRaises(clock_utilities.UnpicklableTaskError):
+                clock_utilities.map_in_executor(executor, repr, (note_like,))
+            # Unpicklable results
+            with self.assertRaises(clock_utilities.UnpicklableTaskError):
+                list(clock_utilities.map_in_executor(executor, _make_note_like, (1,)))
+        # Thread pools don't need to pickle anything
+        with concurrent.futures.ThreadPoolExecutor(2) as executor:
+            self.assertEqual(
+                list(clock_utilities.map_in_executor(executor, repr, (note_like,))),
+                [repr(note_like)],
+            )
+
+
+class ProfilerTest(unittest.TestCase):
+    def setUp(self):
+        self.clock_event = clock_events.ClockEvent(
+            [core_events.SequentialEvent([core_events.SimpleEvent(1)])]
+        )
+        self.converter = clock_converters.ClockEventToAbjadStaffGroup()
+
+    def test_hooks(self):
+        original_convert = clock_converters.ClockEventToAbjadStaffGroup.convert
+        with clock_utilities.Profiler(trace_memory=False) as profiler:
+            self.assertNotEqual(
+                clock_converters.ClockEventToAbjadStaffGroup.convert,
+                original_convert,
+            )
+        self.assertEqual(
+            clock_converters.ClockEventToAbjadStaffGroup.convert, original_convert
+        )
+        self.assertEqual(profiler.name_to_call_statistic, {})
+
+    def test_abjad_is_not_imported(self):
+        code = (
+            "import sys; from mutwo import clock_utilities; "
+            "profiler = clock_utilities.Profiler(trace_memory=False); "
+            "profiler.__enter__(); profiler.__exit__(); "
+            "assert 'abjad' not in sys.modules"
+        )
+        subprocess.run([sys.executable, "-c", code], check=True)
+
+    def test_lazily_loaded_converter(self):
+        code = "\n".join(
+            (
+                "from mutwo import clock_converters, clock_events, clock_utilities",
+                "with clock_utilities.Profiler(trace_memory=False) as profiler:",
+                "    clock_converters.ClockEventToAbjadStaffGroup().convert(",
+                "        clock_events.ClockEvent(), False",
+                "    )",
+                "call_statistic = profiler.name_to_call_statistic[",
+                "    'ClockEventToAbjadStaffGroup.convert'",
+                "]",
+                "assert call_statistic.call_count == 1",
+                # The original method is restored.
+                "assert not hasattr(",
+                "    clock_converters.ClockEventToAbjadStaffGroup.convert,",
+                "    '__wrapped__',",
+                ")",
+            )
+        )
+        subprocess.run([sys.executable, "-c", code], check=True)
+
+    def test_call_statistic(self):
+        with clock_utilities.Profiler() as profiler:
+            self.converter.convert(self.clock_event, False)
+            self.converter.convert(self.clock_event, False)
+        # Calls which happen outside of the context aren't counted.
+        self.converter.convert(self.clock_event, False)
+        call_statistic = profiler.name_to_call_statistic[
+            "ClockEventToAbjadStaffGroup.convert"
+        ]
+        self.assertEqual(call_statistic.call_count, 2)
+        self.assertGreater(call_statistic.wall_time, 0)
+        self.assertIn("ClockEventToAbjadStaffGroup.convert", profiler.report())
+
+    def test_export(self):
+        with clock_utilities.Profiler(trace_memory=False) as profiler:
+            self.converter.convert(self.clock_event, False)
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "profile.json")
+            profiler.export(path)
+            with open(path) as f:
+                data = json.load(f)
+        self.assertEqual(data["ClockEventToAbjadStaffGroup.convert"]["call_count"], 1)
+        self.assertEqual(
+            data["ClockEventToAbjadStaffGroup.convert"]["allocated_memory"], 0
+        )
+
+
+class ConcatenateSimultaneousEventSequenceTest(unittest.TestCase):
+    @staticmethod
+    def concatenate(simultaneous_event_sequence):
+        simultaneous_event = core_events.SimultaneousEvent()
+        for other_simultaneous_event in simultaneous_event_sequence:
+            other_simultaneous_event = other_simultaneous_event.copy()
+            try:
+                simultaneous_event.concatenate_by_tag(other_simultaneous_event)
+            except core_utilities.NoTagError:
+                simultaneous_event.concatenate_by_index(other_simultaneous_event)
+        return simultaneous_event
+
+    def test_by_tag(self):
+        s0 = core_events.SimultaneousEvent(
+            [
+                core_events.TaggedSequentialEvent(
+                    [core_events.SimpleEvent(1), core_events.SimpleEvent(2)], tag="a"
+                ),
+                core_events.TaggedSequentialEvent(
+                    [core_events.SimpleEvent(1)], tag="b"
+                ),
+            ]
+        )
+        s1 = core_events.SimultaneousEvent(
+            [
+                core_events.TaggedSequentialEvent(
+                    [core_events.SimpleEvent(2)], tag="c"
+                ),
+                core_events.TaggedSequentialEvent(
+                    [core_events.SimpleEvent(3)], tag="b"
+                ),
+            ]
+        )
+        s1[1].tempo_envelope = core_events.TempoEnvelope([[0, 60], [10, 30]])
+        simultaneous_event_sequence = (s0, s1, s0, s1)
+        self.assertEqual(
+            clock_utilities.concatenate_simultaneous_event_sequence(
+                simultaneous_event_sequence
+            ),
+            self.concatenate(simultaneous_event_sequence),
+        )
+        # Given events aren't changed
+        self.assertEqual(s0[0].duration, 3)
+
+    def test_by_index(self):
+        s0 = core_events.SimultaneousEvent(
+            [
+                core_events.SimultaneousEvent(
+                    [core_events.SequentialEvent([core_events.SimpleEvent(2)])]
+                )
+            ]
+        )
+        s1 = core_events.SimultaneousEvent(
+            [
+                core_events.SimultaneousEvent(
+                    [
+                        core_events.SequentialEvent([core_events.SimpleEvent(1)]),
+                        core_events.SequentialEvent([core_events.SimpleEvent(3)]),
+                    ]
+                ),
+                core_events.SequentialEvent([core_events.SimpleEvent(1)]),
+            ]
+        )
+        simultaneous_event_sequence = (s0, s1, s1, s0)
+        self.assertEqual(
+            clock_utilities.concatenate_simultaneous_event_sequence(
+                simultaneous_event_sequence
+            ),
+            self.concatenate(simultaneous_event_sequence),
+        )
+
+    def test_empty(self):
+        self.assertEqual(
+            clock_utilities.concatenate_simultaneous_event_sequence([]),
+            core_events.SimultaneousEvent([]),
+        )
+
+
+class SplitSimultaneousEventSequenceInHalfTest(unittest.TestCase):
+    def setUp(self):
+        self.simultaneous_event_tuple = (
+            # Split time is inside of an event
+            core_events.SimultaneousEvent(
+                [
+                    core_events.TaggedSequentialEvent(
+                        [core_events.SimpleEvent(1), core_events.SimpleEvent(2)],
+                        tag="a",
+                    ),
+                    core_events.TaggedSequentialEvent(
+                        [core_events.SimpleEvent(0.5)], tag="b"
+                    ),
+                    core_events.TaggedSequentialEvent([], tag="c"),
+                ]
+            ),
+            # Split time is between events & zero-duration events
+            core_events.SimultaneousEvent(
+                [
+                    core_events.SequentialEvent(
+                        [core_events.SimpleEvent(duration) for duration in (1, 0, 1)]
+                    ),
+                    core_events.SequentialEvent(
+                        [core_events.SimpleEvent(duration) for duration in (1, 0)]
+                    ),
+                ]
+            ),
+            # Nested event
+            core_events.SimultaneousEvent(
+                [
+                    core_events.SimultaneousEvent(
+                        [core_events.SequentialEvent([core_events.SimpleEvent(2)])]
+                    )
+                ]
+            ),
+            core_events.SimultaneousEvent([]),
+        )
+
+    def test_split(self):
+        for share_event in (False, True):
+            self.assertEqual(
+                clock_utilities.split_simultaneous_event_sequence_in_half(
+                    self.simultaneous_event_tuple, share_event
+                ),
+                tuple(
+                    simultaneous_event.split_at(simultaneous_event.duration / 2)
+                    for simultaneous_event in self.simultaneous_event_tuple
+                ),
+            )
+
+    def test_share_event(self):
+        simultaneous_event = self.simultaneous_event_tuple[0]
+        for share_event in (False, True):
+            head, tail = clock_utilities.split_simultaneous_event_sequence_in_half(
+                [simultaneous_event], share_event
+            )[0]
+            self.assertEqual(head[0][0] is simultaneous_event[0][0], share_event)
+            # Split events are always copied
+            self.assertIsNot(tail[0][0], simultaneous_event[0][1])
+            self.assertIsNot(
+                head[0].tempo_envelope, simultaneous_event[0].tempo_envelope
+            )
+        # Given events aren't changed
+        self.assertEqual(simultaneous_event[0].duration, 3)
+
+
+class MaterializeEventTest(unittest.TestCase):
+    def test_materialize_event(self):
+        simple_event = core_events.SimpleEvent(1)
+        simultaneous_event = core_events.SimultaneousEvent(
+            [core_events.SequentialEvent([simple_event, simple_event])]
+        )
+        materialized_event = clock_utilities.materialize_event(simultaneous_event)
+        self.assertEqual(materialized_event, simultaneous_event)
+        self.assertIsNot(materialized_event[0][0], materialized_event[0][1])
+        self.assertIsNot(materialized_event[0][0], simple_event)
+        self.assertIsNot(
+            materialized_event[0].tempo_envelope, simultaneous_event[0].tempo_envelope
+        )
+
+    def test_shallow_copy_event(self):
+        simultaneous_event = core_events.SimultaneousEvent(
+            [core_events.SequentialEvent([core_events.SimpleEvent(1)])]
+        )
+        copied_event = clock_utilities.shallow_copy_event(simultaneous_event)
+        self.assertEqual(copied_event, simultaneous_event)
+        self.assertIsNot(copied_event[0], simultaneous_event[0])
+        self.assertIs(copied_event[0][0], simultaneous_event[0][0])
+
+
+class CutOutSimultaneousEventTest(unittest.TestCase):
+    def test_cut_out_simultaneous_event(self):
+        simultaneous_event = core_events.SimultaneousEvent(
+            [
+                core_events.SequentialEvent(
+                    [core_events.SimpleEvent(duration) for duration in (1, 0, 2, 1)]
+                ),
+                core_events.SimpleEvent(3),
+                core_events.SequentialEvent([]),
+            ]
+        )
+        for start, end in ((0, 1), (0.5, 2), (1, 3), (2, 10)):
+            simultaneous_event_slice = clock_utilities.cut_out_simultaneous_event(
+                simultaneous_event, start, end
+            )
+            self.assertEqual(
+                simultaneous_event_slice.get_parameter("duration"),
+                simultaneous_event.cut_out(start, end, mutate=False).get_parameter(
+                    "duration"
+                ),
+            )
+        # Only the slice is copied, the given event isn't changed
+        self.assertEqual(simultaneous_event[0][2].duration, 2)